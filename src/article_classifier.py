@@ -3,16 +3,65 @@ Article Classification Module
 Uses Groq AI to classify articles into categories
 """
 
-import os
+import re
 import json
-import yaml
-from pathlib import Path
-from typing import Dict, List, Optional
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import logging
-from groq import Groq
+from groq import APIConnectionError, InternalServerError, RateLimitError
+
+from classification_cache import ClassificationCache, prompt_version
+from config import AppConfig, load_config
+from dedup import MinHasher, UnionFind
+from fast_classifier import REJECTED, FastClassifier
+from models import Article, Classification
+from prefilter import REASON_PREFIX, KeywordPrefilter
+from rule_engine import RuleEngine
+from utils import TokenBucketLimiter, create_groq_client
 
 logger = logging.getLogger(__name__)
 
+# Lines of the per-article template that carry the article itself; the batch
+# prompt lists articles separately and keeps everything else verbatim
+ARTICLE_FIELD_LINE = re.compile(r'^.*\{(?:title|summary|source|date)\}.*\n?', re.MULTILINE)
+SINGLE_ARTICLE_CLOSING = 'Now classify the article above.'
+
+# "HEADER:" lines that split the template into sections; batch mode drops
+# the single-article task and response schema, which BATCH_TASK replaces
+SECTION_HEADER = re.compile(r'^([A-Z][A-Z ]+):[ \t]*$', re.MULTILINE)
+SINGLE_ARTICLE_SECTIONS = ('TASK', 'RESPONSE FORMAT')
+# Example answers ("-> {...}") in the single-article JSON shape
+EXAMPLE_ANSWER = re.compile(r'^-> (\{.*\})[ \t]*$', re.MULTILINE)
+
+BATCH_TASK = """
+BATCH MODE:
+Below are {count} articles, each with a numeric id. Classify every article
+independently using the rules above, exactly as if it were the only one.
+
+Respond ONLY with valid JSON in this format:
+{{"results": [{{"id": 1, "relevant": true/false, "category": "...", "tier": 1/2/null, "confidence": 0.0-1.0, "reason": "...", "key_signals": ["..."]}}]}}
+Return exactly one result per article id.
+
+ARTICLES:
+{articles}
+"""
+
+# Output tokens budgeted per article in a batch response
+BATCH_TOKENS_PER_ARTICLE = 250
+
+CLASSIFY_MODEL = "llama-3.3-70b-versatile"
+FAST_MODEL = "llama-3.1-8b-instant"
+
+# Classification.model of verdicts made by the local fast-path model
+FAST_PATH_MODEL = "fast-path"
+FAST_PATH_PREFIX = "Fast path:"
+
+# Retries for rate-limited or failed Groq requests
+MAX_RETRIES = 3
+
 
 class ArticleClassifier:
     """Classifies articles using AI and category rules"""
@@ -20,48 +69,210 @@ class ArticleClassifier:
     def __init__(
         self,
         groq_api_key: Optional[str] = None,
-        categories_file: str = "../config/categories.yaml",
-        prompt_file: str = "../config/classification_prompt.txt"
+        config: Optional[AppConfig] = None
     ):
         """Initialize classifier"""
-        api_key = groq_api_key or os.getenv('GROQ_API_KEY')
-        if not api_key:
-            raise ValueError("GROQ_API_KEY must be provided or set in environment")
+        # Retries are handled in _complete so a 429 pauses every worker
+        self.groq = create_groq_client(groq_api_key, max_retries=0)
+        self.config = config or load_config()
+        self.categories = self.config.categories
+        self.prompt_template = self.config.classification_prompt
+        self.batch_size = max(self.config.classification.batch_size, 1)
+        self.max_workers = max(self.config.classification.max_concurrent_requests, 1)
+        self.limiters = {
+            model: TokenBucketLimiter(limit.requests_per_minute, limit.tokens_per_minute)
+            for model, limit in self.config.classification.rate_limits.items()
+        }
+        self.prefilter = (
+            KeywordPrefilter(self.config) if self.config.classification.prefilter else None
+        )
+        self.rules = RuleEngine(self.config)
+        # Minimum confidence to land in each tier
+        self.tier_thresholds = {
+            1: self.config.scoring.get('tier_1_threshold', 0.7),
+            2: self.config.scoring.get('tier_2_threshold', 0.6),
+        }
+        self.fast_path = self._load_fast_path()
+        self.minhasher = MinHasher(self.config.dedup.lsh_bands, self.config.dedup.lsh_rows)
+        cache = self.config.classification_cache
+        self.cache = (
+            ClassificationCache(
+                cache.path, prompt_version(self.config), cache.ttl_days, cache.max_entries
+            ) if cache.enabled else None
+        )
+        self.batch_instructions = self._batch_instructions(self.prompt_template)
         
-        self.groq = Groq(api_key=api_key)
-        self.categories = self._load_categories(categories_file)
-        self.prompt_template = self._load_prompt(prompt_file)
+        # Per-model request/token/latency totals (reported by classify_batch)
+        self.usage = defaultdict(lambda: {'requests': 0, 'tokens': 0, 'seconds': 0.0})
+        self._usage_lock = threading.Lock()
     
-    def _load_categories(self, filepath: str) -> Dict:
-        """Load category definitions"""
+    def _load_fast_path(self) -> Optional[FastClassifier]:
+        """Load the trained fast-path model if enabled and present"""
+        settings = self.config.classification.fast_path
+        if not settings.enabled:
+            return None
+        if not settings.model_path or not settings.model_path.exists():
+            logger.info(
+                f"ℹ️  Fast path disabled: no model at {settings.model_path} "
+                f"(run train_fast_classifier.py)"
+            )
+            return None
         try:
-            with open(filepath, 'r') as f:
-                return yaml.safe_load(f)
-        except Exception as e:
-            logger.error(f"Error loading categories: {e}")
-            return {}
+            model = FastClassifier.load(settings.model_path)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"⚠️  Fast path disabled: could not load {settings.model_path}: {e}")
+            return None
+        logger.info(
+            f"⚡ Fast path model loaded ({model.metadata.get('examples', '?')} examples, "
+            f"trained {model.metadata.get('trained_at', 'unknown')[:10]})"
+        )
+        return model
     
-    def _load_prompt(self, filepath: str) -> str:
-        """Load classification prompt template"""
+    def _complete(self, **request):
+        """
+        Groq chat completion within the model's rate limits
+        
+        Waits for request and token budget before sending. On a 429 the
+        retry-after delay pauses every caller sharing the model's limiter;
+        transient server and connection errors are retried with backoff.
+        """
+        model = request['model']
+        limiter = self.limiters.get(model)
+        prompt_chars = sum(len(m['content']) for m in request['messages'])
+        estimate = prompt_chars // 4 + request.get('max_tokens', 0)
+        
+        for attempt in range(MAX_RETRIES + 1):
+            if limiter:
+                limiter.acquire(estimate)
+            started = time.monotonic()
+            try:
+                response = self.groq.chat.completions.create(**request)
+            except (RateLimitError, InternalServerError, APIConnectionError) as e:
+                if attempt == MAX_RETRIES:
+                    raise
+                wait = 2 ** attempt
+                if isinstance(e, RateLimitError):
+                    try:
+                        wait = float(e.response.headers.get('retry-after', wait))
+                    except ValueError:
+                        pass
+                    logger.warning(f"⏳ Rate limited on {model}, retrying in {wait:.1f}s")
+                    if limiter:
+                        limiter.pause(wait)
+                        continue
+                time.sleep(wait)
+                continue
+            
+            usage = getattr(response, 'usage', None)
+            tokens = usage.total_tokens if usage is not None else estimate
+            if limiter:
+                limiter.settle(estimate, tokens)
+            with self._usage_lock:
+                totals = self.usage[model]
+                totals['requests'] += 1
+                totals['tokens'] += tokens
+                totals['seconds'] += time.monotonic() - started
+            return response
+    
+    def _batch_instructions(self, template: str) -> str:
+        """
+        Shared part of the classification prompt for batch requests
+
+        Keeps context, categories, examples and guidelines, but drops the
+        article fields and the single-article TASK and RESPONSE FORMAT
+        sections so BATCH_TASK is the only response schema. Example
+        answers are restated as plain verdicts for the same reason.
+        """
+        # re.split with one group: [preamble, header, body, header, body, ...]
+        parts = SECTION_HEADER.split(template)
+        shared = parts[0] + ''.join(
+            f"{header}:{body}"
+            for header, body in zip(parts[1::2], parts[2::2])
+            if header not in SINGLE_ARTICLE_SECTIONS
+        )
+        shared = ARTICLE_FIELD_LINE.sub('', shared)
+        shared = shared.replace(SINGLE_ARTICLE_CLOSING, '')
+        # The template escapes literal braces for str.format
+        shared = shared.replace('{{', '{').replace('}}', '}')
+        shared = EXAMPLE_ANSWER.sub(self._example_verdict, shared)
+        return re.sub(r'\n{3,}', '\n\n', shared).rstrip()
+
+    @staticmethod
+    def _example_verdict(match: re.Match) -> str:
+        """An example's JSON answer as a plain-text verdict"""
         try:
-            with open(filepath, 'r') as f:
-                return f.read()
-        except Exception as e:
-            logger.error(f"Error loading prompt: {e}")
-            return ""
+            verdict = json.loads(match.group(1))
+        except ValueError:
+            return match.group(0)
+        if not verdict.get('relevant'):
+            return f"-> not relevant, confidence {verdict.get('confidence')} ({verdict.get('reason', '')})"
+        return (
+            f"-> relevant, {verdict.get('category')}, tier {verdict.get('tier')}, "
+            f"confidence {verdict.get('confidence')} ({verdict.get('reason', '')})"
+        )
+    
+    def _source_label(self, article: Article) -> str:
+        """Source name shown to the model"""
+        return article.source_name or article.source or 'Unknown'
+    
+    def _build_result(
+        self,
+        verdict: Dict,
+        article: Article,
+        model: str = CLASSIFY_MODEL,
+        cache: bool = True,
+        rules: bool = True
+    ) -> Classification:
+        """
+        Turn a raw model verdict into a Classification
+        
+        Rules are applied unless rules=False, in which case the caller
+        runs them over the whole batch with RuleEngine.apply_batch.
+        """
+        # Normalize keys — ensure expected fields exist with defaults
+        result = Classification(
+            article=article,
+            relevant=verdict.get('relevant', False),
+            category=verdict.get('category'),
+            tier=verdict.get('tier'),
+            confidence=float(verdict.get('confidence', 0)),
+            reason=verdict.get('reason', ''),
+            key_signals=verdict.get('key_signals', []),
+            model=model,
+        )
+
+        if rules:
+            self.rules.apply(result)
+        
+        # Raw verdicts are cached so rule changes still apply on a hit
+        if cache and self.cache:
+            self.cache.put(article, model, verdict)
+        
+        logger.debug(
+            f"Classified '{article.title[:50]}...' as "
+            f"{result.category or 'rejected'} "
+            f"(confidence: {result.confidence:.2f})"
+        )
+        
+        return result
     
-    def classify(self, article: Dict) -> Dict:
-        """Classify a single article"""
+    def classify(
+        self,
+        article: Article,
+        model: str = CLASSIFY_MODEL,
+        rules: bool = True
+    ) -> Classification:
+        """Classify a single article (rules=False returns the raw model verdict)"""
         prompt = self.prompt_template.format(
-            title=article.get('title', ''),
-            summary=article.get('summary', ''),
-            source=article.get('source_name', article.get('source', 'Unknown')),
-            date=article.get('published', '')
+            title=article.title,
+            summary=article.summary,
+            source=self._source_label(article),
+            date=article.published
         )
         
         try:
-            response = self.groq.chat.completions.create(
-                model="llama-3.3-70b-versatile",
+            response = self._complete(
+                model=model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.1,
                 response_format={"type": "json_object"},
@@ -69,28 +280,7 @@ class ArticleClassifier:
             )
             
             raw = response.choices[0].message.content
-            result = json.loads(raw)
-
-            # Normalize keys — ensure expected fields exist with defaults
-            result = {
-                'relevant': result.get('relevant', False),
-                'category': result.get('category'),
-                'tier': result.get('tier'),
-                'confidence': float(result.get('confidence', 0)),
-                'reason': result.get('reason', ''),
-                'key_signals': result.get('key_signals', []),
-                'article': article
-            }
-
-            result = self._apply_rules(result, article)
-            
-            logger.debug(
-                f"Classified '{article['title'][:50]}...' as "
-                f"{result.get('category', 'rejected')} "
-                f"(confidence: {result.get('confidence', 0):.2f})"
-            )
-            
-            return result
+            return self._build_result(json.loads(raw), article, model, rules=rules)
             
         except json.JSONDecodeError as e:
             logger.error(f"Error parsing JSON response: {e}")
@@ -99,50 +289,135 @@ class ArticleClassifier:
             logger.error(f"Error classifying article: {e}")
             return self._error_result(article, str(e))
     
-    def _apply_rules(self, result: Dict, article: Dict) -> Dict:
-        """Apply rule-based enhancements to AI classification"""
-        if result.get('category') == 'enterprise_strategy':
-            text = article.get('title', '') + ' ' + article.get('summary', '')
-            money = self._extract_money_amount(text)
+    def classify_many(
+        self,
+        articles: List[Article],
+        model: str = CLASSIFY_MODEL,
+        rules: bool = True
+    ) -> List[Classification]:
+        """
+        Classify several articles with a single request
+        
+        The shared prompt is sent once for the whole batch. Verdicts that
+        are missing or malformed are retried: in halves if the whole batch
+        failed, otherwise as a smaller batch of just the failed articles.
+        If the request itself fails (after _complete's retries), every
+        article gets an error result instead. A single article always goes
+        through classify().
+        
+        Args:
+            articles: Articles to classify
+            model: Groq model to classify with
+            rules: Apply the category rules (False leaves raw model verdicts)
             
-            if money:
-                min_amount = 50000000  # $50M
-                if money < min_amount:
-                    result['relevant'] = False
-                    result['confidence'] = max(result['confidence'] - 0.3, 0)
-                    result['reason'] += f" (Funding ${money:,} below threshold)"
+        Returns:
+            Classifications in the same order as the input
+        """
+        if not articles:
+            return []
+        if len(articles) == 1:
+            return [self.classify(articles[0], model, rules)]
         
-        return result
+        verdicts = self._request_batch(articles, model)
+        if verdicts is None:
+            return [self._error_result(article, "batch request failed") for article in articles]
+        
+        results: List[Optional[Classification]] = [None] * len(articles)
+        for i, article in enumerate(articles):
+            verdict = verdicts.get(i + 1)
+            if verdict is None:
+                continue
+            try:
+                results[i] = self._build_result(verdict, article, model, rules=False)
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Malformed verdict for '{article.title[:50]}...': {e}")
+        if rules:
+            self.rules.apply_batch([result for result in results if result is not None])
+        
+        failed = [i for i, result in enumerate(results) if result is None]
+        if failed:
+            if len(failed) == len(articles):
+                middle = len(articles) // 2
+                retried = (
+                    self.classify_many(articles[:middle], model, rules) +
+                    self.classify_many(articles[middle:], model, rules)
+                )
+            else:
+                logger.debug(f"Retrying {len(failed)} of {len(articles)} batch verdicts")
+                retried = self.classify_many([articles[i] for i in failed], model, rules)
+            for i, result in zip(failed, retried):
+                results[i] = result
+        
+        return results
     
-    def _extract_money_amount(self, text: str) -> Optional[int]:
-        """Extract dollar amounts from text"""
-        import re
-        patterns = [
-            (r'\$(\d+(?:\.\d+)?)\s*billion', 1_000_000_000),
-            (r'\$(\d+(?:\.\d+)?)\s*million', 1_000_000),
-            (r'\$(\d+(?:\.\d+)?)B', 1_000_000_000),
-            (r'\$(\d+(?:\.\d+)?)M', 1_000_000),
-        ]
+    def _request_batch(self, articles: List[Article], model: str) -> Optional[Dict[int, Dict]]:
+        """
+        Send one batched classification request
         
-        for pattern, multiplier in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return int(float(match.group(1)) * multiplier)
-        return None
+        Returns:
+            Raw verdicts keyed by 1-based article id (empty if the response
+            was unusable), or None if the request failed
+        """
+        listing = "\n\n".join(
+            f"[id {i}]\n"
+            f"Title: {article.title}\n"
+            f"Summary: {article.summary}\n"
+            f"Source: {self._source_label(article)}\n"
+            f"Date: {article.published}"
+            for i, article in enumerate(articles, 1)
+        )
+        prompt = self.batch_instructions + BATCH_TASK.format(
+            count=len(articles),
+            articles=listing
+        )
+        
+        try:
+            response = self._complete(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.1,
+                response_format={"type": "json_object"},
+                max_tokens=BATCH_TOKENS_PER_ARTICLE * len(articles)
+            )
+        except Exception as e:
+            logger.warning(f"Batch classification of {len(articles)} articles failed: {e}")
+            return None
+        
+        try:
+            raw = response.choices[0].message.content
+            entries = json.loads(raw).get('results')
+        except Exception as e:
+            logger.warning(f"Unusable batch classification response: {e}")
+            return {}
+        
+        if not isinstance(entries, list):
+            logger.warning("Batch classification response has no results list")
+            return {}
+        
+        verdicts = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            article_id = entry.get('id')
+            if (
+                isinstance(article_id, int)
+                and 1 <= article_id <= len(articles)
+                and article_id not in verdicts
+                and 'relevant' in entry
+            ):
+                verdicts[article_id] = entry
+        
+        return verdicts
     
-    def _error_result(self, article: Dict, error: str) -> Dict:
+    def _error_result(self, article: Article, error: str) -> Classification:
         """Create error result"""
-        return {
-            'relevant': False,
-            'category': None,
-            'tier': None,
-            'confidence': 0,
-            'reason': f'Classification error: {error}',
-            'key_signals': [],
-            'article': article
-        }
+        return Classification(
+            article=article,
+            reason=f'Classification error: {error}',
+            error=True
+        )
     
-    def _is_duplicate(self, title1: str, title2: str, threshold: float = 0.8) -> bool:
+    def is_duplicate(self, title1: str, title2: str, threshold: float = 0.8) -> bool:
         """Check if two articles are about the same news event using Groq"""
         prompt = (
             "Are these two article titles about the same news event?\n\n"
@@ -159,8 +434,8 @@ class ArticleClassifier:
         )
 
         try:
-            response = self.groq.chat.completions.create(
-                model="llama-3.1-8b-instant",
+            response = self._complete(
+                model=FAST_MODEL,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.1,
                 response_format={"type": "json_object"},
@@ -185,57 +460,156 @@ class ArticleClassifier:
             logger.warning(f"Duplicate check failed, treating as unique: {e}")
             return False
 
+    def _adjudicate_cluster(
+        self,
+        titles: List[str],
+        threshold: float = 0.8
+    ) -> Optional[List[List[int]]]:
+        """
+        Split a set of related titles into same-event groups with one request
+
+        Args:
+            titles: Titles of a candidate cluster
+            threshold: Minimum confidence for a group to count
+
+        Returns:
+            Confident groups of 2+ titles as 0-based indices, or None if the
+            response was unusable (caller should fall back to pairwise checks)
+        """
+        listing = "\n".join(f"{i}. {title}" for i, title in enumerate(titles, 1))
+        prompt = (
+            "Group these article titles by the news event they report on.\n\n"
+            f"{listing}\n\n"
+            "Titles are about the same event if they're reporting on the same:\n"
+            "- Product launch/announcement\n"
+            "- Funding round/acquisition\n"
+            "- Partnership/deal\n"
+            "- Research release\n\n"
+            "Every title number must appear in exactly one group; a title about "
+            "its own event is a group of one.\n\n"
+            "Respond ONLY with JSON:\n"
+            '{"groups": [{"ids": [1, 3], "confidence": 0.0-1.0}, '
+            '{"ids": [2], "confidence": 1.0}]}'
+        )
+
+        try:
+            response = self._complete(
+                model=FAST_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.1,
+                response_format={"type": "json_object"},
+                max_tokens=50 + 25 * len(titles)
+            )
+
+            raw = response.choices[0].message.content
+            groups = json.loads(raw).get('groups')
+
+            if not isinstance(groups, list):
+                raise ValueError("no groups list")
+
+            confident = []
+            assigned = set()
+            for group in groups:
+                ids = group.get('ids') if isinstance(group, dict) else None
+                if (
+                    not isinstance(ids, list) or not ids
+                    or not all(isinstance(i, int) and 1 <= i <= len(titles) for i in ids)
+                    or assigned.intersection(ids)
+                ):
+                    raise ValueError(f"invalid group {group!r}")
+                assigned.update(ids)
+                if len(ids) > 1 and float(group.get('confidence', 0)) >= threshold:
+                    confident.append([i - 1 for i in ids])
+            return confident
+
+        except Exception as e:
+            logger.warning(f"Cluster duplicate check failed, checking pairs instead: {e}")
+            return None
+
     def detect_duplicates(
         self,
-        tier1_articles: List[Dict],
+        tier1_articles: List[Classification],
         source_priority: Dict[str, int],
         threshold: float = 0.8
-    ) -> List[List[Dict]]:
-        """Detect duplicate articles and group them together"""
+    ) -> List[List[Classification]]:
+        """
+        Detect duplicate articles and group them together
+
+        Only articles that share a MinHash LSH band are sent to the LLM.
+        The best-connected article and its still-unjudged candidates (up to
+        dedup.max_cluster_size titles) are judged in a single request, and
+        so on until no neighborhood has 3+ titles left; any remaining
+        candidate pairs are checked one by one. Confirmed duplicates are
+        merged transitively (A~B and B~C puts A, B and C together).
+        """
         if not tier1_articles:
             return []
 
-        groups = []
-        processed = set()
-
         logger.info(f"\n🔍 Checking {len(tier1_articles)} articles for duplicates...")
+        candidates = self.minhasher.candidate_pairs([item.article for item in tier1_articles])
 
-        for i, article1 in enumerate(tier1_articles):
-            if i in processed:
-                continue
-
-            group = [article1]
-
-            for j, article2 in enumerate(tier1_articles[i + 1:], i + 1):
-                if j in processed:
-                    continue
+        # Candidate neighborhoods, not connected components: LSH candidate
+        # chains link unrelated stories into components far too big to judge
+        neighbors = defaultdict(set)
+        for i, j in candidates:
+            neighbors[i].add(j)
+            neighbors[j].add(i)
+        unjudged = set(candidates)
 
-                title1 = article1['article'].get('title', '')
-                title2 = article2['article'].get('title', '')
+        clusters = UnionFind(len(tier1_articles))
+        checks = 0
+        max_size = self.config.dedup.max_cluster_size
+        for center in sorted(neighbors, key=lambda i: (-len(neighbors[i]), i)):
+            pending = sorted(
+                j for j in neighbors[center] if (min(center, j), max(center, j)) in unjudged
+            )
+            members = [center] + pending[:max_size - 1]
+            if len(members) < 3:
+                continue
 
-                if self._is_duplicate(title1, title2, threshold):
-                    group.append(article2)
-                    processed.add(j)
+            checks += 1
+            titles = [tier1_articles[i].article.title for i in members]
+            groups = self._adjudicate_cluster(titles, threshold)
+            if groups is None:
+                continue
+            for group in groups:
+                for k in group[1:]:
+                    clusters.union(members[group[0]], members[k])
+            # Every candidate pair inside the request has been judged
+            unjudged.difference_update(
+                (i, j) for i in members for j in members if (i, j) in unjudged
+            )
 
-            groups.append(group)
+        for i, j in sorted(unjudged):
+            # Already in one cluster: a verdict could not change the result
+            if clusters.connected(i, j):
+                continue
+            checks += 1
+            title1 = tier1_articles[i].article.title
+            title2 = tier1_articles[j].article.title
+            if self.is_duplicate(title1, title2, threshold):
+                clusters.union(i, j)
 
         # Select primary for each group and log results
         result_groups = []
-        for group in groups:
-            # Sort by source priority (lower = better), then by summary length (longer = better)
+        for indices in clusters.groups():
+            group = [tier1_articles[i] for i in indices]
+            # Sort by source priority (lower = better), then by summary length
+            # (longer = better); URL breaks ties so the primary is order-independent
             group.sort(key=lambda x: (
-                source_priority.get(x['article'].get('source', ''), 999),
-                -len(x['article'].get('summary', ''))
+                source_priority.get(x.article.source, 999),
+                -len(x.article.summary),
+                x.article.url
             ))
             result_groups.append(group)
 
             if len(group) > 1:
-                primary = group[0]['article']
-                dup_titles = [g['article']['title'][:50] for g in group[1:]]
+                primary = group[0].article
+                dup_titles = [g.article.title[:50] for g in group[1:]]
                 logger.info(
                     f"   🔗 Found {len(group)} duplicates: "
-                    f"Primary: '{primary['title'][:50]}...' "
-                    f"({primary.get('source', 'unknown')})"
+                    f"Primary: '{primary.title[:50]}...' "
+                    f"({primary.source or 'unknown'})"
                 )
                 for title in dup_titles:
                     logger.info(f"      ↳ Duplicate: '{title}...'")
@@ -245,41 +619,51 @@ class ArticleClassifier:
         logger.info(f"\n📊 Duplicate Detection Results:")
         logger.info(f"   Unique articles: {unique_count}")
         logger.info(f"   Merged groups: {merged_count}")
-        logger.info(f"   Total articles after merging: {len(result_groups)}\n")
+        logger.info(f"   Total articles after merging: {len(result_groups)}")
+        logger.info(f"   LLM duplicate checks: {checks}\n")
 
         return result_groups
 
-    def classify_batch(self, articles: List[Dict]) -> Dict[str, List[Dict]]:
-        """Classify multiple articles and sort into tiers"""
+    def classify_batch(self, articles: Iterable[Article]) -> Dict[str, List[Classification]]:
+        """
+        Classify multiple articles and sort into tiers
+
+        Accepts any iterable, including a generator that is still
+        discovering articles; articles are classified as soon as a full
+        batch (classification.batch_size) has arrived. Up to
+        classification.max_concurrent_requests batches are in flight at
+        once, and results are reported in input order.
+        """
         results = {
             'tier1': [],
             'tier2': [],
             'rejected': []
         }
         
-        logger.info(f"\n🤖 Classifying {len(articles)} articles...")
+        total = len(articles) if hasattr(articles, '__len__') else None
+        if total is not None:
+            logger.info(f"\n🤖 Classifying {total} articles...")
+        else:
+            logger.info(f"\n🤖 Classifying articles as they are discovered...")
         
-        for i, article in enumerate(articles, 1):
-            logger.info(f"   [{i}/{len(articles)}] {article['title'][:60]}...")
-            
-            classification = self.classify(article)
-
-            relevant = classification.get('relevant', False)
-            tier = classification.get('tier')
-            confidence = classification.get('confidence', 0)
-            category = classification.get('category', 'unknown')
-
-            if not relevant:
-                results['rejected'].append(classification)
-            elif tier == 1 and confidence >= 0.7:
-                results['tier1'].append(classification)
-                logger.info(f"      ✅ Tier 1: {category} ({confidence:.2f})")
-            elif tier == 2 and confidence >= 0.6:
-                results['tier2'].append(classification)
-                logger.info(f"      ⚠️  Tier 2: {category} ({confidence:.2f})")
-            else:
-                results['rejected'].append(classification)
-                logger.info(f"      ❌ Rejected ({confidence:.2f})")
+        for i, classification in enumerate(self._classify_stream(articles), 1):
+            progress = f"{i}/{total}" if total is not None else f"{i}"
+            logger.info(f"   [{progress}] {classification.article.title[:60]}...")
+            self._route(classification, results)
+        
+        if self.prefilter:
+            prefiltered = sum(
+                1 for c in results['rejected'] if c.reason.startswith(REASON_PREFIX)
+            )
+            logger.info(f"\n🚫 Prefilter rejected {prefiltered} articles without an LLM call")
+        
+        if self.cache:
+            stats = self.cache.stats()
+            logger.info(
+                f"💾 Classification cache: {stats['hits']} hits, {stats['misses']} misses"
+            )
+        
+        self._log_usage(results)
         
         logger.info(f"\n📊 Classification Results:")
         logger.info(f"   ✅ Tier 1 (auto-process): {len(results['tier1'])}")
@@ -287,3 +671,210 @@ class ArticleClassifier:
         logger.info(f"   ❌ Rejected: {len(results['rejected'])}\n")
         
         return results
+
+    def _classify_stream(self, articles: Iterable[Article]) -> Iterator[Classification]:
+        """Classify batches concurrently, yielding results in input order"""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = deque()
+            for group in self._batches(articles):
+                pending.append(executor.submit(self._classify_group, group))
+                # Hand back finished batches in order; stay at most one round ahead
+                while pending and (pending[0].done() or len(pending) > self.max_workers):
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    def _batches(
+        self,
+        articles: Iterable[Article]
+    ) -> Iterator[List[Tuple[Article, Optional[Classification]]]]:
+        """
+        Group a (possibly streaming) iterable into classification batches
+
+        Each article is paired with its prefilter rejection (or None).
+        A batch is full once it holds batch_size articles for the LLM.
+        """
+        group = []
+        plausible = 0
+        for article in articles:
+            rejection = self.prefilter.check(article) if self.prefilter else None
+            group.append((article, rejection))
+            if rejection is None:
+                plausible += 1
+            if plausible >= self.batch_size:
+                yield group
+                group, plausible = [], 0
+        if group:
+            yield group
+
+    def _classify_group(
+        self,
+        group: List[Tuple[Article, Optional[Classification]]]
+    ) -> List[Classification]:
+        """Classify a batch's plausible articles, keeping input order"""
+        results = [rejection for _, rejection in group]
+        plausible = [i for i, (_, rejection) in enumerate(group) if rejection is None]
+        articles = [group[i][0] for i in plausible]
+        
+        classified: List[Optional[Classification]] = [
+            self._fast_path_result(article) for article in articles
+        ]
+        remaining = [k for k, c in enumerate(classified) if c is None]
+        llm = self._classify_llm([articles[k] for k in remaining])
+        for k, classification in zip(remaining, llm):
+            classified[k] = classification
+        
+        for i, classification in zip(plausible, classified):
+            results[i] = classification
+        return results
+
+    def _classify_llm(self, articles: List[Article]) -> List[Classification]:
+        """
+        Classify with the model cascade (or the strong model alone)
+
+        Escalation is decided on the fast model's raw verdicts; the rules
+        only run on the ones that are kept, so a confident verdict the rules
+        demote is not re-asked of the strong model.
+        """
+        if self.config.classification.cascade:
+            classified = self._classify_with(FAST_MODEL, articles, rules=False)
+            escalate = [k for k, c in enumerate(classified) if self._needs_escalation(c)]
+            kept = set(range(len(classified))).difference(escalate)
+            self.rules.apply_batch([classified[k] for k in sorted(kept)])
+            stronger = self._classify_with(CLASSIFY_MODEL, [articles[k] for k in escalate])
+            for k, classification in zip(escalate, stronger):
+                classified[k] = classification
+        else:
+            classified = self._classify_with(CLASSIFY_MODEL, articles)
+        return classified
+
+    def _fast_path_result(self, article: Article) -> Optional[Classification]:
+        """
+        Local model verdict if it is confident enough, else None
+
+        Categories no longer in categories.yaml always go to the LLM.
+        """
+        if not self.fast_path:
+            return None
+        
+        settings = self.config.classification.fast_path
+        label, probability = self.fast_path.predict(article)
+        
+        if label == REJECTED:
+            if probability < settings.reject_threshold:
+                return None
+            verdict = {
+                'relevant': False,
+                'confidence': 1 - probability,
+                'reason': f"{FAST_PATH_PREFIX} rejected (p={probability:.2f})",
+            }
+        else:
+            rule = self.categories.get(label)
+            if rule is None or probability < settings.accept_threshold:
+                return None
+            verdict = {
+                'relevant': True,
+                'category': label,
+                'tier': rule.tier,
+                'confidence': probability,
+                'reason': f"{FAST_PATH_PREFIX} {label} (p={probability:.2f})",
+            }
+        return self._build_result(verdict, article, FAST_PATH_MODEL, cache=False)
+
+    def _classify_with(
+        self,
+        model: str,
+        articles: List[Article],
+        rules: bool = True
+    ) -> List[Classification]:
+        """Classify with one model, using cached verdicts where available"""
+        results: List[Optional[Classification]] = [None] * len(articles)
+        
+        pending = []
+        for i, article in enumerate(articles):
+            verdict = self.cache.get(article, model) if self.cache else None
+            if verdict is not None:
+                results[i] = self._build_result(verdict, article, model, cache=False, rules=False)
+            else:
+                pending.append(i)
+        if rules:
+            self.rules.apply_batch([result for result in results if result is not None])
+        
+        classified = self.classify_many([articles[i] for i in pending], model, rules)
+        for i, classification in zip(pending, classified):
+            results[i] = classification
+        return results
+
+    def _needs_escalation(self, classification: Classification) -> bool:
+        """
+        Whether a raw fast-model verdict (before rules) is too uncertain to keep
+
+        Escalates failures, confidences within escalation_margin of a tier
+        threshold, and ambiguous categories (unknown, or a tier that does
+        not match the category's configured tier).
+        """
+        if classification.error:
+            return True
+        
+        margin = self.config.classification.escalation_margin
+        confidence = classification.confidence
+        
+        if not classification.relevant:
+            # Rejections carry a low score unless the model was torn
+            return confidence >= self.tier_thresholds[2] - margin
+        
+        rule = self.categories.get(classification.category)
+        if rule is None or rule.tier != classification.tier:
+            return True
+        
+        return abs(confidence - self.tier_thresholds[rule.tier]) < margin
+
+    def _route(self, classification: Classification, results: Dict[str, List[Classification]]):
+        """Sort a classification into its tier bucket"""
+        relevant = classification.relevant
+        tier = classification.tier
+        confidence = classification.confidence
+        category = classification.category or 'unknown'
+
+        if not relevant:
+            results['rejected'].append(classification)
+            if classification.reason.startswith(REASON_PREFIX):
+                logger.info(f"      🚫 {classification.reason}")
+        elif tier == 1 and confidence >= self.tier_thresholds[1]:
+            results['tier1'].append(classification)
+            logger.info(f"      ✅ Tier 1: {category} ({confidence:.2f})")
+        elif tier == 2 and confidence >= self.tier_thresholds[2]:
+            results['tier2'].append(classification)
+            logger.info(f"      ⚠️  Tier 2: {category} ({confidence:.2f})")
+        else:
+            results['rejected'].append(classification)
+            logger.info(f"      ❌ Rejected ({confidence:.2f})")
+
+    def _log_usage(self, results: Dict[str, List[Classification]]):
+        """Report per-model request, token and latency totals and the escalation rate"""
+        decided = [c for bucket in results.values() for c in bucket if c.model]
+        fast_path = sum(1 for c in decided if c.model == FAST_PATH_MODEL)
+        if fast_path:
+            logger.info(
+                f"⚡ Fast path: {fast_path} of {len(decided)} decided locally "
+                f"({fast_path / len(decided):.0%})"
+            )
+        
+        if self.config.classification.cascade:
+            decided = [c for c in decided if c.model != FAST_PATH_MODEL]
+            escalated = sum(1 for c in decided if c.model == CLASSIFY_MODEL)
+            if decided:
+                logger.info(
+                    f"🪜 Cascade: {len(decided) - escalated} decided by {FAST_MODEL}, "
+                    f"{escalated} escalated to {CLASSIFY_MODEL} "
+                    f"({escalated / len(decided):.0%})"
+                )
+        
+        with self._usage_lock:
+            if self.usage:
+                logger.info("📈 Groq usage since startup:")
+            for model, totals in self.usage.items():
+                logger.info(
+                    f"   {model}: {totals['requests']} requests, "
+                    f"{totals['tokens']:,} tokens, {totals['seconds']:.1f}s"
+                )
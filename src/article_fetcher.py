@@ -5,7 +5,15 @@ Uses Jina Reader to fetch clean article content
 
 import requests
 import logging
-from typing import Dict, Optional
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+from config import AppConfig, load_config
+from http_session import shared_session
+from models import FetchedArticle
+import replay
 from utils import clean_text, extract_date_from_text
 
 logger = logging.getLogger(__name__)
@@ -14,11 +22,21 @@ logger = logging.getLogger(__name__)
 class ArticleFetcher:
     """Fetches clean article content using Jina Reader"""
     
-    def __init__(self):
-        """Initialize article fetcher"""
+    def __init__(self, config: Optional[AppConfig] = None):
+        """
+        Initialize article fetcher
+        
+        Args:
+            config: Shared application config (loaded once if omitted)
+        """
         self.jina_base_url = "https://r.jina.ai/"
+        settings = (config or load_config()).http
+        # Pooled keep-alive connections to r.jina.ai, retried on 429/5xx
+        self.http = replay.wrap_http(shared_session(settings), 'jina')
+        self.max_workers = max(settings.max_concurrent_fetches, 1)
+        self.max_per_host = max(settings.max_fetches_per_host, 1)
     
-    def fetch(self, url: str) -> Dict:
+    def fetch(self, url: str) -> FetchedArticle:
         """
         Fetch clean article content from URL
         
@@ -26,7 +44,7 @@ class ArticleFetcher:
             url: Article URL
             
         Returns:
-            Dictionary with title, content, date, etc.
+            FetchedArticle with title, date and text
         """
         try:
             logger.debug(f"Fetching article: {url}")
@@ -34,21 +52,20 @@ class ArticleFetcher:
             # Use Jina Reader to get clean content
             jina_url = f"{self.jina_base_url}{url}"
             
-            response = requests.get(jina_url, timeout=30)
+            response = self.http.get(jina_url, timeout=30)
             response.raise_for_status()
             
             content = response.text
             
-            # Extract metadata
-            article = {
-                'url': url,
-                'title': self._extract_title(content),
-                'date': self._extract_date(content),
-                'content': clean_text(content),
-                'raw_content': content
-            }
+            # Extract metadata (cleaned text is derived on demand)
+            article = FetchedArticle(
+                url=url,
+                title=self._extract_title(content),
+                date=self._extract_date(content),
+                raw_content=content
+            )
             
-            logger.debug(f"Successfully fetched article: {article['title'][:50]}...")
+            logger.debug(f"Successfully fetched article: {article.title[:50]}...")
             
             return article
             
@@ -95,27 +112,61 @@ class ArticleFetcher:
         snippet = content[:1000]
         return extract_date_from_text(snippet)
     
-    def fetch_batch(self, urls: list) -> Dict[str, Dict]:
+    def _fetch_or_error(self, url: str) -> FetchedArticle:
+        """Fetch an article, recording a failure on the result instead of raising"""
+        try:
+            return self.fetch(url)
+        except Exception as e:
+            logger.error(f"Failed to fetch {url}: {e}")
+            return FetchedArticle(url=url, error=str(e))
+    
+    def fetch_as_completed(self, urls: Iterable[str]) -> Iterator[Tuple[str, FetchedArticle]]:
+        """
+        Fetch articles in parallel, yielding each as soon as it is done
+        
+        At most max_concurrent_fetches downloads run at once, and at most
+        max_fetches_per_host for any one publisher (Jina fetches the page
+        from the article's own host). URLs whose host is busy wait without
+        holding a worker, so other hosts keep going.
+        
+        Args:
+            urls: Article URLs (duplicates are fetched once)
+            
+        Yields:
+            (url, FetchedArticle) in completion order (``error`` set on failure)
+        """
+        pending = deque(dict.fromkeys(urls))
+        busy_hosts = Counter()
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+            while pending or running:
+                # Start queued URLs whose host has a free slot, keeping order
+                for _ in range(len(pending)):
+                    if len(running) >= self.max_workers:
+                        break
+                    url = pending.popleft()
+                    host = urlsplit(url).netloc.lower()
+                    if busy_hosts[host] >= self.max_per_host:
+                        pending.append(url)
+                        continue
+                    busy_hosts[host] += 1
+                    running[executor.submit(self._fetch_or_error, url)] = (url, host)
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url, host = running.pop(future)
+                    busy_hosts[host] -= 1
+                    yield url, future.result()
+    
+    def fetch_batch(self, urls: Iterable[str]) -> Dict[str, FetchedArticle]:
         """
-        Fetch multiple articles
+        Fetch multiple articles in parallel (see fetch_as_completed)
         
         Args:
             urls: List of URLs
             
         Returns:
-            Dictionary mapping URL to article data
+            Dictionary mapping URL to article (with ``error`` set on failure)
         """
-        results = {}
-        
-        for url in urls:
-            try:
-                article = self.fetch(url)
-                results[url] = article
-            except Exception as e:
-                logger.error(f"Failed to fetch {url}: {e}")
-                results[url] = {
-                    'url': url,
-                    'error': str(e)
-                }
-        
-        return results
+        return dict(self.fetch_as_completed(urls))
@@ -0,0 +1,178 @@
+"""
+Classification Cache Module
+Content-addressed store of LLM verdicts, so reappearing articles are not
+classified twice
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from config import AppConfig
+from models import Article
+from utils import clean_text
+
+logger = logging.getLogger(__name__)
+
+
+def prompt_version(config: AppConfig) -> str:
+    """
+    Fingerprint of everything that shapes a verdict besides the article
+
+    Editing classification_prompt.txt or categories.yaml changes the
+    fingerprint, which invalidates every cached verdict.
+    """
+    digest = hashlib.sha256(config.classification_prompt.encode('utf-8'))
+    categories_file = config.config_dir / 'categories.yaml'
+    digest.update(categories_file.read_bytes())
+    return digest.hexdigest()
+
+
+class ClassificationCache:
+    """SQLite cache of raw classification verdicts with TTL and LRU eviction"""
+
+    # Run LRU eviction after this many new entries
+    EVICT_EVERY = 100
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        version: str,
+        ttl_days: int = 30,
+        max_entries: int = 20000
+    ):
+        """
+        Initialize cache
+
+        Args:
+            db_path: Path to the SQLite database file
+            version: Prompt/category fingerprint (see prompt_version)
+            ttl_days: Entries older than this are never returned
+            max_entries: Least recently used entries beyond this are evicted
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.version = version
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self._since_evict = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS classification_cache (
+                key TEXT PRIMARY KEY,
+                verdict TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_last_used "
+            "ON classification_cache (last_used)"
+        )
+        self._conn.commit()
+        self.evict()
+
+    def key(self, article: Article, model: str) -> str:
+        """Hash of the article text, its source, the prompt version and the model"""
+        parts = (
+            clean_text(article.title),
+            clean_text(article.summary),
+            article.source_name or article.source,
+            self.version,
+            model,
+        )
+        return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+    def get(self, article: Article, model: str) -> Optional[Dict]:
+        """
+        Look up a cached verdict
+
+        Args:
+            article: Article to classify
+            model: Model that would classify it
+
+        Returns:
+            The raw verdict dictionary, or None on a miss
+        """
+        key = self.key(article, model)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT verdict FROM classification_cache "
+                "WHERE key = ? AND created_at >= ?",
+                (key, now - self.ttl_seconds)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._conn.execute(
+                "UPDATE classification_cache SET last_used = ? WHERE key = ?",
+                (now, key)
+            )
+            self._conn.commit()
+
+        return json.loads(row[0])
+
+    def put(self, article: Article, model: str, verdict: Dict):
+        """
+        Store a raw verdict (before rule adjustments)
+
+        Args:
+            article: Classified article
+            model: Model that produced the verdict
+            verdict: Parsed JSON verdict
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO classification_cache "
+                "(key, verdict, created_at, last_used) VALUES (?, ?, ?, ?)",
+                (self.key(article, model), json.dumps(verdict), now, now)
+            )
+            self._conn.commit()
+            self._since_evict += 1
+            due = self._since_evict >= self.EVICT_EVERY
+
+        if due:
+            self.evict()
+
+    def evict(self):
+        """Delete expired entries and trim to max_entries by last use"""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM classification_cache WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,)
+            )
+            self._conn.execute(
+                "DELETE FROM classification_cache WHERE key IN ("
+                "SELECT key FROM classification_cache "
+                "ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+            self._since_evict = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters since startup"""
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
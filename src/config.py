@@ -0,0 +1,515 @@
+"""
+Configuration Module
+Loads, validates and caches every config file once per process
+"""
+
+import logging
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import yaml
+
+import replay
+
+logger = logging.getLogger(__name__)
+
+# Resolved from this file so the config is found from src/ or the repo root
+DEFAULT_CONFIG_DIR = Path(__file__).resolve().parent.parent / 'config'
+
+
+class ConfigError(ValueError):
+    """Raised when a config file is missing or does not match the schema"""
+
+
+@dataclass(frozen=True)
+class SourceConfig:
+    """A single RSS feed source"""
+    id: str
+    name: str
+    url: str
+    enabled: bool = True
+    priority: str = 'medium'
+
+
+@dataclass(frozen=True)
+class DiscoverySettings:
+    """Feed discovery settings (sources.yaml: settings)"""
+    fetch_hours: int = 24
+    max_articles_per_source: int = 50
+    timeout_seconds: int = 30
+    max_concurrent_sources: int = 8
+    fast_parse: bool = False
+    discovery_processes: int = 1
+
+
+@dataclass(frozen=True)
+class FeedCacheConfig:
+    """Conditional-GET cache settings (sources.yaml: feed_cache)"""
+    enabled: bool = False
+    path: Optional[Path] = None
+
+
+@dataclass(frozen=True)
+class SeenIndexConfig:
+    """Cross-run seen-article index settings (sources.yaml: seen_index)"""
+    enabled: bool = False
+    path: Optional[Path] = None
+    retention_days: int = 30
+
+
+@dataclass(frozen=True)
+class EventIndexConfig:
+    """Cross-run story index settings (sources.yaml: event_index)"""
+    enabled: bool = False
+    path: Optional[Path] = None
+    retention_days: int = 7
+
+
+@dataclass(frozen=True)
+class HttpConfig:
+    """Shared HTTP session settings (sources.yaml: http)"""
+    pool_hosts: int = 100
+    pool_size: int = 16
+    retries: int = 3
+    backoff_factor: float = 0.5
+    max_retry_after: float = 30.0
+    max_concurrent_fetches: int = 8
+    max_fetches_per_host: int = 2
+
+
+@dataclass(frozen=True)
+class ClassificationCacheConfig:
+    """Verdict cache settings (sources.yaml: classification_cache)"""
+    enabled: bool = False
+    path: Optional[Path] = None
+    ttl_days: int = 30
+    max_entries: int = 20000
+
+
+@dataclass(frozen=True)
+class ModelRateLimit:
+    """Provider quota for one model (sources.yaml: classification.rate_limits)"""
+    requests_per_minute: int
+    tokens_per_minute: int
+
+
+@dataclass(frozen=True)
+class FastPathConfig:
+    """Local fast-path model settings (sources.yaml: classification.fast_path)"""
+    enabled: bool = False
+    model_path: Optional[Path] = None
+    accept_threshold: float = 0.95
+    reject_threshold: float = 0.97
+
+
+@dataclass(frozen=True)
+class ClassificationConfig:
+    """LLM classification settings (sources.yaml: classification)"""
+    batch_size: int = 1
+    max_concurrent_requests: int = 1
+    prefilter: bool = False
+    cascade: bool = False
+    escalation_margin: float = 0.15
+    fast_path: FastPathConfig = field(default_factory=FastPathConfig)
+    rate_limits: Mapping[str, ModelRateLimit] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+
+@dataclass(frozen=True)
+class DedupConfig:
+    """Duplicate detection settings (sources.yaml: duplicate_detection)"""
+    enabled: bool = False
+    confidence_threshold: float = 0.8
+    lsh_bands: int = 64
+    lsh_rows: int = 2
+    max_cluster_size: int = 12
+
+
+@dataclass(frozen=True)
+class DaemonConfig:
+    """Adaptive polling settings for daemon mode (sources.yaml: daemon)"""
+    initial_poll_minutes: float = 30.0
+    min_poll_minutes: float = 5.0
+    max_poll_minutes: float = 240.0
+    target_articles_per_poll: float = 2.0
+    batch_size: int = 10
+    max_batch_wait_minutes: float = 10.0
+
+
+@dataclass(frozen=True)
+class CategoryRule:
+    """A category definition from categories.yaml, keywords lowercased"""
+    name: str
+    tier: int
+    description: str = ''
+    required: Tuple[str, ...] = ()
+    strong: Tuple[str, ...] = ()
+    weak: Tuple[str, ...] = ()
+    exclude: Tuple[str, ...] = ()
+    must_include_one_of: Tuple[str, ...] = ()
+    min_confidence: float = 0.0
+    min_amount: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class ExcludedTopic:
+    """An exclusion rule from categories.yaml: excluded_topics"""
+    name: str
+    keywords: Tuple[str, ...] = ()
+    unless: Tuple[str, ...] = ()
+    min_amount: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class AppConfig:
+    """Immutable, fully validated view of all config files"""
+    config_dir: Path
+    sources: Tuple[SourceConfig, ...]
+    source_priority: Mapping[str, int]
+    settings: DiscoverySettings
+    feed_cache: FeedCacheConfig
+    seen_index: SeenIndexConfig
+    classification: ClassificationConfig
+    classification_cache: ClassificationCacheConfig
+    dedup: DedupConfig
+    event_index: EventIndexConfig
+    http: HttpConfig
+    daemon: DaemonConfig
+    categories: Mapping[str, CategoryRule]
+    excluded_topics: Tuple[ExcludedTopic, ...]
+    scoring: Mapping[str, float]
+    classification_prompt: str
+    system_prompt: str
+    enabled_sources: Tuple[SourceConfig, ...] = field(init=False)
+
+    def __post_init__(self):
+        # Precomputed once; frozen dataclasses need object.__setattr__
+        object.__setattr__(
+            self, 'enabled_sources', tuple(s for s in self.sources if s.enabled)
+        )
+
+
+# ── Validation helpers ───────────────────────────────────────────────────────
+
+def _read_text(path: Path) -> str:
+    """Read a required text file"""
+    try:
+        with open(path, 'r') as f:
+            return f.read()
+    except OSError as e:
+        raise ConfigError(f"Cannot read {path}: {e}")
+
+
+def _read_yaml(path: Path) -> Dict:
+    """Read a required YAML file whose top level is a mapping"""
+    try:
+        data = yaml.safe_load(_read_text(path)) or {}
+    except yaml.YAMLError as e:
+        raise ConfigError(f"Invalid YAML in {path}: {e}")
+    if not isinstance(data, dict):
+        raise ConfigError(f"{path}: top level must be a mapping")
+    return data
+
+
+def _section(data: Dict, key: str, where: str) -> Dict:
+    """Optional mapping section (missing = empty)"""
+    value = data.get(key) or {}
+    if not isinstance(value, dict):
+        raise ConfigError(f"{where}: '{key}' must be a mapping")
+    return value
+
+
+def _typed(data: Dict, key: str, expected: type, default: Any, where: str) -> Any:
+    """Optional scalar with type check (ints are accepted for floats)"""
+    value = data.get(key, default)
+    if value is None:
+        return default
+    if expected is float and isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    if not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+        raise ConfigError(f"{where}: '{key}' must be {expected.__name__}, got {value!r}")
+    return value
+
+
+def _keywords(data: Dict, key: str, where: str) -> Tuple[str, ...]:
+    """Optional list of keywords, lowercased"""
+    value = data.get(key) or []
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        raise ConfigError(f"{where}: '{key}' must be a list of strings")
+    return tuple(v.lower() for v in value)
+
+
+def _path(value: Optional[str], config_dir: Path) -> Optional[Path]:
+    """Resolve a path from config relative to the config directory"""
+    if not value:
+        return None
+    path = Path(value)
+    return path if path.is_absolute() else (config_dir / path).resolve()
+
+
+# ── Parsers ──────────────────────────────────────────────────────────────────
+
+def _parse_sources(data: Dict, where: str) -> Tuple[SourceConfig, ...]:
+    """Parse the sources mapping"""
+    sources = []
+    for source_id, raw in _section(data, 'sources', where).items():
+        entry = f"{where}: sources.{source_id}"
+        if not isinstance(raw, dict):
+            raise ConfigError(f"{entry} must be a mapping")
+        if not raw.get('url'):
+            raise ConfigError(f"{entry} is missing 'url'")
+        sources.append(SourceConfig(
+            id=str(source_id),
+            name=_typed(raw, 'name', str, str(source_id), entry),
+            url=_typed(raw, 'url', str, '', entry),
+            enabled=_typed(raw, 'enabled', bool, True, entry),
+            priority=_typed(raw, 'priority', str, 'medium', entry),
+        ))
+    return tuple(sources)
+
+
+def _load_sources(data: Dict, root: Path, where: str) -> Tuple[SourceConfig, ...]:
+    """
+    Parse sources.yaml sources plus any registries listed in source_files
+
+    Registries (e.g. written by opml_import.py) use the same ``sources:``
+    schema. Missing registries are skipped; ids already defined earlier win.
+    """
+    sources = list(_parse_sources(data, where))
+    seen_ids = {source.id for source in sources}
+    seen_urls = {source.url for source in sources}
+
+    registries = data.get('source_files') or []
+    if not isinstance(registries, list):
+        raise ConfigError(f"{where}: 'source_files' must be a list")
+
+    for registry in registries:
+        path = _path(registry, root)
+        if not path.exists():
+            logger.debug(f"Source registry not found, skipping: {path}")
+            continue
+        for source in _parse_sources(_read_yaml(path), path.name):
+            if source.id in seen_ids or source.url in seen_urls:
+                logger.debug(f"Skipping duplicate source from {path.name}: {source.id}")
+                continue
+            seen_ids.add(source.id)
+            seen_urls.add(source.url)
+            sources.append(source)
+
+    return tuple(sources)
+
+
+def _parse_categories(data: Dict, where: str) -> Mapping[str, CategoryRule]:
+    """Parse category definitions into CategoryRule objects"""
+    categories = {}
+    for name, raw in _section(data, 'categories', where).items():
+        entry = f"{where}: categories.{name}"
+        if not isinstance(raw, dict):
+            raise ConfigError(f"{entry} must be a mapping")
+        tier = raw.get('tier')
+        if tier not in (1, 2):
+            raise ConfigError(f"{entry}: 'tier' must be 1 or 2, got {tier!r}")
+        keywords = _section(raw, 'keywords', entry)
+        categories[name] = CategoryRule(
+            name=name,
+            tier=tier,
+            description=_typed(raw, 'description', str, '', entry),
+            required=_keywords(keywords, 'required', entry),
+            strong=_keywords(keywords, 'strong', entry),
+            weak=_keywords(keywords, 'weak', entry),
+            exclude=_keywords(raw, 'exclude', entry),
+            must_include_one_of=_keywords(raw, 'must_include_one_of', entry),
+            min_confidence=_typed(raw, 'min_confidence', float, 0.0, entry),
+            min_amount=_typed(raw, 'min_amount', int, None, entry),
+        )
+    return MappingProxyType(categories)
+
+
+def _parse_excluded_topics(data: Dict, where: str) -> Tuple[ExcludedTopic, ...]:
+    """Parse exclusion rules"""
+    topics = []
+    for name, raw in _section(data, 'excluded_topics', where).items():
+        entry = f"{where}: excluded_topics.{name}"
+        if not isinstance(raw, dict):
+            raise ConfigError(f"{entry} must be a mapping")
+        topics.append(ExcludedTopic(
+            name=name,
+            keywords=_keywords(raw, 'keywords', entry),
+            unless=_keywords(raw, 'unless', entry),
+            min_amount=_typed(raw, 'min_amount', int, None, entry),
+        ))
+    return tuple(topics)
+
+
+def _parse_fast_path(data: Dict, root: Path, where: str) -> FastPathConfig:
+    """Parse the local fast-path model settings"""
+    fast_path = _section(data, 'fast_path', where)
+    entry = f"{where}: classification.fast_path"
+    return FastPathConfig(
+        enabled=_typed(fast_path, 'enabled', bool, False, entry),
+        model_path=_path(fast_path.get('model_path', '../cache/fast_classifier.json'), root),
+        accept_threshold=_typed(fast_path, 'accept_threshold', float, 0.95, entry),
+        reject_threshold=_typed(fast_path, 'reject_threshold', float, 0.97, entry),
+    )
+
+
+def _parse_rate_limits(data: Dict, where: str) -> Mapping[str, ModelRateLimit]:
+    """Parse per-model request/token quotas"""
+    limits = {}
+    for model, raw in _section(data, 'rate_limits', where).items():
+        entry = f"{where}: classification.rate_limits.{model}"
+        if not isinstance(raw, dict):
+            raise ConfigError(f"{entry} must be a mapping")
+        limits[model] = ModelRateLimit(
+            requests_per_minute=_typed(raw, 'requests_per_minute', int, 30, entry),
+            tokens_per_minute=_typed(raw, 'tokens_per_minute', int, 6000, entry),
+        )
+    return MappingProxyType(limits)
+
+
+def _without_run_state(config: AppConfig) -> AppConfig:
+    """
+    Disable the cross-run caches for record/replay runs
+
+    Feed validators, the seen-article index, cached verdicts and recent
+    events would let a replay skip what the recording fetched (or let a
+    recording skip calls), so both runs start from no state at all.
+    """
+    logger.info("📼 Record/replay run: feed, seen, verdict and event caches disabled")
+    return replace(
+        config,
+        feed_cache=replace(config.feed_cache, enabled=False),
+        seen_index=replace(config.seen_index, enabled=False),
+        classification_cache=replace(config.classification_cache, enabled=False),
+        event_index=replace(config.event_index, enabled=False),
+    )
+
+
+@lru_cache(maxsize=None)
+def load_config(config_dir: Optional[str] = None) -> AppConfig:
+    """
+    Load and validate all config files (cached per directory)
+
+    Args:
+        config_dir: Directory holding sources.yaml, categories.yaml and prompts
+
+    Returns:
+        Immutable AppConfig shared by every component
+
+    Raises:
+        ConfigError: If a file is missing or invalid
+    """
+    root = Path(config_dir).resolve() if config_dir else DEFAULT_CONFIG_DIR
+
+    sources_file = root / 'sources.yaml'
+    sources_data = _read_yaml(sources_file)
+    where = sources_file.name
+
+    settings = _section(sources_data, 'settings', where)
+    feed_cache = _section(sources_data, 'feed_cache', where)
+    seen_index = _section(sources_data, 'seen_index', where)
+    classification = _section(sources_data, 'classification', where)
+    verdict_cache = _section(sources_data, 'classification_cache', where)
+    dedup = _section(sources_data, 'duplicate_detection', where)
+    event_index = _section(sources_data, 'event_index', where)
+    http = _section(sources_data, 'http', where)
+    daemon = _section(sources_data, 'daemon', where)
+
+    priority = _section(sources_data, 'source_priority', where)
+    for source_id, rank in priority.items():
+        if not isinstance(rank, int):
+            raise ConfigError(f"{where}: source_priority.{source_id} must be int")
+
+    categories_file = root / 'categories.yaml'
+    categories_data = _read_yaml(categories_file)
+    cwhere = categories_file.name
+
+    config = AppConfig(
+        config_dir=root,
+        sources=_load_sources(sources_data, root, where),
+        source_priority=MappingProxyType(dict(priority)),
+        settings=DiscoverySettings(
+            fetch_hours=_typed(settings, 'fetch_hours', int, 24, where),
+            max_articles_per_source=_typed(settings, 'max_articles_per_source', int, 50, where),
+            timeout_seconds=_typed(settings, 'timeout_seconds', int, 30, where),
+            max_concurrent_sources=_typed(settings, 'max_concurrent_sources', int, 8, where),
+            fast_parse=_typed(settings, 'fast_parse', bool, False, where),
+            discovery_processes=_typed(settings, 'discovery_processes', int, 1, where),
+        ),
+        feed_cache=FeedCacheConfig(
+            enabled=_typed(feed_cache, 'enabled', bool, False, where),
+            path=_path(feed_cache.get('path', '../cache/feed_cache.json'), root),
+        ),
+        seen_index=SeenIndexConfig(
+            enabled=_typed(seen_index, 'enabled', bool, False, where),
+            path=_path(seen_index.get('path', '../cache/seen_articles.db'), root),
+            retention_days=_typed(seen_index, 'retention_days', int, 30, where),
+        ),
+        classification=ClassificationConfig(
+            batch_size=_typed(classification, 'batch_size', int, 1, where),
+            max_concurrent_requests=_typed(
+                classification, 'max_concurrent_requests', int, 1, where
+            ),
+            prefilter=_typed(classification, 'prefilter', bool, False, where),
+            cascade=_typed(classification, 'cascade', bool, False, where),
+            escalation_margin=_typed(classification, 'escalation_margin', float, 0.15, where),
+            fast_path=_parse_fast_path(classification, root, where),
+            rate_limits=_parse_rate_limits(classification, where),
+        ),
+        classification_cache=ClassificationCacheConfig(
+            enabled=_typed(verdict_cache, 'enabled', bool, False, where),
+            path=_path(verdict_cache.get('path', '../cache/classification_cache.db'), root),
+            ttl_days=_typed(verdict_cache, 'ttl_days', int, 30, where),
+            max_entries=_typed(verdict_cache, 'max_entries', int, 20000, where),
+        ),
+        dedup=DedupConfig(
+            enabled=_typed(dedup, 'enabled', bool, False, where),
+            confidence_threshold=_typed(dedup, 'confidence_threshold', float, 0.8, where),
+            lsh_bands=_typed(dedup, 'lsh_bands', int, 64, where),
+            lsh_rows=_typed(dedup, 'lsh_rows', int, 2, where),
+            max_cluster_size=_typed(dedup, 'max_cluster_size', int, 12, where),
+        ),
+        event_index=EventIndexConfig(
+            enabled=_typed(event_index, 'enabled', bool, False, where),
+            path=_path(event_index.get('path', '../cache/events.db'), root),
+            retention_days=_typed(event_index, 'retention_days', int, 7, where),
+        ),
+        http=HttpConfig(
+            pool_hosts=_typed(http, 'pool_hosts', int, 100, where),
+            pool_size=_typed(http, 'pool_size', int, 16, where),
+            retries=_typed(http, 'retries', int, 3, where),
+            backoff_factor=_typed(http, 'backoff_factor', float, 0.5, where),
+            max_retry_after=_typed(http, 'max_retry_after', float, 30.0, where),
+            max_concurrent_fetches=_typed(http, 'max_concurrent_fetches', int, 8, where),
+            max_fetches_per_host=_typed(http, 'max_fetches_per_host', int, 2, where),
+        ),
+        daemon=DaemonConfig(
+            initial_poll_minutes=_typed(daemon, 'initial_poll_minutes', float, 30.0, where),
+            min_poll_minutes=_typed(daemon, 'min_poll_minutes', float, 5.0, where),
+            max_poll_minutes=_typed(daemon, 'max_poll_minutes', float, 240.0, where),
+            target_articles_per_poll=_typed(daemon, 'target_articles_per_poll', float, 2.0, where),
+            batch_size=_typed(daemon, 'batch_size', int, 10, where),
+            max_batch_wait_minutes=_typed(daemon, 'max_batch_wait_minutes', float, 10.0, where),
+        ),
+        categories=_parse_categories(categories_data, cwhere),
+        excluded_topics=_parse_excluded_topics(categories_data, cwhere),
+        scoring=MappingProxyType({
+            key: float(value)
+            for key, value in _section(categories_data, 'scoring', cwhere).items()
+        }),
+        classification_prompt=_read_text(root / 'classification_prompt.txt'),
+        system_prompt=_read_text(root / 'system_prompt.txt'),
+    )
+
+    if replay.mode() != replay.LIVE:
+        config = _without_run_state(config)
+
+    logger.debug(
+        f"Loaded config from {root}: {len(config.enabled_sources)} enabled sources, "
+        f"{len(config.categories)} categories"
+    )
+    return config
@@ -0,0 +1,237 @@
+"""
+Discovery Daemon Module
+Polls each source on its own adaptive interval and processes new articles
+in small micro-batches
+"""
+
+import logging
+import signal
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, List, Optional
+
+from config import DaemonConfig, SourceConfig
+from models import Article
+from utils import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+# How many recently queued URLs to remember when no seen index is configured
+RECENT_URL_LIMIT = 5000
+
+
+class SourceSchedule:
+    """Adaptive polling interval for a single source"""
+
+    # Weight of the latest observation in the publishing-rate average
+    RATE_SMOOTHING = 0.3
+
+    def __init__(self, source: SourceConfig, settings: DaemonConfig):
+        """
+        Initialize schedule
+
+        Args:
+            source: Source to poll
+            settings: Daemon settings (interval bounds, target yield)
+        """
+        self.source = source
+        self.settings = settings
+        self.interval = settings.initial_poll_minutes * 60
+        self.next_poll = time.monotonic()
+        self.last_poll: Optional[float] = None
+        self.rate_per_hour: Optional[float] = None
+        self.consecutive_errors = 0
+
+    def _clamp(self, seconds: float) -> float:
+        """Keep an interval within the configured bounds"""
+        return min(
+            max(seconds, self.settings.min_poll_minutes * 60),
+            self.settings.max_poll_minutes * 60
+        )
+
+    def record_success(self, new_articles: int, now: float):
+        """
+        Update the publishing-rate estimate and pick the next interval
+
+        Args:
+            new_articles: Articles not seen before in this poll
+            now: Monotonic time of the poll
+        """
+        self.consecutive_errors = 0
+
+        if self.last_poll is not None:
+            elapsed_hours = max((now - self.last_poll) / 3600, 1e-6)
+            observed = new_articles / elapsed_hours
+            if self.rate_per_hour is None:
+                self.rate_per_hour = observed
+            else:
+                self.rate_per_hour = (
+                    self.RATE_SMOOTHING * observed +
+                    (1 - self.RATE_SMOOTHING) * self.rate_per_hour
+                )
+        self.last_poll = now
+
+        if self.rate_per_hour:
+            # Poll roughly when target_articles_per_poll should be waiting
+            target = self.settings.target_articles_per_poll / self.rate_per_hour * 3600
+        elif self.rate_per_hour == 0:
+            # Quiet feed: back off gradually
+            target = self.interval * 1.5
+        else:
+            # First poll: no rate yet
+            target = self.interval
+
+        self.interval = self._clamp(target)
+        self.next_poll = now + self.interval
+
+    def record_error(self, now: float):
+        """Back off exponentially after failed polls"""
+        self.consecutive_errors += 1
+        backoff = self.interval * (2 ** self.consecutive_errors)
+        self.next_poll = now + self._clamp(backoff)
+
+
+class DiscoveryDaemon:
+    """Long-running discovery loop feeding the processing pipeline"""
+
+    # Never sleep longer than this, so shutdown stays responsive
+    MAX_SLEEP_SECONDS = 60
+
+    def __init__(self, processor):
+        """
+        Initialize daemon
+
+        Args:
+            processor: ArticleProcessor whose components and process_batch are used
+        """
+        self.processor = processor
+        self.discoverer = processor.discoverer
+        self.seen_index = processor.seen_index
+        self.settings = processor.config.daemon
+
+        # discoverer.sources honours --shard
+        self.schedules = [
+            SourceSchedule(source, self.settings)
+            for source in self.discoverer.sources if source.enabled
+        ]
+
+        self.pending: List[Article] = []
+        self.pending_since: Optional[float] = None
+        self._recent_urls: "OrderedDict[str, None]" = OrderedDict()
+        self._stop = threading.Event()
+
+    def stop(self, *_):
+        """Request a graceful shutdown (signal-handler compatible)"""
+        logger.info("🛑 Stop requested, flushing pending articles...")
+        self._stop.set()
+
+    def run(self):
+        """Poll sources until stopped"""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        logger.info(f"🔁 Daemon started: polling {len(self.schedules)} sources")
+
+        while not self._stop.is_set():
+            now = time.monotonic()
+            due = [s for s in self.schedules if s.next_poll <= now]
+
+            if due:
+                self._poll(due)
+
+            if self._should_flush(time.monotonic()):
+                self._flush()
+
+            self._stop.wait(self._sleep_seconds())
+
+        self._flush()
+        logger.info("👋 Daemon stopped")
+
+    def _poll(self, due: List[SourceSchedule]):
+        """Poll all due sources in parallel and queue their new articles"""
+        by_id = {schedule.source.id: schedule for schedule in due}
+        sources = [schedule.source for schedule in due]
+
+        for source, articles in self.discoverer.poll_sources(sources, ordered=False):
+            schedule = by_id[source.id]
+            now = time.monotonic()
+
+            if articles is None:
+                schedule.record_error(now)
+                continue
+
+            fresh = self._new_articles(articles)
+            schedule.record_success(len(fresh), now)
+
+            if fresh:
+                if not self.pending:
+                    self.pending_since = now
+                self.pending.extend(fresh)
+
+            logger.info(
+                f"   {source.name}: {len(fresh)} new, next poll in "
+                f"{(schedule.next_poll - now) / 60:.0f} min"
+            )
+
+    def _new_articles(self, articles: List[Article]) -> List[Article]:
+        """Drop articles already queued in this process or seen in past runs"""
+        fresh = []
+        for article in articles:
+            url = canonicalize_url(article.url)
+            if url in self._recent_urls:
+                continue
+            self._recent_urls[url] = None
+            fresh.append(article)
+
+        while len(self._recent_urls) > RECENT_URL_LIMIT:
+            self._recent_urls.popitem(last=False)
+
+        if self.seen_index and fresh:
+            fresh = self.seen_index.filter_unseen(fresh)
+        return fresh
+
+    def _should_flush(self, now: float) -> bool:
+        """Flush when the batch is full or its oldest article has waited long enough"""
+        if not self.pending:
+            return False
+        if len(self.pending) >= self.settings.batch_size:
+            return True
+        return now - self.pending_since >= self.settings.max_batch_wait_minutes * 60
+
+    def _flush(self):
+        """Run the pending micro-batch through the pipeline"""
+        if not self.pending:
+            return
+
+        batch, self.pending, self.pending_since = self.pending, [], None
+        logger.info(f"\n📦 Processing micro-batch of {len(batch)} articles")
+
+        try:
+            classified, processed = self.processor.process_batch(batch)
+            logger.info(
+                f"📦 Micro-batch done: {processed} processed, "
+                f"{len(classified['tier2'])} for review, "
+                f"{len(classified['rejected'])} rejected\n"
+            )
+            # process_batch reverted these sources' feed validators
+            self._forget(a for a in batch if a.url not in self.processor.settled_urls)
+        except Exception as e:
+            # Keep the daemon alive; the sources are re-read on their next
+            # poll (validators reverted) and their articles queued again
+            logger.error(f"❌ Micro-batch failed: {e}")
+            self.discoverer.save_cache({article.source for article in batch})
+            self._forget(batch)
+
+    def _forget(self, articles: Iterable[Article]):
+        """Let unfinished articles be queued again when their feed is re-read"""
+        for article in articles:
+            self._recent_urls.pop(canonicalize_url(article.url), None)
+
+    def _sleep_seconds(self) -> float:
+        """Time until the next poll or batch deadline"""
+        now = time.monotonic()
+        wake = min((s.next_poll for s in self.schedules), default=now + self.MAX_SLEEP_SECONDS)
+        if self.pending_since is not None:
+            wake = min(wake, self.pending_since + self.settings.max_batch_wait_minutes * 60)
+        return min(max(wake - now, 0.5), self.MAX_SLEEP_SECONDS)
@@ -0,0 +1,164 @@
+"""
+Duplicate Candidate Module
+MinHash / LSH over title+summary tokens, so only likely duplicates are sent
+to the LLM for confirmation
+"""
+
+import hashlib
+import logging
+import random
+import re
+from collections import defaultdict
+from typing import Iterable, List, Sequence, Set, Tuple
+
+from models import Article
+from utils import clean_text
+
+logger = logging.getLogger(__name__)
+
+# Mersenne prime for the universal hash family
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+# Summary words considered (feeds differ a lot in summary length)
+SUMMARY_WORDS = 60
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9$]+(?:[.\-][a-z0-9]+)*')
+
+STOPWORDS = frozenset("""
+a an and are as at be but by for from has have in into is it its of on or
+says said that the their this to was were will with new how why what after
+over than more about up out just now
+""".split())
+
+
+def shingles(article: Article) -> Set[str]:
+    """Normalized content words of the title and the start of the summary"""
+    summary = clean_text(article.summary).split()[:SUMMARY_WORDS]
+    text = f"{article.title} {' '.join(summary)}".lower()
+    return {
+        token for token in TOKEN_PATTERN.findall(text)
+        if token not in STOPWORDS and len(token) > 1
+    }
+
+
+def _stable_hash(token: str) -> int:
+    """32-bit hash that is the same in every process (unlike hash())"""
+    return int.from_bytes(
+        hashlib.blake2b(token.encode('utf-8'), digest_size=4).digest(), 'big'
+    )
+
+
+class MinHasher:
+    """MinHash signatures whose band collisions approximate Jaccard similarity"""
+
+    def __init__(self, bands: int = 64, rows: int = 2, seed: int = 1):
+        """
+        Initialize hasher
+
+        Similarity at which a pair has a 50% chance of becoming a
+        candidate is roughly (1 / bands) ** (1 / rows).
+
+        Args:
+            bands: Number of LSH bands
+            rows: Signature rows per band
+            seed: Seed for the hash permutations (fixed so signatures persist)
+        """
+        self.bands = bands
+        self.rows = rows
+        self.num_perm = bands * rows
+
+        rng = random.Random(seed)
+        self.permutations = [
+            (rng.randint(1, MERSENNE_PRIME - 1), rng.randint(0, MERSENNE_PRIME - 1))
+            for _ in range(self.num_perm)
+        ]
+
+    def signature(self, tokens: Iterable[str]) -> Tuple[int, ...]:
+        """MinHash signature of a token set (all-max for an empty set)"""
+        hashes = [_stable_hash(token) for token in tokens]
+        if not hashes:
+            return (MAX_HASH,) * self.num_perm
+        return tuple(
+            min(((a * h + b) % MERSENNE_PRIME) & MAX_HASH for h in hashes)
+            for a, b in self.permutations
+        )
+
+    def band_keys(self, signature: Sequence[int]) -> List[Tuple[int, ...]]:
+        """LSH bucket keys of a signature, one per band"""
+        return [
+            (band,) + tuple(signature[band * self.rows:(band + 1) * self.rows])
+            for band in range(self.bands)
+        ]
+
+    @staticmethod
+    def similarity(sig1: Sequence[int], sig2: Sequence[int]) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        if not sig1:
+            return 0.0
+        return sum(1 for x, y in zip(sig1, sig2) if x == y) / len(sig1)
+
+    def candidate_pairs(self, articles: List[Article]) -> Set[Tuple[int, int]]:
+        """
+        Index pairs (i < j) of articles that share at least one LSH band
+
+        Args:
+            articles: Articles to compare
+
+        Returns:
+            Set of likely-duplicate index pairs
+        """
+        buckets = defaultdict(list)
+        for i, article in enumerate(articles):
+            tokens = shingles(article)
+            if not tokens:
+                continue
+            for key in self.band_keys(self.signature(tokens)):
+                buckets[key].append(i)
+
+        pairs = set()
+        for members in buckets.values():
+            for x, i in enumerate(members):
+                for j in members[x + 1:]:
+                    pairs.add((i, j))
+
+        total = len(articles) * (len(articles) - 1) // 2
+        logger.info(f"   🧮 {len(pairs)} candidate pairs out of {total} possible")
+        return pairs
+
+
+class UnionFind:
+    """Disjoint sets over indices 0..n-1 (path halving, union by size)"""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def find(self, i: int) -> int:
+        """Representative of i's set"""
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> bool:
+        """Merge the sets of i and j; False if they were already joined"""
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i == root_j:
+            return False
+        if self.size[root_i] < self.size[root_j]:
+            root_i, root_j = root_j, root_i
+        self.parent[root_j] = root_i
+        self.size[root_i] += self.size[root_j]
+        return True
+
+    def connected(self, i: int, j: int) -> bool:
+        """Whether i and j are in the same set"""
+        return self.find(i) == self.find(j)
+
+    def groups(self) -> List[List[int]]:
+        """All sets as sorted index lists, ordered by their smallest index"""
+        members = defaultdict(list)
+        for i in range(len(self.parent)):
+            members[self.find(i)].append(i)
+        return sorted(members.values(), key=lambda group: group[0])
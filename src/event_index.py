@@ -0,0 +1,164 @@
+"""
+Event Index Module
+Rolling index of recently processed stories, so repeat coverage in later
+runs is attached to the existing sheet row instead of processed again
+"""
+
+import logging
+import sqlite3
+import struct
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Sequence, Union
+
+from dedup import MinHasher, shingles
+from models import Article
+from utils import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class KnownEvent:
+    """A previously processed story that may match a new article"""
+    sheet_range: str
+    title: str
+    url: str
+    similarity: float
+
+
+class EventIndex:
+    """SQLite store of MinHash signatures for processed stories"""
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        minhasher: MinHasher,
+        retention_days: int = 7
+    ):
+        """
+        Initialize event index
+
+        Args:
+            db_path: Path to the SQLite database file
+            minhasher: Hasher shared with in-run duplicate detection
+            retention_days: Events older than this are pruned on open
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.minhasher = minhasher
+        self.retention_days = retention_days
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS events (
+                url TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                signature BLOB NOT NULL,
+                sheet_range TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS event_bands (
+                band TEXT NOT NULL,
+                url TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_event_bands_band ON event_bands (band);
+            CREATE INDEX IF NOT EXISTS idx_event_bands_url ON event_bands (url);
+            """
+        )
+        self._conn.commit()
+        self.prune()
+
+    def _band_keys(self, signature: Sequence[int]) -> List[str]:
+        """LSH band keys as strings"""
+        return [':'.join(map(str, key)) for key in self.minhasher.band_keys(signature)]
+
+    def find(self, article: Article, limit: int = 3) -> List[KnownEvent]:
+        """
+        Look up previously processed stories that share an LSH band
+
+        Args:
+            article: New tier-1 article
+            limit: Maximum number of events to return
+
+        Returns:
+            Candidate events, most similar first (one per sheet row)
+        """
+        tokens = shingles(article)
+        if not tokens:
+            return []
+        signature = self.minhasher.signature(tokens)
+        bands = self._band_keys(signature)
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT e.url, e.title, e.signature, e.sheet_range "
+                "FROM event_bands b JOIN events e ON e.url = b.url "
+                f"WHERE b.band IN ({','.join('?' * len(bands))})",
+                bands
+            ).fetchall()
+
+        best = {}
+        for url, title, blob, sheet_range in rows:
+            stored = struct.unpack(f'<{len(blob) // 4}I', blob)
+            similarity = MinHasher.similarity(signature, stored)
+            current = best.get(sheet_range)
+            if current is None or similarity > current.similarity:
+                best[sheet_range] = KnownEvent(sheet_range, title, url, similarity)
+
+        return sorted(best.values(), key=lambda e: e.similarity, reverse=True)[:limit]
+
+    def add(self, articles: List[Article], sheet_range: str):
+        """
+        Index the articles of a processed story under its sheet row
+
+        Args:
+            articles: Primary article and its merged duplicates
+            sheet_range: Range returned by SheetsClient.append_row
+        """
+        now = datetime.now().isoformat()
+        with self._lock:
+            for article in articles:
+                tokens = shingles(article)
+                if not tokens:
+                    continue
+                signature = self.minhasher.signature(tokens)
+                url = canonicalize_url(article.url)
+                self._conn.execute("DELETE FROM event_bands WHERE url = ?", (url,))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO events "
+                    "(url, title, signature, sheet_range, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (
+                        url,
+                        article.title,
+                        struct.pack(f'<{len(signature)}I', *signature),
+                        sheet_range,
+                        now
+                    )
+                )
+                self._conn.executemany(
+                    "INSERT INTO event_bands (band, url) VALUES (?, ?)",
+                    [(band, url) for band in self._band_keys(signature)]
+                )
+            self._conn.commit()
+
+    def prune(self):
+        """Delete events older than the retention window"""
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).isoformat()
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM event_bands WHERE url IN "
+                "(SELECT url FROM events WHERE created_at < ?)",
+                (cutoff,)
+            )
+            self._conn.execute("DELETE FROM events WHERE created_at < ?", (cutoff,))
+            self._conn.commit()
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
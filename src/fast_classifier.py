@@ -0,0 +1,254 @@
+"""
+Fast-Path Classifier Module
+Small local model trained on past LLM decisions (see train_fast_classifier.py).
+Confident predictions skip Groq; everything else goes to the LLM.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import random
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from models import Article
+
+logger = logging.getLogger(__name__)
+
+REJECTED = 'rejected'
+
+# Hashed feature space (2^18 buckets)
+FEATURE_BITS = 18
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9$]+(?:[.\-][a-z0-9]+)*')
+
+
+@dataclass(slots=True)
+class LabeledExample:
+    """A past classification decision exported from the sheet"""
+    title: str
+    source: str
+    label: str
+
+
+def features(title: str, source: str = '') -> List[int]:
+    """
+    Hashed word unigrams and bigrams of the title, plus the source
+
+    Only the title is used: the Rejected Log has no summaries, so training
+    on summaries would teach the model that "has a summary" means relevant.
+    """
+    tokens = TOKEN_PATTERN.findall(title.lower())
+    grams = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    if source:
+        grams.append(f"source={source.lower()}")
+
+    mask = (1 << FEATURE_BITS) - 1
+    return sorted({
+        int.from_bytes(hashlib.blake2b(g.encode('utf-8'), digest_size=8).digest(), 'big') & mask
+        for g in grams
+    })
+
+
+def _softmax(scores: Dict[str, float]) -> Dict[str, float]:
+    """Normalize class scores into probabilities"""
+    top = max(scores.values())
+    exps = {label: math.exp(score - top) for label, score in scores.items()}
+    total = sum(exps.values())
+    return {label: value / total for label, value in exps.items()}
+
+
+class FastClassifier:
+    """Multinomial logistic regression over hashed n-gram features"""
+
+    def __init__(self, labels: List[str], weights: Dict[str, Dict[int, float]],
+                 bias: Dict[str, float], metadata: Optional[Dict] = None):
+        """
+        Initialize model
+
+        Args:
+            labels: Category names plus 'rejected'
+            weights: Sparse weights per label (feature bucket -> weight)
+            bias: Bias per label
+            metadata: Training details saved with the model
+        """
+        self.labels = labels
+        self.weights = weights
+        self.bias = bias
+        self.metadata = metadata or {}
+
+    def predict_proba(self, title: str, source: str = '') -> Dict[str, float]:
+        """Probability of each label for a title"""
+        active = features(title, source)
+        scores = {
+            label: self.bias[label] + sum(self.weights[label].get(f, 0.0) for f in active)
+            for label in self.labels
+        }
+        return _softmax(scores)
+
+    def predict(self, article: Article) -> Tuple[str, float]:
+        """Most likely label and its probability"""
+        probabilities = self.predict_proba(article.title, article.source_name)
+        label = max(probabilities, key=probabilities.get)
+        return label, probabilities[label]
+
+    @classmethod
+    def train(
+        cls,
+        examples: List[LabeledExample],
+        epochs: int = 8,
+        learning_rate: float = 0.2,
+        l2: float = 1e-5,
+        seed: int = 1
+    ) -> 'FastClassifier':
+        """
+        Fit the model with plain stochastic gradient descent
+
+        Args:
+            examples: Labeled examples
+            epochs: Passes over the data
+            learning_rate: Initial step size (decays per epoch)
+            l2: L2 regularization strength
+            seed: Shuffle seed
+
+        Returns:
+            Trained classifier
+        """
+        labels = sorted({e.label for e in examples})
+        weights: Dict[str, Dict[int, float]] = {label: defaultdict(float) for label in labels}
+        bias = {label: 0.0 for label in labels}
+        model = cls(labels, weights, bias)
+
+        data = [(features(e.title, e.source), e.label) for e in examples]
+        rng = random.Random(seed)
+
+        for epoch in range(epochs):
+            rng.shuffle(data)
+            rate = learning_rate / (1 + epoch)
+            for active, target in data:
+                probabilities = _softmax({
+                    label: bias[label] + sum(weights[label][f] for f in active)
+                    for label in labels
+                })
+                for label in labels:
+                    gradient = probabilities[label] - (1.0 if label == target else 0.0)
+                    if abs(gradient) < 1e-6:
+                        continue
+                    bias[label] -= rate * gradient
+                    row = weights[label]
+                    for f in active:
+                        row[f] -= rate * (gradient + l2 * row[f])
+
+        # Drop near-zero weights to keep the saved model small
+        model.weights = {
+            label: {f: w for f, w in row.items() if abs(w) > 1e-4}
+            for label, row in weights.items()
+        }
+        model.metadata = {
+            'trained_at': datetime.now().isoformat(),
+            'examples': len(examples),
+            'label_counts': dict(Counter(e.label for e in examples)),
+            'feature_bits': FEATURE_BITS,
+        }
+        return model
+
+    def save(self, path: Union[str, Path]):
+        """Write the model as JSON"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({
+                'labels': self.labels,
+                'bias': self.bias,
+                'weights': {
+                    label: {str(k): round(v, 5) for k, v in row.items()}
+                    for label, row in self.weights.items()
+                },
+                'metadata': self.metadata,
+            }, f)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'FastClassifier':
+        """Read a model written by save()"""
+        with open(path, 'r') as f:
+            data = json.load(f)
+
+        if data.get('metadata', {}).get('feature_bits', FEATURE_BITS) != FEATURE_BITS:
+            raise ValueError(f"{path} was trained with a different feature size; retrain it")
+
+        return cls(
+            labels=data['labels'],
+            weights={
+                label: {int(k): v for k, v in row.items()}
+                for label, row in data['weights'].items()
+            },
+            bias=data['bias'],
+            metadata=data.get('metadata', {}),
+        )
+
+
+def evaluate(
+    model: FastClassifier,
+    examples: Iterable[LabeledExample],
+    accept_threshold: float,
+    reject_threshold: float
+) -> Dict:
+    """
+    Agreement of the model with the LLM labels
+
+    Args:
+        model: Trained classifier
+        examples: Held-out labeled examples
+        accept_threshold: Minimum probability for a fast-path accept
+        reject_threshold: Minimum probability for a fast-path reject
+
+    Returns:
+        Overall and fast-path agreement plus per-label precision/recall
+    """
+    total = correct = relevance_agreed = 0
+    decided = decided_correct = 0
+    per_label = defaultdict(lambda: {'tp': 0, 'fp': 0, 'fn': 0})
+
+    for example in examples:
+        total += 1
+        probabilities = model.predict_proba(example.title, example.source)
+        label = max(probabilities, key=probabilities.get)
+        probability = probabilities[label]
+
+        if label == example.label:
+            correct += 1
+            per_label[label]['tp'] += 1
+        else:
+            per_label[label]['fp'] += 1
+            per_label[example.label]['fn'] += 1
+        if (label == REJECTED) == (example.label == REJECTED):
+            relevance_agreed += 1
+
+        threshold = reject_threshold if label == REJECTED else accept_threshold
+        if probability >= threshold:
+            decided += 1
+            decided_correct += label == example.label
+
+    def ratio(a: int, b: int) -> float:
+        return a / b if b else 0.0
+
+    return {
+        'examples': total,
+        'accuracy': ratio(correct, total),
+        'relevance_agreement': ratio(relevance_agreed, total),
+        'fast_path_coverage': ratio(decided, total),
+        'fast_path_agreement': ratio(decided_correct, decided),
+        'labels': {
+            label: {
+                'precision': ratio(c['tp'], c['tp'] + c['fp']),
+                'recall': ratio(c['tp'], c['tp'] + c['fn']),
+                'support': c['tp'] + c['fn'],
+            }
+            for label, c in sorted(per_label.items())
+        },
+    }
@@ -0,0 +1,156 @@
+"""
+Feed Cache Module
+Persists per-feed HTTP validators so unchanged feeds can be skipped
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class FeedCache:
+    """On-disk cache of ETag / Last-Modified / body hash per feed URL"""
+
+    def __init__(self, cache_file: Union[str, Path] = "../cache/feed_cache.json"):
+        """
+        Initialize feed cache
+
+        Args:
+            cache_file: Path to the JSON cache file
+        """
+        self.cache_file = Path(cache_file)
+        self._lock = threading.Lock()
+        self._entries = self._load()
+        self._updated = set()
+        # Entries as last saved, for feeds refreshed since (None = new feed)
+        self._previous: Dict[str, Optional[Dict]] = {}
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict]:
+        """Load cached validators from disk"""
+        try:
+            with open(self.cache_file, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable feed cache {self.cache_file}: {e}")
+            return {}
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Build conditional GET headers for a feed
+
+        Args:
+            url: Feed URL
+
+        Returns:
+            Dictionary of If-None-Match / If-Modified-Since headers
+        """
+        with self._lock:
+            entry = self._entries.get(url, {})
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def update(self, url: str, headers: Dict[str, str], body: bytes) -> bool:
+        """
+        Record a fresh response for a feed
+
+        Args:
+            url: Feed URL
+            headers: Response headers (case-insensitive mapping)
+            body: Raw response body
+
+        Returns:
+            True if the body changed since the last cached response
+        """
+        body_hash = hashlib.sha256(body).hexdigest()
+
+        with self._lock:
+            previous = self._entries.get(url, {})
+            changed = previous.get('body_hash') != body_hash
+            self._previous.setdefault(url, self._entries.get(url))
+
+            self._entries[url] = {
+                'etag': headers.get('ETag', ''),
+                'last_modified': headers.get('Last-Modified', ''),
+                'body_hash': body_hash,
+                'checked_at': datetime.now().isoformat()
+            }
+            self._updated.add(url)
+            self._dirty = True
+
+        return changed
+
+    def updated_entries(self) -> Dict[str, Dict]:
+        """Entries refreshed by this instance (for handing back to a parent process)"""
+        with self._lock:
+            return {url: dict(self._entries[url]) for url in self._updated}
+
+    def merge(self, entries: Dict[str, Dict]):
+        """
+        Merge entries refreshed elsewhere (e.g. by a discovery worker)
+
+        Args:
+            entries: Mapping of feed URL to cache entry
+        """
+        if not entries:
+            return
+        with self._lock:
+            for url in entries:
+                self._previous.setdefault(url, self._entries.get(url))
+            self._entries.update(entries)
+            self._updated.update(entries)
+            self._dirty = True
+
+    def revert(self, urls: Iterable[str]):
+        """
+        Forget this run's validators for some feeds
+
+        Their articles were not fully processed, so the next run must
+        download and parse them again instead of seeing "not modified".
+
+        Args:
+            urls: Feed URLs to restore to their last saved entries
+        """
+        with self._lock:
+            for url in urls:
+                if url not in self._previous:
+                    continue
+                previous = self._previous.pop(url)
+                if previous is None:
+                    self._entries.pop(url, None)
+                else:
+                    self._entries[url] = previous
+                self._updated.discard(url)
+
+    def save(self):
+        """Write the cache to disk (atomically) if anything changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = dict(self._entries)
+            self._previous.clear()
+            self._dirty = False
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump(snapshot, f, indent=2, sort_keys=True)
+            os.replace(tmp_file, self.cache_file)
+            logger.debug(f"Saved feed cache ({len(snapshot)} feeds)")
+        except OSError as e:
+            logger.warning(f"Could not save feed cache: {e}")
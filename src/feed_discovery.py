@@ -3,90 +3,331 @@ RSS Feed Discovery Module
 Fetches articles from configured RSS feeds
 """
 
+import hashlib
 import feedparser
-import yaml
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional, Sequence, Tuple
 import logging
-from pathlib import Path
+
+from config import AppConfig, SourceConfig, load_config
+from feed_cache import FeedCache
+from feed_parser import FeedParseError, parse_recent_entries
+from http_session import shared_session
+from models import Article
+import replay
+from utils import canonicalize_url
 
 logger = logging.getLogger(__name__)
 
+USER_AGENT = "AI-News-Aggregator/1.0 (+https://ivolution-ai.com)"
+
+
+def shard_for(source_id: str, count: int, salt: str = '') -> int:
+    """
+    Stable hash partition of a source id
+
+    Uses SHA-1 rather than hash() so every process and machine agrees.
+
+    Args:
+        source_id: Source identifier
+        count: Number of shards
+        salt: Distinguishes independent partitionings (machines vs processes)
+
+    Returns:
+        Shard index in [0, count)
+    """
+    digest = hashlib.sha1(f"{salt}{source_id}".encode('utf-8')).hexdigest()
+    return int(digest, 16) % count
+
+
+def _discover_partition(config_dir: str, source_ids: Tuple[str, ...], hours: Optional[int]):
+    """
+    Worker-process entry point for sharded discovery
+
+    Returns the partition's articles plus the feed-cache entries it
+    refreshed, so the parent process owns the single cache file.
+    """
+    discoverer = FeedDiscoverer(load_config(config_dir))
+    wanted = set(source_ids)
+    discoverer.sources = tuple(s for s in discoverer.sources if s.id in wanted)
+
+    articles = []
+    for _, found in discoverer.poll_sources(discoverer.sources, hours, ordered=True):
+        articles.extend(found or [])
+
+    updates = discoverer.feed_cache.updated_entries() if discoverer.feed_cache else {}
+    return articles, updates
+
 
 class FeedDiscoverer:
     """Discovers and fetches articles from RSS feeds"""
     
-    def __init__(self, config_path: str = "../config/sources.yaml"):
-        """Initialize feed discoverer"""
-        self.config_path = Path(config_path)
-        self.sources = self._load_sources()
-        self.settings = self._load_settings()
+    def __init__(self, config: Optional[AppConfig] = None):
+        """
+        Initialize feed discoverer
+        
+        Args:
+            config: Shared application config (loaded once if omitted)
+        """
+        self.config = config or load_config()
+        self.sources = self.config.sources
+        self.settings = self.config.settings
+        
+        cache_config = self.config.feed_cache
+        self.feed_cache = FeedCache(cache_config.path) if cache_config.enabled else None
+        self.http = replay.wrap_http(shared_session(self.config.http), 'feeds')
     
-    def _load_sources(self) -> Dict:
-        """Load RSS feed sources from config"""
-        try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
-                return config.get('sources', {})
-        except FileNotFoundError:
-            logger.error(f"Config file not found: {self.config_path}")
-            return {}
-        except yaml.YAMLError as e:
-            logger.error(f"Error parsing config: {e}")
-            return {}
+    def restrict_to_shard(self, index: int, count: int):
+        """
+        Only discover this machine's hash partition of the sources
+        
+        Args:
+            index: Shard index (0-based)
+            count: Total number of shards
+        """
+        if count < 1 or not 0 <= index < count:
+            raise ValueError(f"Invalid shard {index}/{count}")
+        
+        self.sources = tuple(
+            source for source in self.config.sources
+            if shard_for(source.id, count) == index
+        )
+        logger.info(f"🧩 Shard {index}/{count}: {len(self.sources)} of {len(self.config.sources)} sources")
     
-    def _load_settings(self) -> Dict:
-        """Load settings from config"""
-        try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
-                return config.get('settings', {})
-        except:
-            return {
-                'fetch_hours': 24,
-                'max_articles_per_source': 50,
-                'timeout_seconds': 30
-            }
+    def save_cache(self, failed_sources: Iterable[str] = ()):
+        """
+        Persist feed validators (call once the run has been processed)
+
+        Args:
+            failed_sources: Ids of sources with articles that were not fully
+                processed; their feeds are re-read next run
+        """
+        if not self.feed_cache:
+            return
+        failed = set(failed_sources)
+        if failed:
+            self.feed_cache.revert(s.url for s in self.config.sources if s.id in failed)
+            logger.info(f"🔁 {len(failed)} sources will be re-read next run (unfinished articles)")
+        self.feed_cache.save()
+
+    def fetch_recent_articles(self, hours: Optional[int] = None) -> List[Article]:
+        """
+        Fetch articles from all enabled RSS feeds
+
+        Sources are downloaded in parallel (bounded by
+        ``max_concurrent_sources``), but results are always returned in the
+        order the sources appear in the config.
+        """
+        results = (
+            article
+            for _, articles in self.poll_sources(self.sources, hours, ordered=True)
+            for article in (articles or [])
+        )
+        all_articles = list(self._unique(results))
+        
+        logger.info(f"\n📊 Total articles discovered: {len(all_articles)}")
+        return all_articles
+    
+    def iter_recent_articles(self, hours: Optional[int] = None) -> Iterator[Article]:
+        """
+        Stream articles from all enabled RSS feeds
+
+        Yields each source's articles as soon as that source finishes, so
+        downstream stages can start while slower feeds are still downloading.
+        Record/replay runs keep config order so batches match the recording.
+        """
+        ordered = replay.mode() != replay.LIVE
+        results = (
+            article
+            for _, articles in self.poll_sources(self.sources, hours, ordered=ordered)
+            for article in (articles or [])
+        )
+        total = 0
+        for article in self._unique(results):
+            total += 1
+            yield article
+        
+        logger.info(f"\n📊 Total articles discovered: {total}")
+    
+    def iter_recent_articles_sharded(
+        self,
+        processes: int,
+        hours: Optional[int] = None
+    ) -> Iterator[Article]:
+        """
+        Stream articles using several worker processes
+
+        Each process takes a stable hash partition of the sources; results
+        are merged into a single stream as each partition completes.
+
+        Args:
+            processes: Number of worker processes
+            hours: Look-back window (defaults to ``fetch_hours``)
+        """
+        partitions: Dict[int, List[str]] = {}
+        for source in self.sources:
+            if source.enabled:
+                partitions.setdefault(shard_for(source.id, processes, salt='process'), []).append(source.id)
+        
+        if not partitions:
+            return
+        
+        logger.info(f"🧩 Discovering {len(self.sources)} sources across {len(partitions)} processes")
+        
+        total = 0
+        for article in self._unique(self._iter_partitions(partitions, hours)):
+            total += 1
+            yield article
+        
+        logger.info(f"\n📊 Total articles discovered: {total}")
     
-    def fetch_recent_articles(self, hours: Optional[int] = None) -> List[Dict]:
-        """Fetch articles from all enabled RSS feeds"""
+    def _iter_partitions(self, partitions: Dict[int, List[str]], hours: Optional[int]) -> Iterator[Article]:
+        """Run each partition in a worker process and yield results as they finish"""
+        config_dir = str(self.config.config_dir)
+        
+        with ProcessPoolExecutor(max_workers=len(partitions)) as executor:
+            futures = [
+                executor.submit(_discover_partition, config_dir, tuple(ids), hours)
+                for ids in partitions.values()
+            ]
+            
+            # Record/replay runs keep partition order so batches match
+            ordered = replay.mode() != replay.LIVE
+            for future in (futures if ordered else as_completed(futures)):
+                try:
+                    articles, cache_updates = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Discovery worker failed: {e}")
+                    continue
+                
+                if self.feed_cache:
+                    self.feed_cache.merge(cache_updates)
+                yield from articles
+    
+    def _unique(self, articles: Iterable[Article]) -> Iterator[Article]:
+        """
+        Drop exact duplicates by canonical URL
+        
+        The same story often appears in several feeds (or twice in one);
+        catching it here keeps it out of every paid stage downstream.
+        """
+        seen_urls = set()
+        duplicates = 0
+        
+        for article in articles:
+            url = canonicalize_url(article.url)
+            if url and url in seen_urls:
+                duplicates += 1
+                continue
+            seen_urls.add(url)
+            yield article
+        
+        if duplicates:
+            logger.info(f"🔗 Dropped {duplicates} duplicate URLs")
+    
+    def poll_sources(
+        self,
+        sources: Sequence[SourceConfig],
+        hours: Optional[int] = None,
+        ordered: bool = True
+    ) -> Iterator[Tuple[SourceConfig, Optional[List[Article]]]]:
+        """
+        Download sources in parallel and yield each source's articles
+
+        Args:
+            sources: Sources to poll
+            hours: Look-back window (defaults to ``fetch_hours``)
+            ordered: Yield in the given order instead of completion order
+
+        Yields:
+            (source, articles) pairs; articles is None if the fetch failed
+        """
         if hours is None:
-            hours = self.settings.get('fetch_hours', 24)
+            hours = self.settings.fetch_hours
         
         cutoff = datetime.now() - timedelta(hours=hours)
-        all_articles = []
         
         logger.info(f"🔍 Fetching articles from last {hours} hours...")
         
-        for source_id, source_config in self.sources.items():
-            if not source_config.get('enabled', True):
-                logger.info(f"⏭️  Skipping disabled source: {source_id}")
-                continue
-            
-            try:
-                articles = self._fetch_from_source(source_id, source_config, cutoff)
-                all_articles.extend(articles)
-                logger.info(f"✅ {source_config['name']}: Found {len(articles)} articles")
-            except Exception as e:
-                logger.error(f"❌ Error fetching from {source_config['name']}: {e}")
-                continue
+        for source in sources:
+            if not source.enabled:
+                logger.info(f"⏭️  Skipping disabled source: {source.id}")
         
-        logger.info(f"\n📊 Total articles discovered: {len(all_articles)}")
-        return all_articles
+        enabled = [source for source in sources if source.enabled]
+        if not enabled:
+            return
+        
+        max_workers = max(1, min(self.settings.max_concurrent_sources, len(enabled)))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._fetch_from_source, source, cutoff): source
+                for source in enabled
+            }
+            
+            # Given order keeps output deterministic; completion order
+            # lets callers start on fast feeds first
+            for future in (futures if ordered else as_completed(futures)):
+                source = futures[future]
+                try:
+                    articles = future.result()
+                    logger.info(f"✅ {source.name}: Found {len(articles)} articles")
+                except Exception as e:
+                    logger.error(f"❌ Error fetching from {source.name}: {e}")
+                    articles = None
+                yield source, articles
     
-    def _fetch_from_source(self, source_id: str, source_config: Dict, cutoff: datetime) -> List[Dict]:
+    def _fetch_from_source(self, source: SourceConfig, cutoff: datetime) -> List[Article]:
         """Fetch articles from a single RSS feed"""
-        url = source_config['url']
-        timeout = self.settings.get('timeout_seconds', 30)
+        url = source.url
+        timeout = self.settings.timeout_seconds
         
         logger.debug(f"Fetching RSS from: {url}")
-        feed = feedparser.parse(url)
+        
+        headers = {'User-Agent': USER_AGENT}
+        if self.feed_cache:
+            headers.update(self.feed_cache.conditional_headers(url))
+        
+        # feedparser has no timeout of its own, so download with the shared session
+        # and hand the raw bytes to the parser
+        response = self.http.get(url, timeout=timeout, headers=headers)
+        
+        if response.status_code == 304:
+            logger.debug(f"{source.id}: not modified since last run")
+            return []
+        
+        response.raise_for_status()
+        
+        if self.feed_cache and not self.feed_cache.update(url, response.headers, response.content):
+            logger.debug(f"{source.id}: feed body unchanged since last run")
+            return []
+        
+        max_articles = self.settings.max_articles_per_source
+        
+        if self.settings.fast_parse:
+            try:
+                entries = parse_recent_entries(response.content, cutoff, max_articles)
+            except FeedParseError as e:
+                logger.debug(f"{source.id}: fast parse unavailable ({e}), using feedparser")
+            else:
+                articles = []
+                for entry in entries:
+                    try:
+                        articles.append(self._build_article(entry, entry['published'], source))
+                    except Exception as e:
+                        logger.debug(f"Error parsing entry: {e}")
+                return articles
+        
+        feed = feedparser.parse(
+            response.content,
+            response_headers={k.lower(): v for k, v in response.headers.items()}
+        )
         
         if feed.bozo:
-            logger.warning(f"Feed parse warning for {source_id}: {feed.bozo_exception}")
+            logger.warning(f"Feed parse warning for {source.id}: {feed.bozo_exception}")
         
         articles = []
-        max_articles = self.settings.get('max_articles_per_source', 50)
         
         for entry in feed.entries[:max_articles]:
             try:
@@ -94,22 +335,26 @@ class FeedDiscoverer:
                 if pub_date is None or pub_date < cutoff:
                     continue
                 
-                article = {
-                    'title': entry.get('title', 'Untitled').strip(),
-                    'url': entry.get('link', ''),
-                    'summary': entry.get('summary', entry.get('description', '')).strip(),
-                    'published': pub_date.isoformat(),
-                    'source': source_id,
-                    'source_name': source_config['name'],
-                    'author': entry.get('author', ''),
-                }
-                articles.append(article)
+                articles.append(self._build_article(entry, pub_date, source))
             except Exception as e:
                 logger.debug(f"Error parsing entry: {e}")
                 continue
         
         return articles
     
+    def _build_article(self, entry, pub_date: datetime, source: SourceConfig) -> Article:
+        """Build an Article from a feedparser or fast-path entry"""
+        return Article(
+            title=(entry.get('title') or 'Untitled').strip(),
+            # Prefer the publisher's link over feed-proxy redirects
+            url=(entry.get('feedburner_origlink') or entry.get('link', '')).strip(),
+            summary=entry.get('summary', entry.get('description', '')).strip(),
+            published=pub_date.isoformat(),
+            source=source.id,
+            source_name=source.name,
+            author=entry.get('author', ''),
+        )
+    
     def _parse_date(self, entry) -> Optional[datetime]:
         """Parse publication date from feed entry"""
         if hasattr(entry, 'published_parsed') and entry.published_parsed:
@@ -128,10 +373,10 @@ class FeedDiscoverer:
     
     def get_source_stats(self) -> Dict:
         """Get statistics about configured sources"""
-        enabled = sum(1 for s in self.sources.values() if s.get('enabled', True))
+        enabled = [source for source in self.sources if source.enabled]
         return {
             'total_sources': len(self.sources),
-            'enabled_sources': enabled,
-            'disabled_sources': len(self.sources) - enabled,
-            'sources': {name: config['name'] for name, config in self.sources.items() if config.get('enabled', True)}
+            'enabled_sources': len(enabled),
+            'disabled_sources': len(self.sources) - len(enabled),
+            'sources': {source.id: source.name for source in enabled}
         }
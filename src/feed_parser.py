@@ -0,0 +1,170 @@
+"""
+Incremental Feed Parser Module
+Fast-path RSS/Atom reader that stops at the first entry past the cutoff
+"""
+
+import io
+import logging
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, List, Optional
+
+from dateutil import parser as date_parser
+
+logger = logging.getLogger(__name__)
+
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+DC_NS = '{http://purl.org/dc/elements/1.1/}'
+FEEDBURNER_NS = '{http://rssnamespace.org/feedburner/ext/1.0}'
+
+RSS_ITEM = 'item'
+
+# Entries past the cutoff read before stopping, so a single pinned or
+# re-dated old item cannot hide newer ones behind it
+STALE_LOOKAHEAD = 3
+ATOM_ENTRY = f'{ATOM_NS}entry'
+
+
+class FeedParseError(Exception):
+    """Raised when the fast path cannot handle a feed (caller should fall back)"""
+
+
+def _text(element: Optional[ET.Element]) -> str:
+    """Stripped text of an element, or empty string"""
+    if element is None or element.text is None:
+        return ''
+    return element.text.strip()
+
+
+def _parse_date(value: str) -> Optional[datetime]:
+    """
+    Parse an RFC 822 or ISO 8601 date into naive UTC
+
+    Naive UTC matches what feedparser's *_parsed fields produce.
+    """
+    if not value:
+        return None
+
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = date_parser.parse(value)
+        except (ValueError, OverflowError):
+            return None
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _rss_entry(item: ET.Element) -> Dict:
+    """Extract the fields we need from an RSS <item>"""
+    return {
+        'title': _text(item.find('title')),
+        'link': _text(item.find('link')),
+        'feedburner_origlink': _text(item.find(f'{FEEDBURNER_NS}origLink')),
+        'summary': _text(item.find('description')),
+        'author': _text(item.find('author')) or _text(item.find(f'{DC_NS}creator')),
+        'published': _parse_date(
+            _text(item.find('pubDate')) or _text(item.find(f'{DC_NS}date'))
+        ),
+    }
+
+
+def _atom_entry(entry: ET.Element) -> Dict:
+    """Extract the fields we need from an Atom <entry>"""
+    link = ''
+    for link_el in entry.findall(f'{ATOM_NS}link'):
+        if link_el.get('rel', 'alternate') == 'alternate':
+            link = link_el.get('href', '')
+            break
+
+    return {
+        'title': _text(entry.find(f'{ATOM_NS}title')),
+        'link': link,
+        'summary': _text(entry.find(f'{ATOM_NS}summary')) or _text(entry.find(f'{ATOM_NS}content')),
+        'author': _text(entry.find(f'{ATOM_NS}author/{ATOM_NS}name')),
+        'published': _parse_date(
+            _text(entry.find(f'{ATOM_NS}published')) or _text(entry.find(f'{ATOM_NS}updated'))
+        ),
+    }
+
+
+def iter_entries(body: bytes) -> Iterator[Dict]:
+    """
+    Incrementally yield entries from an RSS or Atom document
+
+    Each entry's element is cleared once read, so stopping early skips
+    the rest of the document entirely.
+
+    Args:
+        body: Raw feed bytes
+
+    Yields:
+        Dictionaries with title, link, summary, author and published
+        (RSS items also carry feedburner_origlink when present)
+    """
+    try:
+        for _, element in ET.iterparse(io.BytesIO(body), events=('end',)):
+            if element.tag == RSS_ITEM:
+                yield _rss_entry(element)
+                element.clear()
+            elif element.tag == ATOM_ENTRY:
+                yield _atom_entry(element)
+                element.clear()
+    except ET.ParseError as e:
+        raise FeedParseError(f"Malformed feed: {e}")
+
+
+def parse_recent_entries(body: bytes, cutoff: datetime, max_entries: int) -> List[Dict]:
+    """
+    Read entries newer than the cutoff from a date-sorted feed
+
+    Stops after STALE_LOOKAHEAD consecutive entries older than the cutoff;
+    a newer entry among them means the feed is not sorted. Entries without
+    a date are skipped, as in the feedparser path.
+
+    Args:
+        body: Raw feed bytes
+        cutoff: Oldest publication date to keep (naive UTC)
+        max_entries: Maximum number of entries to read
+
+    Returns:
+        Entries published after the cutoff, in feed order
+
+    Raises:
+        FeedParseError: If the feed is malformed, empty or not sorted newest-first
+    """
+    entries = []
+    previous = None
+    seen_any = False
+    stale = 0
+
+    for count, entry in enumerate(iter_entries(body), 1):
+        seen_any = True
+        if count > max_entries:
+            break
+
+        published = entry['published']
+        if published is None:
+            continue
+
+        if previous is not None and published > previous:
+            raise FeedParseError("Feed is not sorted newest-first")
+        previous = published
+
+        if published < cutoff:
+            stale += 1
+            if stale >= STALE_LOOKAHEAD:
+                logger.debug(f"Stopped reading feed at entry {count} (past cutoff)")
+                break
+            continue
+
+        entries.append(entry)
+
+    if not seen_any:
+        raise FeedParseError("No RSS items or Atom entries found")
+
+    return entries
@@ -0,0 +1,115 @@
+"""
+HTTP Session Module
+Shared pooled requests session (keep-alive, retries with backoff on 429/5xx,
+compressed transfer) for feed and Jina Reader downloads
+"""
+
+import importlib.util
+import logging
+import os
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import HttpConfig
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying: rate limits and transient server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def accept_encoding() -> str:
+    """Encodings urllib3 can decode here (brotli only if a decoder is installed)"""
+    encodings = ['gzip', 'deflate']
+    if any(importlib.util.find_spec(name) for name in ('brotli', 'brotlicffi')):
+        encodings.append('br')
+    return ', '.join(encodings)
+
+
+class _CappedRetry(Retry):
+    """Retry that never sleeps longer than max_retry_after for a Retry-After header"""
+
+    def __init__(self, *args, max_retry_after: float = 30.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_retry_after = max_retry_after
+
+    def new(self, **kwargs):
+        # urllib3 copies the policy after every attempt
+        kwargs.setdefault('max_retry_after', self.max_retry_after)
+        return super().new(**kwargs)
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.max_retry_after)
+
+
+def create_session(settings: HttpConfig) -> requests.Session:
+    """
+    Build a session with a connection pool, retry policy and compression
+
+    Args:
+        settings: Pool size and retry settings
+
+    Returns:
+        Configured session
+    """
+    retry = _CappedRetry(
+        total=settings.retries,
+        backoff_factor=settings.backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({'GET', 'HEAD'}),
+        # A read timeout is final: retrying would multiply each caller's
+        # timeout, and requests then reports it as requests.Timeout
+        read=False,
+        respect_retry_after_header=True,
+        # Return the last response so callers' raise_for_status() reports it
+        raise_on_status=False,
+        max_retry_after=settings.max_retry_after,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings.pool_hosts,
+        pool_maxsize=settings.pool_size,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Accept-Encoding'] = accept_encoding()
+    return session
+
+
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_session_lock = threading.Lock()
+
+
+def shared_session(settings: HttpConfig) -> requests.Session:
+    """
+    Process-wide session (created on first use)
+
+    Worker processes get their own session instead of the pooled sockets
+    inherited from the parent.
+
+    Args:
+        settings: Used when the session is created
+
+    Returns:
+        The shared session
+    """
+    global _session, _session_pid
+    with _session_lock:
+        if _session is None or _session_pid != os.getpid():
+            _session = create_session(settings)
+            _session_pid = os.getpid()
+            logger.debug(
+                f"HTTP session: {settings.pool_size} connections/host, "
+                f"{settings.retries} retries, Accept-Encoding: {accept_encoding()}"
+            )
+        return _session
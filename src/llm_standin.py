@@ -0,0 +1,403 @@
+"""
+LLM Stand-in Server
+Local OpenAI-compatible chat completions endpoint that behaves like Groq
+under load (latency, 429s with retry-after, token accounting, JSON mode),
+for throughput experiments without spending quota
+
+Usage:
+    python llm_standin.py --port 8010
+    GROQ_BASE_URL=http://localhost:8010 python main.py
+
+Responses are synthetic but well-formed for every prompt the pipeline
+sends (single and batched classification, duplicate checks, summaries).
+Verdicts are deterministic per title. GET /stats returns token totals.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import math
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+from config import AppConfig, ModelRateLimit, load_config
+from utils import TokenBucketLimiter
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger(__name__)
+
+COMPLETIONS_PATH = '/openai/v1/chat/completions'
+STATS_PATH = '/stats'
+
+# Rough token count, as used for the client-side budget estimate
+CHARS_PER_TOKEN = 4
+
+BATCH_ARTICLE = re.compile(r'^\[id (\d+)\]\s*\nTitle: (.*)$', re.MULTILINE)
+SINGLE_TITLE = re.compile(r'^Article Title: (.*)$', re.MULTILINE)
+PAIR_TITLES = re.compile(r'^Title [12]: (.*)$', re.MULTILINE)
+CLUSTER_TITLE = re.compile(r'^(\d+)\. (.*)$', re.MULTILINE)
+MAIN_TITLE = re.compile(r'^Title: (.*)$', re.MULTILINE)
+SOURCE_URL = re.compile(r'^URL: (\S+)$', re.MULTILINE)
+WORD = re.compile(r'[a-z0-9]+')
+
+FILLER = (
+    "The announcement expands availability for enterprise customers and "
+    "developers, with pricing, benchmarks and integration details published "
+    "alongside the release. Analysts expect competitors to respond within weeks."
+).split()
+
+
+def count_tokens(text: str) -> int:
+    """Approximate token count of a text"""
+    return max(1, math.ceil(len(text) / CHARS_PER_TOKEN))
+
+
+def _unit(text: str, salt: str) -> float:
+    """Deterministic number in [0, 1) for a text"""
+    digest = hashlib.blake2b(f"{salt}\x1f{text}".encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') / 2 ** 64
+
+
+def _words(text: str) -> set:
+    return set(WORD.findall(text.lower()))
+
+
+def _similar(title1: str, title2: str, threshold: float = 0.5) -> bool:
+    """Word Jaccard similarity of two titles above threshold"""
+    a, b = _words(title1), _words(title2)
+    return bool(a and b) and len(a & b) / len(a | b) >= threshold
+
+
+class LatencyModel:
+    """Log-normal time to first token plus a fixed generation speed"""
+
+    def __init__(self, median: float, sigma: float, tokens_per_second: float, seed: int = 1):
+        """
+        Initialize latency model
+
+        Args:
+            median: Median seconds before the first token
+            sigma: Log-normal spread (0 = always the median)
+            tokens_per_second: Generation speed for completion tokens
+            seed: Random seed
+        """
+        self.median = median
+        self.sigma = sigma
+        self.tokens_per_second = tokens_per_second
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self, completion_tokens: int) -> float:
+        """Seconds to answer a request with this many output tokens"""
+        with self._lock:
+            first_token = self.median * math.exp(self._rng.gauss(0, self.sigma))
+        return first_token + completion_tokens / self.tokens_per_second
+
+
+class StandinBackend:
+    """Request handling shared by all server threads"""
+
+    def __init__(
+        self,
+        config: AppConfig,
+        latency: LatencyModel,
+        rate_limits: Dict[str, ModelRateLimit],
+        relevant_rate: float = 0.3,
+        error_rate: float = 0.0
+    ):
+        """
+        Initialize backend
+
+        Args:
+            config: Loaded configuration (categories for synthetic verdicts)
+            latency: Response time model
+            rate_limits: Per-model quotas; other models are unlimited
+            relevant_rate: Share of titles classified as relevant
+            error_rate: Share of requests answered with a 503
+        """
+        self.categories = sorted(config.categories.items())
+        self.latency = latency
+        self.relevant_rate = relevant_rate
+        self.error_rate = error_rate
+        self.limiters = {
+            model: TokenBucketLimiter(limit.requests_per_minute, limit.tokens_per_minute)
+            for model, limit in rate_limits.items()
+        }
+
+        self.usage = defaultdict(lambda: {
+            'requests': 0, 'rate_limited': 0, 'errors': 0,
+            'prompt_tokens': 0, 'completion_tokens': 0,
+        })
+        self._usage_lock = threading.Lock()
+        self._rng = random.Random(0)
+
+    def _count(self, model: str, **increments):
+        with self._usage_lock:
+            totals = self.usage[model]
+            for name, value in increments.items():
+                totals[name] += value
+
+    def stats(self) -> Dict:
+        """Per-model request and token totals"""
+        with self._usage_lock:
+            return {model: dict(totals) for model, totals in self.usage.items()}
+
+    def verdict(self, title: str) -> Dict:
+        """Deterministic classification verdict for a title"""
+        name, rule = self.categories[int(_unit(title, 'category') * len(self.categories))]
+        if _unit(title, 'relevant') >= self.relevant_rate:
+            return {
+                'relevant': False,
+                'category': None,
+                'tier': None,
+                'confidence': round(0.1 + 0.4 * _unit(title, 'confidence'), 2),
+                'reason': 'Not relevant to the newsletter focus',
+                'key_signals': [],
+            }
+        return {
+            'relevant': True,
+            'category': name,
+            'tier': rule.tier,
+            'confidence': round(0.55 + 0.44 * _unit(title, 'confidence'), 2),
+            'reason': f'Matches {name}',
+            'key_signals': sorted(_words(title))[:3],
+        }
+
+    def reply(self, request: Dict) -> str:
+        """Synthetic assistant message for the pipeline's prompts"""
+        prompt = request['messages'][-1]['content']
+        json_mode = (request.get('response_format') or {}).get('type') == 'json_object'
+
+        if 'BATCH MODE' in prompt:
+            return json.dumps({'results': [
+                {'id': int(i), **self.verdict(title)}
+                for i, title in BATCH_ARTICLE.findall(prompt)
+            ]})
+
+        if 'Group these article titles' in prompt:
+            titles = {int(i): title for i, title in CLUSTER_TITLE.findall(prompt)}
+            groups: List[List[int]] = []
+            for i, title in titles.items():
+                for group in groups:
+                    if _similar(titles[group[0]], title):
+                        group.append(i)
+                        break
+                else:
+                    groups.append([i])
+            return json.dumps({'groups': [
+                {'ids': group, 'confidence': 0.9 if len(group) > 1 else 1.0} for group in groups
+            ]})
+
+        if '"same_event"' in prompt:
+            titles = PAIR_TITLES.findall(prompt)
+            same = len(titles) == 2 and _similar(*titles)
+            return json.dumps({
+                'same_event': same,
+                'confidence': 0.9,
+                'reason': 'Same announcement' if same else 'Different events',
+            })
+
+        if json_mode:
+            match = SINGLE_TITLE.search(prompt)
+            return json.dumps(self.verdict(match.group(1) if match else prompt[:200]))
+
+        # Summary in the system prompt's format
+        title = MAIN_TITLE.search(prompt)
+        title = title.group(1) if title else 'Untitled'
+        words = (title.split() + FILLER) * 3
+        links = "\n".join(SOURCE_URL.findall(prompt)[:5])
+        return (
+            f"Date: {time.strftime('%Y-%m-%d')}\n"
+            f"Title: {title}\n"
+            f"Summary: {' '.join(words[:120])}\n"
+            f"Links:\n{links}"
+        )
+
+    def handle(self, request: Dict) -> Tuple[int, Dict[str, str], Dict]:
+        """
+        Answer one chat completion request
+
+        Returns:
+            HTTP status, extra headers and JSON body
+        """
+        model = request.get('model', 'unknown')
+        prompt_tokens = sum(count_tokens(m.get('content') or '') for m in request['messages'])
+        content = self.reply(request)
+        completion_tokens = count_tokens(content)
+
+        finish_reason = 'stop'
+        max_tokens = request.get('max_tokens')
+        if max_tokens and completion_tokens > max_tokens:
+            content = content[:max_tokens * CHARS_PER_TOKEN]
+            completion_tokens = max_tokens
+            finish_reason = 'length'
+
+        limiter = self.limiters.get(model)
+        wait = limiter.try_acquire(prompt_tokens + completion_tokens) if limiter else 0.0
+        if wait:
+            self._count(model, rate_limited=1)
+            return 429, {'retry-after': f"{wait:.2f}"}, {'error': {
+                'message': f"Rate limit reached for model `{model}`. "
+                           f"Please try again in {wait:.2f}s.",
+                'type': 'tokens',
+                'code': 'rate_limit_exceeded',
+            }}
+
+        with self._usage_lock:
+            failed = self._rng.random() < self.error_rate
+        if failed:
+            self._count(model, errors=1)
+            return 503, {}, {'error': {
+                'message': 'Service unavailable', 'type': 'internal_server_error',
+            }}
+
+        seconds = self.latency.sample(completion_tokens)
+        time.sleep(seconds)
+        self._count(model, requests=1, prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens)
+
+        return 200, {}, {
+            'id': f"chatcmpl-{uuid.uuid4().hex}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': model,
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': content},
+                'finish_reason': finish_reason,
+            }],
+            'usage': {
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'total_tokens': prompt_tokens + completion_tokens,
+                'total_time': round(seconds, 3),
+            },
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes HTTP requests to the server's backend"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def _send(self, status: int, body: Dict, headers: Optional[Dict[str, str]] = None):
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length)
+        if self.path != COMPLETIONS_PATH:
+            self._send(404, {'error': {'message': f"Unknown path {self.path}"}})
+            return
+        try:
+            request = json.loads(raw)
+            request['messages']
+        except (ValueError, KeyError, TypeError) as e:
+            self._send(400, {'error': {'message': f"Invalid request: {e}"}})
+            return
+        status, headers, body = self.server.backend.handle(request)
+        self._send(status, body, headers)
+
+    def do_GET(self):
+        if self.path == STATS_PATH:
+            self._send(200, self.server.backend.stats())
+        else:
+            self._send(404, {'error': {'message': f"Unknown path {self.path}"}})
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+def serve(backend: StandinBackend, host: str = '127.0.0.1', port: int = 8010) -> ThreadingHTTPServer:
+    """
+    Create the server (call serve_forever() to start it)
+
+    Args:
+        backend: Request handler state
+        host: Interface to bind
+        port: Port to bind (0 = any free port)
+
+    Returns:
+        The HTTP server
+    """
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    server.backend = backend
+    return server
+
+
+def main():
+    """CLI entry point"""
+    parser = argparse.ArgumentParser(description="Run a local Groq stand-in for load tests")
+    parser.add_argument("--host", default='127.0.0.1')
+    parser.add_argument("--port", type=int, default=8010)
+    parser.add_argument("--latency-median", type=float, default=0.4,
+                        help="Median seconds to first token (default: 0.4)")
+    parser.add_argument("--latency-sigma", type=float, default=0.5,
+                        help="Log-normal spread of the first-token time (default: 0.5)")
+    parser.add_argument("--tokens-per-second", type=float, default=300,
+                        help="Completion speed (default: 300)")
+    parser.add_argument("--rpm", type=int, help="Requests/minute for every model "
+                        "(default: classification.rate_limits from sources.yaml)")
+    parser.add_argument("--tpm", type=int, help="Tokens/minute for every model")
+    parser.add_argument("--no-rate-limits", action="store_true",
+                        help="Never answer with 429")
+    parser.add_argument("--relevant-rate", type=float, default=0.3,
+                        help="Share of titles classified as relevant (default: 0.3)")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Share of requests answered with a 503 (default: 0)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    config = load_config()
+    rate_limits = {} if args.no_rate_limits else {
+        model: ModelRateLimit(
+            args.rpm or limit.requests_per_minute,
+            args.tpm or limit.tokens_per_minute,
+        )
+        for model, limit in config.classification.rate_limits.items()
+    }
+
+    backend = StandinBackend(
+        config,
+        LatencyModel(args.latency_median, args.latency_sigma, args.tokens_per_second, args.seed),
+        rate_limits,
+        relevant_rate=args.relevant_rate,
+        error_rate=args.error_rate,
+    )
+    server = serve(backend, args.host, args.port)
+
+    host, port = server.server_address[:2]
+    logger.info(f"🧪 Groq stand-in listening on http://{host}:{port}")
+    logger.info(f"   Point the pipeline at it with GROQ_BASE_URL=http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        logger.info(f"📈 Usage: {json.dumps(backend.stats(), indent=2)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,20 +3,25 @@ Main Orchestrator
 Coordinates the entire article discovery and processing workflow
 """
 
+import argparse
 import os
 import sys
 import logging
-import yaml
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Tuple
 from pathlib import Path
 
+from config import load_config
+from daemon import DiscoveryDaemon
 from feed_discovery import FeedDiscoverer
 from article_classifier import ArticleClassifier
 from article_fetcher import ArticleFetcher
 from research_agent import ResearchAgent
 from summarizer import Summarizer
 from sheets_client import SheetsClient
+from seen_index import SeenIndex
+from event_index import EventIndex
+from models import Article, Classification
 
 # Configure logging
 logging.basicConfig(
@@ -38,16 +43,37 @@ class ArticleProcessor:
         logger.info("🚀 Initializing AI News Aggregator...\n")
         
         try:
+            # Every config file is parsed and validated once, up front
+            self.config = load_config()
+
             # Initialize components
-            self.discoverer = FeedDiscoverer()
-            self.classifier = ArticleClassifier()
-            self.fetcher = ArticleFetcher()
+            self.discoverer = FeedDiscoverer(self.config)
+            self.classifier = ArticleClassifier(config=self.config)
+            self.fetcher = ArticleFetcher(self.config)
             self.researcher = ResearchAgent()
-            self.summarizer = Summarizer()
+            self.summarizer = Summarizer(config=self.config)
             self.sheets = SheetsClient()
 
-            # Load duplicate detection config
-            self._load_dedup_config()
+            # Duplicate detection config
+            self.source_priority = self.config.source_priority
+            self.dedup_enabled = self.config.dedup.enabled
+            self.dedup_threshold = self.config.dedup.confidence_threshold
+
+            # Cross-run index of already classified articles
+            seen = self.config.seen_index
+            self.seen_index = (
+                SeenIndex(seen.path, seen.retention_days) if seen.enabled else None
+            )
+
+            # Stories processed in recent runs (cross-run duplicate detection)
+            events = self.config.event_index
+            self.event_index = (
+                EventIndex(events.path, self.classifier.minhasher, events.retention_days)
+                if events.enabled else None
+            )
+
+            # URLs of articles whose final disposition was saved this batch
+            self.settled_urls = set()
 
             logger.info("✅ All components initialized successfully\n")
             
@@ -55,20 +81,11 @@ class ArticleProcessor:
             logger.error(f"❌ Initialization failed: {e}")
             raise
     
-    def _load_dedup_config(self):
-        """Load duplicate detection settings from sources.yaml"""
-        try:
-            with open("../config/sources.yaml", 'r') as f:
-                config = yaml.safe_load(f)
-            self.source_priority = config.get('source_priority', {})
-            dedup = config.get('duplicate_detection', {})
-            self.dedup_enabled = dedup.get('enabled', False)
-            self.dedup_threshold = dedup.get('confidence_threshold', 0.8)
-        except Exception as e:
-            logger.warning(f"Could not load dedup config, disabling: {e}")
-            self.source_priority = {}
-            self.dedup_enabled = False
-            self.dedup_threshold = 0.8
+    def _record_seen(self, items: List[Classification], disposition: str):
+        """Remember final dispositions so reruns skip these articles"""
+        self.settled_urls.update(item.article.url for item in items if not item.error)
+        if self.seen_index:
+            self.seen_index.record(items, disposition)
 
     def run(self):
         """Execute the complete workflow"""
@@ -80,19 +97,52 @@ class ArticleProcessor:
         logger.info(f"Started at: {start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
 
         try:
-            # Step 1: Discovery
+            # Step 1: Discovery (streamed straight into classification)
             articles = self._discover_articles()
 
-            if not articles:
-                logger.warning("⚠️  No articles found. Exiting.")
+            # Skip articles already classified by a previous run
+            if self.seen_index:
+                articles = self.seen_index.iter_unseen(articles)
+
+            # Steps 2-5: Classify, dedup, process, save
+            classified, processed_count = self.process_batch(articles)
+
+            if not any(classified.values()):
+                logger.warning("⚠️  No new articles found. Exiting.")
                 return
 
-            # Step 2: Classification
-            classified = self._classify_articles(articles)
+            # Summary
+            self._print_summary(start_time, classified, processed_count)
 
+        except Exception as e:
+            logger.error(f"❌ Workflow failed: {e}")
+            raise
+    
+    def process_batch(self, articles: Iterable[Article]) -> Tuple[Dict, int]:
+        """
+        Run steps 2-5 on a batch (or stream) of discovered articles
+
+        Used by the daily run and by daemon micro-batches.
+
+        Args:
+            articles: Discovered, not-yet-seen articles
+
+        Returns:
+            (classification results by tier, number of processed groups)
+        """
+        self.settled_urls = set()
+
+        # Step 2: Classification
+        classified = self._classify_articles(articles)
+
+        processed_count = 0
+        if any(classified.values()):
             # Step 2.5: Duplicate detection & merging
             article_groups = self._detect_duplicates(classified['tier1'])
 
+            # Step 2.6: Attach repeat coverage of stories from earlier runs
+            article_groups = self._attach_known_events(article_groups)
+
             # Step 3: Process article groups (with merged duplicates)
             processed_count = self._process_tier1(article_groups)
 
@@ -102,14 +152,19 @@ class ArticleProcessor:
             # Step 5: Log rejected articles
             self._log_rejected(classified['rejected'])
 
-            # Summary
-            self._print_summary(start_time, classified, processed_count)
+        # Only remember feed validators for sources whose articles all went
+        # through, so failed fetches or sheet writes are retried next run
+        unsettled = {
+            item.article.source
+            for bucket in classified.values()
+            for item in bucket
+            if item.article.url not in self.settled_urls
+        }
+        self.discoverer.save_cache(unsettled)
 
-        except Exception as e:
-            logger.error(f"❌ Workflow failed: {e}")
-            raise
-    
-    def _discover_articles(self) -> List[Dict]:
+        return classified, processed_count
+
+    def _discover_articles(self) -> Iterator[Article]:
         """Step 1: Discover articles from RSS feeds"""
         logger.info("=" * 70)
         logger.info("STEP 1: ARTICLE DISCOVERY")
@@ -125,14 +180,15 @@ class ArticleProcessor:
         
         logger.info("")
         
-        # Fetch articles
-        articles = self.discoverer.fetch_recent_articles()
-        
-        logger.info("")
-        return articles
+        # Stream articles as each source finishes; nothing is fetched
+        # until classification starts consuming the iterator
+        processes = self.config.settings.discovery_processes
+        if processes > 1:
+            return self.discoverer.iter_recent_articles_sharded(processes)
+        return self.discoverer.iter_recent_articles()
     
-    def _classify_articles(self, articles: List[Dict]) -> Dict:
-        """Step 2: Classify articles with AI"""
+    def _classify_articles(self, articles: Iterable[Article]) -> Dict:
+        """Step 2: Classify articles with AI (as they are discovered)"""
         logger.info("=" * 70)
         logger.info("STEP 2: AI CLASSIFICATION")
         logger.info("=" * 70)
@@ -141,7 +197,7 @@ class ArticleProcessor:
         
         return classified
     
-    def _detect_duplicates(self, tier1_articles: List[Dict]) -> List[List[Dict]]:
+    def _detect_duplicates(self, tier1_articles: List[Classification]) -> List[List[Classification]]:
         """Step 2.5: Detect and group duplicate articles"""
         if not self.dedup_enabled or not tier1_articles:
             # Return each article as its own group
@@ -159,7 +215,57 @@ class ArticleProcessor:
 
         return groups
 
-    def _process_tier1(self, article_groups: List[List[Dict]]) -> int:
+    def _attach_known_events(
+        self,
+        article_groups: List[List[Classification]]
+    ) -> List[List[Classification]]:
+        """
+        Step 2.6: Match article groups against stories processed in earlier runs
+
+        Candidates come from the event index's LSH bands and are confirmed
+        with the same LLM check as in-run duplicates. Confirmed groups are
+        added as sources to the existing sheet row and skipped.
+
+        Returns:
+            Groups that still need processing
+        """
+        if not self.event_index or not article_groups:
+            return article_groups
+
+        remaining = []
+        for group in article_groups:
+            article = group[0].article
+            match = None
+            for event in self.event_index.find(article):
+                if self.classifier.is_duplicate(article.title, event.title, self.dedup_threshold):
+                    match = event
+                    break
+
+            if match is None:
+                remaining.append(group)
+                continue
+
+            sources = [
+                {'url': item.article.url, 'title': item.article.title}
+                for item in group
+            ]
+            if self.sheets.add_sources(match.sheet_range, sources, match.title, match.url):
+                logger.info(
+                    f"📚 Already covered: '{article.title[:50]}...' "
+                    f"~ '{match.title[:50]}...' (added to {match.sheet_range})"
+                )
+                self.event_index.add([item.article for item in group], match.sheet_range)
+                self._record_seen(group, 'tier1')
+            else:
+                # The old row is gone, moved or not writable; process as a new story
+                remaining.append(group)
+
+        attached = len(article_groups) - len(remaining)
+        if attached:
+            logger.info(f"📚 Attached {attached} groups to stories from earlier runs\n")
+        return remaining
+
+    def _process_tier1(self, article_groups: List[List[Classification]]) -> int:
         """Step 3: Process Tier 1 article groups (with merged duplicates)"""
         logger.info("=" * 70)
         logger.info("STEP 3: PROCESSING TIER 1 ARTICLES")
@@ -171,37 +277,45 @@ class ArticleProcessor:
 
         logger.info(f"📝 Processing {len(article_groups)} article groups...\n")
 
+        # Fetch every primary article's full text in one parallel sweep
+        urls = [group[0].article.url for group in article_groups]
+        logger.info(f"📥 Fetching full content for {len(urls)} articles...")
+        fetched = self.fetcher.fetch_batch(urls)
+        failed = sum(1 for article in fetched.values() if article.error)
+        logger.info(f"   Fetched {len(fetched) - failed}, failed {failed}\n")
+
         processed_count = 0
 
         for i, group in enumerate(article_groups, 1):
             primary_item = group[0]
-            article = primary_item['article']
-            category = primary_item['category']
-            confidence = primary_item['confidence']
+            article = primary_item.article
+            category = primary_item.category
+            confidence = primary_item.confidence
             duplicate_count = len(group)
 
             if duplicate_count > 1:
                 logger.info(
-                    f"[{i}/{len(article_groups)}] {article['title'][:60]}... "
+                    f"[{i}/{len(article_groups)}] {article.title[:60]}... "
                     f"(merged {duplicate_count} articles)"
                 )
             else:
-                logger.info(f"[{i}/{len(article_groups)}] {article['title'][:60]}...")
+                logger.info(f"[{i}/{len(article_groups)}] {article.title[:60]}...")
             logger.info(f"   Category: {category} | Confidence: {confidence:.2f}")
 
-            try:
-                # Fetch full article
-                logger.info(f"   📥 Fetching full content...")
-                full_article = self.fetcher.fetch(article['url'])
+            full_article = fetched[article.url]
+            if full_article.error:
+                logger.error(f"   ❌ Could not fetch article: {full_article.error}\n")
+                continue
 
+            try:
                 # Collect duplicate URLs as additional sources
                 duplicate_sources = []
                 for dup_item in group[1:]:
-                    dup_article = dup_item['article']
+                    dup_article = dup_item.article
                     duplicate_sources.append({
-                        'url': dup_article.get('url', ''),
-                        'title': dup_article.get('title', ''),
-                        'content': dup_article.get('summary', ''),
+                        'url': dup_article.url,
+                        'title': dup_article.title,
+                        'content': dup_article.summary,
                     })
 
                 # Research related sources
@@ -226,16 +340,21 @@ class ArticleProcessor:
                 # Format for sheets
                 sheet_data = self.summarizer.format_for_sheets(summary, category)
                 sheet_data['confidence'] = confidence
-                sheet_data['source'] = article.get('source_name', '')
+                sheet_data['source'] = article.source_name
                 sheet_data['duplicate_count'] = duplicate_count
+                # The summary may reword the title; keep the one the feed used
+                sheet_data['feed_title'] = article.title
 
                 # Save to Google Sheets
                 logger.info(f"   💾 Saving to Google Sheets...")
-                success = self.sheets.append_row(sheet_data)
+                sheet_range = self.sheets.append_row(sheet_data)
 
-                if success:
+                if sheet_range:
                     logger.info(f"   ✅ Successfully processed\n")
                     processed_count += 1
+                    self._record_seen(group, 'tier1')
+                    if self.event_index:
+                        self.event_index.add([item.article for item in group], sheet_range)
                 else:
                     logger.error(f"   ❌ Failed to save to Sheets\n")
 
@@ -245,7 +364,7 @@ class ArticleProcessor:
 
         return processed_count
     
-    def _save_tier2(self, tier2_articles: List[Dict]):
+    def _save_tier2(self, tier2_articles: List[Classification]):
         """Step 4: Save Tier 2 articles for review"""
         if not tier2_articles:
             return
@@ -260,10 +379,11 @@ class ArticleProcessor:
         
         if success:
             logger.info(f"✅ Review queue updated\n")
+            self._record_seen(tier2_articles, 'tier2')
         else:
             logger.error(f"❌ Failed to update review queue\n")
     
-    def _log_rejected(self, rejected_articles: List[Dict]):
+    def _log_rejected(self, rejected_articles: List[Classification]):
         """Step 5: Log rejected articles"""
         if not rejected_articles:
             return
@@ -278,6 +398,7 @@ class ArticleProcessor:
         
         if success:
             logger.info(f"✅ Rejected log updated\n")
+            self._record_seen(rejected_articles, 'rejected')
         else:
             logger.error(f"❌ Failed to update rejected log\n")
     
@@ -310,9 +431,36 @@ class ArticleProcessor:
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="AI News Aggregator")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep running and poll each source on its own adaptive interval"
+    )
+    parser.add_argument(
+        "--shard",
+        metavar="K/N",
+        help="Only discover shard K of N (stable hash partition of sources), "
+             "for splitting discovery across machines"
+    )
+    args = parser.parse_args()
+
+    shard = None
+    if args.shard:
+        try:
+            index, count = (int(part) for part in args.shard.split('/'))
+        except ValueError:
+            parser.error("--shard must look like K/N, e.g. 0/4")
+        shard = (index, count)
+
     try:
         processor = ArticleProcessor()
-        processor.run()
+        if shard:
+            processor.discoverer.restrict_to_shard(*shard)
+        if args.daemon:
+            DiscoveryDaemon(processor).run()
+        else:
+            processor.run()
         
     except KeyboardInterrupt:
         logger.info("\n\n⚠️  Workflow interrupted by user")
@@ -0,0 +1,55 @@
+"""
+Data Models
+Compact records passed between pipeline stages
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from utils import clean_text
+
+
+@dataclass(slots=True)
+class Article:
+    """An article discovered in an RSS feed"""
+    title: str
+    url: str
+    summary: str = ''
+    published: str = ''
+    source: str = ''
+    source_name: str = ''
+    author: str = ''
+
+
+@dataclass(slots=True)
+class Classification:
+    """AI classification verdict for an article"""
+    article: Article
+    relevant: bool = False
+    category: Optional[str] = None
+    tier: Optional[int] = None
+    confidence: float = 0.0
+    reason: str = ''
+    key_signals: List[str] = field(default_factory=list)
+    error: bool = False
+    model: Optional[str] = None
+
+
+@dataclass(slots=True)
+class FetchedArticle:
+    """
+    Full article text fetched via Jina Reader
+
+    Only the raw text is stored; the cleaned ``content`` is derived on
+    access instead of keeping a second copy of the article in memory.
+    """
+    url: str
+    title: str = 'Untitled'
+    date: Optional[str] = None
+    raw_content: str = ''
+    error: Optional[str] = None
+
+    @property
+    def content(self) -> str:
+        """Whitespace-normalized article text"""
+        return clean_text(self.raw_content)
@@ -0,0 +1,151 @@
+"""
+OPML Import
+Converts an OPML feed list into a source registry merged by config.py
+
+Usage:
+    python opml_import.py feeds.opml
+    python opml_import.py feeds.opml --output ../config/opml_sources.yaml --disabled
+"""
+
+import argparse
+import logging
+import re
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List
+
+import yaml
+
+from config import DEFAULT_CONFIG_DIR, load_config
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTPUT = DEFAULT_CONFIG_DIR / 'opml_sources.yaml'
+
+
+def slugify(text: str) -> str:
+    """Turn a feed title into a config-friendly source id"""
+    slug = re.sub(r'[^a-z0-9]+', '_', text.lower()).strip('_')
+    return slug or 'feed'
+
+
+def parse_opml(path: Path) -> List[Dict]:
+    """
+    Extract feeds from an OPML file (nested outlines are flattened)
+
+    Args:
+        path: OPML file
+
+    Returns:
+        List of {'name', 'url'} dictionaries in document order
+    """
+    tree = ET.parse(path)
+    feeds = []
+
+    for outline in tree.iter('outline'):
+        url = (outline.get('xmlUrl') or '').strip()
+        if not url:
+            continue
+        name = (outline.get('title') or outline.get('text') or url).strip()
+        feeds.append({'name': name, 'url': url})
+
+    return feeds
+
+
+def build_registry(feeds: List[Dict], existing: Dict[str, Dict], enabled: bool) -> Dict[str, Dict]:
+    """
+    Merge new feeds into a registry, skipping URLs that are already known
+
+    Args:
+        feeds: Parsed OPML feeds
+        existing: Current registry contents (id -> source)
+        enabled: Whether newly imported sources are enabled
+
+    Returns:
+        Updated registry (id -> source)
+    """
+    registry = dict(existing)
+    known_ids = set(registry)
+    known_urls = {source['url'] for source in registry.values()}
+
+    # Sources defined in sources.yaml take precedence
+    config = load_config()
+    known_ids.update(source.id for source in config.sources)
+    known_urls.update(source.url for source in config.sources)
+
+    added = 0
+    for feed in feeds:
+        if feed['url'] in known_urls:
+            continue
+
+        base = slugify(feed['name'])
+        source_id, suffix = base, 2
+        while source_id in known_ids:
+            source_id, suffix = f"{base}_{suffix}", suffix + 1
+
+        registry[source_id] = {
+            'name': feed['name'],
+            'url': feed['url'],
+            'enabled': enabled,
+            'priority': 'medium',
+        }
+        known_ids.add(source_id)
+        known_urls.add(feed['url'])
+        added += 1
+
+    logger.info(f"Imported {added} new feeds ({len(feeds) - added} already known)")
+    return registry
+
+
+def main():
+    """CLI entry point"""
+    parser = argparse.ArgumentParser(description="Import an OPML feed list into the source registry")
+    parser.add_argument("opml", type=Path, help="OPML file to import")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT,
+                        help=f"Registry file to update (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--disabled", action="store_true",
+                        help="Import feeds as disabled so they can be reviewed first")
+    args = parser.parse_args()
+
+    try:
+        feeds = parse_opml(args.opml)
+    except (OSError, ET.ParseError) as e:
+        logger.error(f"❌ Could not read OPML file: {e}")
+        return 1
+
+    existing = {}
+    if args.output.exists():
+        with open(args.output, 'r') as f:
+            existing = (yaml.safe_load(f) or {}).get('sources', {})
+
+    registry = build_registry(feeds, existing, enabled=not args.disabled)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, 'w') as f:
+        f.write("# Generated by opml_import.py - merged into sources via source_files\n")
+        yaml.safe_dump({'sources': registry}, f, sort_keys=False, allow_unicode=True)
+
+    logger.info(f"✅ Wrote {len(registry)} sources to {args.output}")
+
+    if args.output.name not in {Path(p).name for p in _listed_registries()}:
+        logger.warning(
+            f"⚠️  {args.output.name} is not listed under source_files in sources.yaml; "
+            f"add it there to use these feeds"
+        )
+    return 0
+
+
+def _listed_registries() -> List[str]:
+    """Registry files referenced by sources.yaml"""
+    with open(DEFAULT_CONFIG_DIR / 'sources.yaml', 'r') as f:
+        return (yaml.safe_load(f) or {}).get('source_files') or []
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""
+Keyword Prefilter Module
+Scores articles against every category's keywords locally, so articles that
+clearly cannot qualify are rejected without an LLM call
+"""
+
+import logging
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from config import AppConfig
+from models import Article, Classification
+from utils import extract_money_amount
+
+logger = logging.getLogger(__name__)
+
+REASON_PREFIX = 'Prefilter:'
+
+# Keywords whose last word is shorter than this are matched exactly, so
+# "ai" does not match "aid" and "fun" does not match "fund"
+MIN_INFLECTED_LENGTH = 4
+
+# Keyword roles within a category
+REQUIRED = 'required'
+STRONG = 'strong'
+WEAK = 'weak'
+EXCLUDE = 'exclude'
+MUST_INCLUDE = 'must_include'
+
+
+def inflections(keyword: str) -> Set[str]:
+    """
+    Surface forms matched for a keyword (launch -> launches, launched, launching)
+
+    Only the last word of a multi-word keyword is inflected, and only if it
+    is at least MIN_INFLECTED_LENGTH letters long.
+    """
+    last_word = keyword.rsplit(' ', 1)[-1]
+    if len(last_word) < MIN_INFLECTED_LENGTH or not last_word.isalpha():
+        return {keyword}
+    if keyword.endswith('e'):
+        return {keyword, keyword + 's', keyword + 'd', keyword[:-1] + 'ing'}
+    if keyword.endswith(('s', 'x', 'z', 'ch', 'sh')):
+        return {keyword, keyword + 'es', keyword + 'ed', keyword + 'ing'}
+    return {keyword, keyword + 's', keyword + 'ed', keyword + 'ing'}
+
+
+class KeywordMatcher:
+    """Finds a fixed set of keywords (and their inflections) with one regex"""
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Compile the keywords into a single alternation
+
+        Args:
+            keywords: Lowercase keywords, single or multi-word
+        """
+        # Surface form -> every keyword it counts as ("launches" is both
+        # an unless keyword and an inflection of the required "launch")
+        self.forms: Dict[str, Set[str]] = defaultdict(set)
+        for keyword in keywords:
+            for form in inflections(keyword):
+                self.forms[form].add(keyword)
+
+        # Longest first so multi-word keywords win over their prefixes
+        alternation = '|'.join(
+            re.escape(form) for form in sorted(self.forms, key=len, reverse=True)
+        )
+        self.pattern = (
+            re.compile(rf'(?<![a-z0-9])(?:{alternation})(?![a-z0-9])') if self.forms else None
+        )
+
+    def find(self, text: str) -> Set[str]:
+        """Keywords occurring in the text"""
+        found = set()
+        if self.pattern is None:
+            return found
+        for form in self.pattern.findall(text.lower()):
+            found.update(self.forms[form])
+        return found
+
+
+class KeywordPrefilter:
+    """One-pass keyword matcher compiled from categories.yaml"""
+
+    def __init__(self, config: AppConfig):
+        """
+        Compile all category and excluded-topic keywords into one matcher
+
+        Args:
+            config: Loaded configuration (categories, excluded_topics, scoring)
+        """
+        scoring = config.scoring
+        self.weights = {
+            REQUIRED: scoring.get('required_keyword_match', 0.4),
+            STRONG: scoring.get('strong_keyword_match', 0.3),
+            WEAK: scoring.get('weak_keyword_match', 0.1),
+        }
+        self.exclude_penalty = scoring.get('exclude_keyword_penalty', -1.0)
+        self.threshold = scoring.get('prefilter_threshold', 0.3)
+
+        self.categories = config.categories
+        self.excluded_topics = config.excluded_topics
+
+        # keyword -> {(category, role)}
+        self.roles: Dict[str, Set[Tuple[str, str]]] = defaultdict(set)
+        for name, rule in self.categories.items():
+            for role, keywords in (
+                (REQUIRED, rule.required),
+                (STRONG, rule.strong),
+                (WEAK, rule.weak),
+                (EXCLUDE, rule.exclude),
+                (MUST_INCLUDE, rule.must_include_one_of),
+            ):
+                for keyword in keywords:
+                    self.roles[keyword].add((name, role))
+
+        keywords = set(self.roles)
+        for topic in self.excluded_topics:
+            keywords.update(topic.keywords, topic.unless)
+
+        self.matcher = KeywordMatcher(keywords)
+
+    def match(self, article: Article) -> Set[str]:
+        """Keywords found in the article's title and summary"""
+        return self.matcher.find(f"{article.title} {article.summary}")
+
+    def score(self, found: Set[str], money: Optional[int] = None) -> Dict[str, float]:
+        """
+        Keyword score per category
+
+        Each matched role adds its scoring weight once; an amount of at
+        least a category's min_amount counts as a strong keyword. An
+        exclude keyword, or a missing must_include_one_of keyword,
+        disqualifies the category.
+        """
+        roles_by_category: Dict[str, Set[str]] = defaultdict(set)
+        for keyword in found:
+            for name, role in self.roles.get(keyword, ()):
+                roles_by_category[name].add(role)
+
+        scores = {}
+        for name, rule in self.categories.items():
+            roles = roles_by_category.get(name, set())
+            if rule.min_amount and money and money >= rule.min_amount:
+                roles.add(STRONG)
+            if EXCLUDE in roles or (rule.must_include_one_of and MUST_INCLUDE not in roles):
+                scores[name] = self.exclude_penalty
+            else:
+                scores[name] = sum(w for role, w in self.weights.items() if role in roles)
+        return scores
+
+    def excluded_topic_hits(self, found: Set[str]) -> List[str]:
+        """Excluded topics whose keywords match without an 'unless' keyword"""
+        return [
+            topic.name for topic in self.excluded_topics
+            if found.intersection(topic.keywords) and not found.intersection(topic.unless)
+        ]
+
+    def check(self, article: Article) -> Optional[Classification]:
+        """
+        Reject an article locally if no category can plausibly match
+
+        Args:
+            article: Article to check
+
+        Returns:
+            A rejected Classification, or None if the article should go to the LLM
+        """
+        found = self.match(article)
+        money = extract_money_amount(f"{article.title} {article.summary}")
+        scores = self.score(found, money)
+        best = max(scores, key=scores.get, default=None)
+
+        if best is not None and scores[best] >= self.threshold:
+            return None
+
+        excluded = sorted(
+            k for k in found if any(role == EXCLUDE for _, role in self.roles.get(k, ()))
+        )
+        if excluded:
+            reason = f"{REASON_PREFIX} excluded by {', '.join(excluded)}"
+        elif best is not None and scores[best] > 0:
+            reason = f"{REASON_PREFIX} best keyword score {scores[best]:.1f} ({best})"
+        else:
+            reason = f"{REASON_PREFIX} no category keywords matched"
+        topics = self.excluded_topic_hits(found)
+        if topics:
+            reason += f"; looks like {', '.join(topics)}"
+
+        logger.debug(f"Prefiltered '{article.title[:50]}...': {reason}")
+
+        return Classification(
+            article=article,
+            relevant=False,
+            confidence=0.0,
+            reason=reason,
+            key_signals=sorted(found),
+        )
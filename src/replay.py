@@ -0,0 +1,451 @@
+"""
+Record/Replay Module
+Saves responses from Groq, Tavily, Jina Reader, Google Sheets and feed
+downloads to cassette files, and replays them offline with the recorded
+(or scaled) latencies
+
+    REPLAY_MODE=record python main.py      # live run, responses saved
+    REPLAY_MODE=replay python main.py      # no network or API keys needed
+
+REPLAY_DIR picks the cassette directory (default: cache/cassettes) and
+REPLAY_LATENCY_SCALE scales recorded latencies on replay (1 = as recorded,
+0.5 = twice as fast, 0 = no waiting). Replays on a later day still apply
+the discovery cutoff, so raise settings.fetch_hours to keep the recorded
+articles.
+
+Both modes disable the cross-run caches (see config.load_config) and
+discover sources in config order, so a replay makes exactly the calls that
+were recorded.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+
+logger = logging.getLogger(__name__)
+
+MODE_ENV = 'REPLAY_MODE'
+DIR_ENV = 'REPLAY_DIR'
+SCALE_ENV = 'REPLAY_LATENCY_SCALE'
+
+LIVE = 'live'
+RECORD = 'record'
+REPLAY = 'replay'
+
+DEFAULT_DIR = Path(__file__).resolve().parent.parent / 'cache' / 'cassettes'
+
+
+class CassetteMiss(LookupError):
+    """No recorded response matches a call made during replay"""
+
+
+class ReplayedError(Exception):
+    """An error the live service raised while recording"""
+
+
+@dataclass(slots=True)
+class Recording:
+    """One recorded call"""
+    operation: str
+    key: str
+    response: Any
+    error: Optional[Dict]
+    latency: float
+
+
+def _request_key(operation: str, request: Dict) -> str:
+    """Stable hash of an operation and its arguments"""
+    payload = json.dumps([operation, request], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _describe_error(error: Exception) -> Dict:
+    """JSON-safe description of a live error"""
+    response = getattr(error, 'response', None)
+    return {
+        'type': type(error).__name__,
+        'message': str(error),
+        'status': getattr(response, 'status_code', None),
+        'headers': dict(getattr(response, 'headers', None) or {}),
+    }
+
+
+class Cassette:
+    """Per-service JSONL files of recorded calls"""
+
+    def __init__(self, directory: Union[str, Path], mode: str, latency_scale: float = 1.0):
+        """
+        Initialize cassette
+
+        Args:
+            directory: Directory holding one <service>.jsonl file per service
+            mode: RECORD or REPLAY
+            latency_scale: Multiplier for recorded latencies on replay
+        """
+        self.directory = Path(directory)
+        self.mode = mode
+        self.latency_scale = latency_scale
+
+        self._lock = threading.Lock()
+        self._recordings: Dict[str, List[Recording]] = {}
+        self._by_key: Dict[str, Dict[str, List[int]]] = {}
+        self._by_operation: Dict[str, Dict[str, List[int]]] = {}
+        self._used: Dict[str, Set[int]] = defaultdict(set)
+
+        if mode == RECORD:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, service: str) -> Path:
+        return self.directory / f"{service}.jsonl"
+
+    def _load(self, service: str):
+        """Index a service's recordings (once, under the lock)"""
+        if service in self._recordings:
+            return
+
+        recordings = []
+        path = self._path(service)
+        if path.exists():
+            with open(path, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        recordings.append(Recording(
+                            entry['operation'], entry['key'], entry.get('response'),
+                            entry.get('error'), entry.get('latency', 0.0)
+                        ))
+
+        by_key, by_operation = defaultdict(list), defaultdict(list)
+        for i, recording in enumerate(recordings):
+            by_key[recording.key].append(i)
+            by_operation[recording.operation].append(i)
+
+        self._recordings[service] = recordings
+        self._by_key[service] = by_key
+        self._by_operation[service] = by_operation
+        logger.debug(f"📼 Loaded {len(recordings)} {service} recordings from {path}")
+
+    def _next(self, service: str, operation: str, key: str, strict: bool) -> Recording:
+        """
+        Next recording for a call
+
+        Identical calls replay their recordings in order (the last one
+        repeats). Without strict matching, a call whose arguments changed
+        since recording (e.g. today's date in a row) takes the next unused
+        recording of the same operation.
+        """
+        with self._lock:
+            self._load(service)
+            used = self._used[service]
+
+            candidates = self._by_key[service].get(key, [])
+            if not candidates and not strict:
+                candidates = self._by_operation[service].get(operation, [])
+            unused = [i for i in candidates if i not in used]
+            if not unused and not candidates:
+                raise CassetteMiss(
+                    f"No {service} recording for {operation} in {self.directory} "
+                    f"(record it with {MODE_ENV}={RECORD})"
+                )
+
+            index = unused[0] if unused else candidates[-1]
+            used.add(index)
+            return self._recordings[service][index]
+
+    def _save(self, service: str, operation: str, key: str, request: Dict,
+              response: Any, error: Optional[Dict], latency: float):
+        """Append one recording to the service's file"""
+        line = json.dumps({
+            'operation': operation,
+            'key': key,
+            'request': request,
+            'response': response,
+            'error': error,
+            'latency': round(latency, 4),
+        }, default=str)
+        with self._lock:
+            with open(self._path(service), 'a') as f:
+                f.write(line + '\n')
+
+    def call(
+        self,
+        service: str,
+        operation: str,
+        request: Dict,
+        live: Callable[[], Any],
+        encode: Callable[[Any], Any] = lambda response: response,
+        decode: Callable[[Any], Any] = lambda data: data,
+        rebuild_error: Optional[Callable[[Dict], Exception]] = None,
+        strict: bool = True
+    ) -> Any:
+        """
+        Make a call live (recording it) or replay its recording
+
+        Args:
+            service: Cassette file name (groq, tavily, jina, sheets, feeds)
+            operation: Method being called
+            request: Arguments identifying the call (JSON-serializable)
+            live: Performs the real call
+            encode: Response -> JSON-serializable data
+            decode: Recorded data -> response object
+            rebuild_error: Recorded error -> exception to raise
+            strict: Require identical arguments on replay
+
+        Returns:
+            The live or replayed response
+        """
+        key = _request_key(operation, request)
+
+        if self.mode == REPLAY:
+            recording = self._next(service, operation, key, strict)
+            if recording.latency and self.latency_scale > 0:
+                time.sleep(recording.latency * self.latency_scale)
+            if recording.error:
+                if rebuild_error:
+                    raise rebuild_error(recording.error)
+                raise ReplayedError(f"{recording.error['type']}: {recording.error['message']}")
+            return decode(recording.response)
+
+        started = time.monotonic()
+        try:
+            response = live()
+        except Exception as e:
+            self._save(service, operation, key, request, None, _describe_error(e),
+                       time.monotonic() - started)
+            raise
+        self._save(service, operation, key, request, encode(response), None,
+                   time.monotonic() - started)
+        return response
+
+
+_cassette: Optional[Cassette] = None
+_cassette_lock = threading.Lock()
+
+
+def mode() -> str:
+    """Current mode from REPLAY_MODE (live, record or replay)"""
+    value = os.getenv(MODE_ENV, LIVE).strip().lower() or LIVE
+    if value not in (LIVE, RECORD, REPLAY):
+        raise ValueError(f"{MODE_ENV} must be {LIVE}, {RECORD} or {REPLAY}, not {value!r}")
+    return value
+
+
+def replaying() -> bool:
+    """Whether calls are served from cassettes (no API keys needed)"""
+    return mode() == REPLAY
+
+
+def active_cassette() -> Optional[Cassette]:
+    """Process-wide cassette, or None in live mode"""
+    global _cassette
+    current = mode()
+    if current == LIVE:
+        return None
+    with _cassette_lock:
+        if _cassette is None or _cassette.mode != current:
+            directory = Path(os.getenv(DIR_ENV) or DEFAULT_DIR)
+            scale = float(os.getenv(SCALE_ENV, '1'))
+            _cassette = Cassette(directory, current, scale)
+            logger.info(f"📼 {current.capitalize()} mode: cassettes in {directory}")
+        return _cassette
+
+
+# ---------------------------------------------------------------------------
+# Groq
+
+
+def _groq_error(error: Dict) -> Exception:
+    """Rebuild a Groq SDK exception so retry handling behaves as recorded"""
+    import httpx
+    from groq import APIConnectionError, APIStatusError, InternalServerError, RateLimitError
+
+    request = httpx.Request('POST', 'https://api.groq.com/openai/v1/chat/completions')
+    status = error.get('status')
+    if status is None:
+        return APIConnectionError(message=error['message'], request=request)
+
+    response = httpx.Response(status, headers=error.get('headers') or {}, request=request)
+    if status == 429:
+        return RateLimitError(error['message'], response=response, body=None)
+    if status >= 500:
+        return InternalServerError(error['message'], response=response, body=None)
+    return APIStatusError(error['message'], response=response, body=None)
+
+
+def _decode_completion(data: Dict):
+    from groq.types.chat import ChatCompletion
+    return ChatCompletion.model_validate(data)
+
+
+class _GroqClient:
+    """Groq client stand-in exposing chat.completions.create"""
+
+    def __init__(self, cassette: Cassette, factory: Callable[[], Any]):
+        self._cassette = cassette
+        self._client = factory() if cassette.mode == RECORD else None
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **request):
+        return self._cassette.call(
+            'groq', 'chat.completions.create', request,
+            live=lambda: self._client.chat.completions.create(**request),
+            encode=lambda response: response.model_dump(mode='json'),
+            decode=_decode_completion,
+            rebuild_error=_groq_error,
+        )
+
+
+def wrap_groq(factory: Callable[[], Any]):
+    """
+    Groq client for the current mode
+
+    Args:
+        factory: Builds the real client (not called when replaying)
+    """
+    cassette = active_cassette()
+    return _GroqClient(cassette, factory) if cassette else factory()
+
+
+# ---------------------------------------------------------------------------
+# Tavily
+
+
+class _TavilyClient:
+    """Tavily client stand-in exposing search"""
+
+    def __init__(self, cassette: Cassette, factory: Callable[[], Any]):
+        self._cassette = cassette
+        self._client = factory() if cassette.mode == RECORD else None
+
+    def search(self, **request):
+        return self._cassette.call(
+            'tavily', 'search', request,
+            live=lambda: self._client.search(**request),
+        )
+
+
+def wrap_tavily(factory: Callable[[], Any]):
+    """Tavily client for the current mode (factory not called when replaying)"""
+    cassette = active_cassette()
+    return _TavilyClient(cassette, factory) if cassette else factory()
+
+
+# ---------------------------------------------------------------------------
+# HTTP (Jina Reader, feeds)
+
+
+def _encode_response(response) -> Dict:
+    return {
+        'status': response.status_code,
+        'reason': response.reason,
+        'url': response.url,
+        'headers': dict(response.headers),
+        'body': base64.b64encode(response.content).decode('ascii'),
+    }
+
+
+def _decode_response(data: Dict):
+    import requests
+    from requests.structures import CaseInsensitiveDict
+    from requests.utils import get_encoding_from_headers
+
+    response = requests.Response()
+    response.status_code = data['status']
+    response.reason = data.get('reason')
+    response.url = data.get('url')
+    response.headers = CaseInsensitiveDict(data.get('headers') or {})
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = base64.b64decode(data['body'])
+    return response
+
+
+def _http_error(error: Dict) -> Exception:
+    """Rebuild a requests exception (timeouts stay timeouts)"""
+    import requests
+    exception = getattr(requests.exceptions, error['type'], None)
+    if not (isinstance(exception, type) and issubclass(exception, requests.RequestException)):
+        exception = requests.RequestException
+    return exception(error['message'])
+
+
+class _HttpClient:
+    """requests stand-in exposing get"""
+
+    def __init__(self, cassette: Cassette, client, service: str):
+        self._cassette = cassette
+        self._client = client
+        self._service = service
+
+    def get(self, url: str, **kwargs):
+        # Headers and timeouts vary between runs (conditional GETs), the URL doesn't
+        request = {'url': url, 'params': kwargs.get('params')}
+        return self._cassette.call(
+            self._service, 'get', request,
+            live=lambda: self._client.get(url, **kwargs),
+            encode=_encode_response,
+            decode=_decode_response,
+            rebuild_error=_http_error,
+        )
+
+
+def wrap_http(client, service: str):
+    """
+    HTTP client for the current mode
+
+    Args:
+        client: requests module or Session
+        service: Cassette name (jina, feeds)
+    """
+    cassette = active_cassette()
+    return _HttpClient(cassette, client, service) if cassette else client
+
+
+# ---------------------------------------------------------------------------
+# Google Sheets
+
+
+class _SheetsCall:
+    """Records a googleapiclient call chain until execute()"""
+
+    def __init__(self, cassette: Cassette, service: Callable[[], Any], chain=()):
+        self._cassette = cassette
+        self._service = service
+        self._chain = chain
+
+    def __getattr__(self, name: str):
+        def step(**kwargs):
+            return _SheetsCall(self._cassette, self._service, self._chain + ((name, kwargs),))
+        return step
+
+    def _live(self):
+        target = self._service()
+        for name, kwargs in self._chain:
+            target = getattr(target, name)(**kwargs)
+        return target.execute()
+
+    def execute(self):
+        operation = '.'.join(name for name, _ in self._chain)
+        # Rows carry today's date, so replays fall back to recording order
+        return self._cassette.call(
+            'sheets', operation, {'chain': [list(step) for step in self._chain]},
+            live=self._live,
+            strict=False,
+        )
+
+
+def wrap_sheets(factory: Callable[[], Any]):
+    """Sheets API service for the current mode (factory not called when replaying)"""
+    cassette = active_cassette()
+    if not cassette:
+        return factory()
+    service = factory() if cassette.mode == RECORD else None
+    return _SheetsCall(cassette, lambda: service)
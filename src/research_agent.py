@@ -8,6 +8,8 @@ import logging
 from typing import List, Dict, Optional
 from tavily import TavilyClient
 
+from models import Article
+import replay
 from utils import clean_text, validate_url
 
 logger = logging.getLogger(__name__)
@@ -24,10 +26,10 @@ class ResearchAgent:
             tavily_api_key: Tavily API key (or from environment)
         """
         api_key = tavily_api_key or os.getenv('TAVILY_API_KEY')
-        if not api_key:
+        if not api_key and not replay.replaying():
             raise ValueError("TAVILY_API_KEY must be provided or set in environment")
         
-        self.client = TavilyClient(api_key=api_key)
+        self.client = replay.wrap_tavily(lambda: TavilyClient(api_key=api_key))
     
     def research(
         self,
@@ -94,20 +96,20 @@ class ResearchAgent:
     
     def research_article(
         self,
-        article: Dict,
+        article: Article,
         max_results: int = 10
     ) -> List[Dict]:
         """
         Research related sources for an article
         
         Args:
-            article: Article dictionary with title
+            article: Article with title
             max_results: Maximum results
             
         Returns:
             List of related sources
         """
-        query = article.get('title', '')
+        query = article.title
         
         if not query:
             logger.warning("No title provided for research")
@@ -0,0 +1,161 @@
+"""
+Rule Engine Module
+Applies every categories.yaml constraint (min_amount, exclude,
+must_include_one_of, min_confidence, excluded_topics) to model verdicts
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from config import AppConfig
+from models import Classification
+from prefilter import KeywordMatcher
+from utils import extract_money_amount
+
+logger = logging.getLogger(__name__)
+
+# Confidence deducted from a verdict that breaks any rule
+RULE_PENALTY = 0.3
+
+# Confidence deducted when an excluded topic's keywords appear; a signal
+# only, since phrases like "will be" or "future" also occur in real news
+TOPIC_PENALTY = 0.1
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledCategory:
+    """A category's post-classification constraints"""
+    exclude: frozenset
+    must_include_one_of: Tuple[str, ...]
+    min_confidence: float
+    min_amount: Optional[int]
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledTopic:
+    """An excluded_topics entry"""
+    name: str
+    keywords: frozenset
+    unless: frozenset
+    min_amount: Optional[int]
+
+
+class RuleEngine:
+    """Category rules compiled once and checked in a single pass per verdict"""
+
+    def __init__(self, config: AppConfig):
+        """
+        Compile every category and excluded-topic rule
+
+        Args:
+            config: Loaded configuration (categories, excluded_topics)
+        """
+        self.categories: Dict[str, CompiledCategory] = {
+            name: CompiledCategory(
+                exclude=frozenset(rule.exclude),
+                must_include_one_of=rule.must_include_one_of,
+                min_confidence=rule.min_confidence,
+                min_amount=rule.min_amount,
+            )
+            for name, rule in config.categories.items()
+        }
+        self.topics: List[CompiledTopic] = [
+            CompiledTopic(
+                name=topic.name,
+                keywords=frozenset(topic.keywords),
+                unless=frozenset(topic.unless),
+                min_amount=topic.min_amount,
+            )
+            for topic in config.excluded_topics
+        ]
+
+        keywords = set()
+        for rule in config.categories.values():
+            keywords.update(rule.exclude, rule.must_include_one_of)
+        for topic in config.excluded_topics:
+            keywords.update(topic.keywords, topic.unless)
+        self.matcher = KeywordMatcher(keywords)
+
+    def check(self, result: Classification) -> Tuple[List[str], List[str]]:
+        """
+        Rules a relevant verdict breaks, and excluded topics it resembles
+
+        Args:
+            result: Model verdict for an article
+
+        Returns:
+            (violations, topic signals) as human-readable strings
+        """
+        category = self.categories.get(result.category)
+        if not result.relevant or category is None:
+            return [], []
+
+        article = result.article
+        text = f"{article.title} {article.summary}"
+        found = self.matcher.find(text)
+        money = extract_money_amount(text)
+
+        problems = []
+        signals = []
+        if category.min_amount and money and money < category.min_amount:
+            problems.append(f"Funding ${money:,} below threshold")
+
+        excluded = sorted(category.exclude & found)
+        if excluded:
+            problems.append(f"excluded keyword: {', '.join(excluded)}")
+
+        if category.must_include_one_of and not found.intersection(category.must_include_one_of):
+            problems.append(f"missing one of: {', '.join(category.must_include_one_of)}")
+
+        if result.confidence < category.min_confidence:
+            problems.append(
+                f"confidence {result.confidence:.2f} below {category.min_confidence:.2f}"
+            )
+
+        for topic in self.topics:
+            if not found & topic.keywords or found & topic.unless:
+                continue
+            if topic.min_amount is None:
+                signals.append(f"looks like {topic.name}")
+            elif money and money < topic.min_amount:
+                problems.append(f"Funding ${money:,} below threshold")
+
+        # The category floor and a topic floor can report the same amount
+        return list(dict.fromkeys(problems)), signals
+
+    def violations(self, result: Classification) -> List[str]:
+        """Rules a relevant verdict breaks (empty if every rule passes)"""
+        return self.check(result)[0]
+
+    def apply(self, result: Classification) -> Classification:
+        """
+        Demote a verdict that breaks any rule (in place)
+
+        A violating verdict becomes irrelevant, loses RULE_PENALTY
+        confidence once, and has the violations appended to its reason.
+        Otherwise an excluded-topic match only costs TOPIC_PENALTY, leaving
+        the tier thresholds to decide.
+        """
+        problems, signals = self.check(result)
+        if problems:
+            result.relevant = False
+            result.confidence = max(result.confidence - RULE_PENALTY, 0)
+            result.reason += f" ({'; '.join(problems + signals)})"
+            logger.debug(f"Rules rejected '{result.article.title[:50]}...': {problems}")
+        elif signals:
+            result.confidence = max(result.confidence - TOPIC_PENALTY, 0)
+            result.reason += f" ({'; '.join(signals)})"
+            logger.debug(f"Topic signals for '{result.article.title[:50]}...': {signals}")
+        return result
+
+    def apply_batch(self, results: List[Classification]) -> List[Classification]:
+        """Apply the rules to a whole batch of verdicts, keeping order"""
+        demoted = 0
+        for result in results:
+            was_relevant = result.relevant
+            self.apply(result)
+            demoted += was_relevant and not result.relevant
+        if demoted:
+            logger.debug(f"Rules rejected {demoted} of {len(results)} verdicts")
+        return results
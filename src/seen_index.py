@@ -0,0 +1,170 @@
+"""
+Seen Article Index Module
+Remembers classified articles across runs so reruns skip paid re-classification
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable, Iterator, List, Union
+
+from models import Article, Classification
+from utils import canonicalize_url, clean_text
+
+logger = logging.getLogger(__name__)
+
+
+class SeenIndex:
+    """SQLite index of articles keyed by canonical URL and content hash"""
+
+    DISPOSITIONS = ('tier1', 'tier2', 'rejected')
+
+    def __init__(
+        self,
+        db_path: Union[str, Path] = "../cache/seen_articles.db",
+        retention_days: int = 30
+    ):
+        """
+        Initialize seen index
+
+        Args:
+            db_path: Path to the SQLite database file
+            retention_days: Entries older than this are pruned on open
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.retention_days = retention_days
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS seen_articles (
+                url TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                disposition TEXT NOT NULL,
+                title TEXT,
+                seen_at TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_seen_content_hash "
+            "ON seen_articles (content_hash)"
+        )
+        self._conn.commit()
+        self.prune()
+
+    @staticmethod
+    def content_hash(article: Article) -> str:
+        """Hash of the normalized title and summary"""
+        text = (
+            clean_text(article.title).lower() + '\n' +
+            clean_text(article.summary).lower()
+        )
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def is_seen(self, article: Article) -> bool:
+        """Check whether an article (or an identical copy) was already classified"""
+        url = canonicalize_url(article.url)
+        # Empty entries would all share one hash, so match those by URL only
+        has_text = article.title or article.summary
+        digest = self.content_hash(article) if has_text else None
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM seen_articles WHERE url = ? OR content_hash = ? LIMIT 1",
+                (url, digest)
+            ).fetchone()
+        return row is not None
+
+    def filter_unseen(self, articles: List[Article]) -> List[Article]:
+        """
+        Drop articles that were classified in a previous run
+
+        Args:
+            articles: Discovered articles
+
+        Returns:
+            Articles not present in the index
+        """
+        unseen = [article for article in articles if not self.is_seen(article)]
+
+        skipped = len(articles) - len(unseen)
+        if skipped:
+            logger.info(f"⏭️  Skipping {skipped} articles already seen in previous runs")
+        return unseen
+
+    def iter_unseen(self, articles: Iterable[Article]) -> Iterator[Article]:
+        """
+        Lazily drop articles that were classified in a previous run
+
+        Args:
+            articles: Discovered articles (may be a stream)
+
+        Yields:
+            Articles not present in the index
+        """
+        skipped = 0
+        for article in articles:
+            if self.is_seen(article):
+                skipped += 1
+                continue
+            yield article
+
+        if skipped:
+            logger.info(f"⏭️  Skipped {skipped} articles already seen in previous runs")
+
+    def record(self, items: List[Classification], disposition: str):
+        """
+        Record the final disposition of classified articles
+
+        Args:
+            items: Classification results
+            disposition: One of 'tier1', 'tier2' or 'rejected'
+        """
+        if disposition not in self.DISPOSITIONS:
+            raise ValueError(f"Unknown disposition: {disposition}")
+
+        now = datetime.now().isoformat()
+        rows = []
+        for item in items:
+            # Transient API failures must be retried next run
+            if item.error:
+                continue
+            article = item.article
+            rows.append((
+                canonicalize_url(article.url),
+                self.content_hash(article),
+                disposition,
+                article.title,
+                now
+            ))
+
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO seen_articles "
+                "(url, content_hash, disposition, title, seen_at) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+        logger.debug(f"Recorded {len(rows)} articles as {disposition}")
+
+    def prune(self):
+        """Delete entries older than the retention window"""
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).isoformat()
+        with self._lock:
+            self._conn.execute("DELETE FROM seen_articles WHERE seen_at < ?", (cutoff,))
+            self._conn.commit()
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -4,6 +4,7 @@ Handles reading from and writing to Google Sheets
 """
 
 import os
+import re
 import json
 import logging
 from typing import Dict, List, Optional
@@ -13,6 +14,10 @@ from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from models import Classification
+from utils import canonicalize_url
+import replay
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,6 +38,19 @@ class SheetsClient:
             credentials_json: JSON string of service account credentials
             sheet_id: Google Sheet ID
         """
+        # Get sheet ID
+        self.sheet_id = sheet_id or os.getenv('GOOGLE_SHEET_ID')
+        if not self.sheet_id:
+            if not replay.replaying():
+                raise ValueError("GOOGLE_SHEET_ID must be provided or set in environment")
+            self.sheet_id = 'replay'
+        
+        # Build service (credentials are not needed when replaying)
+        self.creds = None
+        self.service = replay.wrap_sheets(lambda: self._build_service(credentials_json))
+    
+    def _build_service(self, credentials_json: Optional[str]):
+        """Authenticate with the service account and build the Sheets API service"""
         # Get credentials from argument or environment
         creds_json = credentials_json or os.getenv('GOOGLE_SHEETS_CREDENTIALS')
         if not creds_json:
@@ -40,11 +58,6 @@ class SheetsClient:
                 "GOOGLE_SHEETS_CREDENTIALS must be provided or set in environment"
             )
         
-        # Get sheet ID
-        self.sheet_id = sheet_id or os.getenv('GOOGLE_SHEET_ID')
-        if not self.sheet_id:
-            raise ValueError("GOOGLE_SHEET_ID must be provided or set in environment")
-        
         # Parse credentials
         try:
             creds_dict = json.loads(creds_json)
@@ -57,14 +70,13 @@ class SheetsClient:
             scopes=self.SCOPES
         )
         
-        # Build service
-        self.service = build('sheets', 'v4', credentials=self.creds)
+        return build('sheets', 'v4', credentials=self.creds)
     
     def append_row(
         self,
         data: Dict,
         sheet_name: str = 'Processed Articles'
-    ) -> bool:
+    ) -> Optional[str]:
         """
         Append a row to the specified sheet
         
@@ -73,7 +85,8 @@ class SheetsClient:
             sheet_name: Name of the sheet tab
             
         Returns:
-            True if successful
+            A1 range of the new row (e.g. "'Processed Articles'!A57:J57")
+            if successful, else None
         """
         try:
             # Build row from data
@@ -87,11 +100,15 @@ class SheetsClient:
                 data.get('source_count', 0),
                 data.get('confidence', ''),
                 datetime.now().isoformat(),
-                data.get('duplicate_count', 1)
+                data.get('duplicate_count', 1),
+                # K (Published) and L (Sent) belong to the newsletter editor
+                '',
+                '',
+                data.get('feed_title', '')
             ]
 
             # Append to sheet
-            range_name = f"{sheet_name}!A:J"
+            range_name = f"{sheet_name}!A:M"
             
             body = {'values': [row]}
             
@@ -103,19 +120,97 @@ class SheetsClient:
                 body=body
             ).execute()
             
-            logger.debug(f"Appended row to {sheet_name}")
-            return True
+            updated_range = result.get('updates', {}).get('updatedRange')
+            logger.debug(f"Appended row to {updated_range or sheet_name}")
+            return updated_range or range_name
             
         except HttpError as e:
             logger.error(f"HTTP error appending to sheet: {e}")
-            return False
+            return None
         except Exception as e:
             logger.error(f"Error appending to sheet: {e}")
+            return None
+    
+    def add_sources(
+        self,
+        row_range: str,
+        sources: List[Dict],
+        expected_title: Optional[str] = None,
+        expected_url: Optional[str] = None
+    ) -> bool:
+        """
+        Attach extra source URLs to an already processed article row
+        
+        Appends to the Sources column and bumps Source Count and
+        Duplicate Count. Rows can move when the sheet is sorted or edited,
+        so with expected_title the row is only updated if it still holds
+        that story: the title matches its Title or Feed Title column, or
+        expected_url is among its Sources.
+        
+        Args:
+            row_range: Range returned by append_row
+            sources: Source dictionaries with a 'url' key
+            expected_title: Title the row was stored under
+            expected_url: Canonical article URL the row was stored under
+            
+        Returns:
+            True if successful, False on failure or if the row no longer
+            holds the expected story
+        """
+        match = re.match(r"^(.*)!A?(\d+)", row_range)
+        if not match or not sources:
+            return False
+        sheet_name, row = match.group(1), match.group(2)
+        
+        try:
+            # D (Title) through M (Feed Title); F:J are the columns updated
+            result = self.service.spreadsheets().values().get(
+                spreadsheetId=self.sheet_id,
+                range=f"{sheet_name}!D{row}:M{row}"
+            ).execute()
+            
+            row_values = (result.get('values') or [[]])[0]
+            row_values += [''] * (10 - len(row_values))
+            title, feed_title = row_values[0], row_values[9]
+            values = row_values[2:7]
+            
+            urls = [u for u in str(values[0]).split('\n') if u]
+            if expected_title is not None:
+                expected = expected_title.strip().casefold()
+                titles = {str(title).strip().casefold(), str(feed_title).strip().casefold()}
+                canonical = {canonicalize_url(url) for url in urls}
+                if expected not in titles and expected_url not in canonical:
+                    logger.warning(
+                        f"⚠️  {row_range} no longer holds '{expected_title[:50]}...' "
+                        f"(found '{str(title)[:50]}'); not adding sources"
+                    )
+                    return False
+            
+            urls += [s['url'] for s in sources if s.get('url') and s['url'] not in urls]
+            values[0] = '\n'.join(urls)
+            values[1] = len(urls)
+            try:
+                values[4] = int(values[4] or 1) + len(sources)
+            except ValueError:
+                values[4] = 1 + len(sources)
+            
+            self.service.spreadsheets().values().update(
+                spreadsheetId=self.sheet_id,
+                range=f"{sheet_name}!F{row}:J{row}",
+                valueInputOption='RAW',
+                body={'values': [values]}
+            ).execute()
+            
+            logger.debug(f"Added {len(sources)} sources to {row_range}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error adding sources to {row_range}: {e}")
             return False
     
     def save_to_review_tab(
         self,
-        articles: List[Dict],
+        articles: List[Classification],
         sheet_name: str = 'Review Queue'
     ) -> bool:
         """
@@ -132,17 +227,17 @@ class SheetsClient:
             rows = []
             
             for item in articles:
-                article = item.get('article', {})
+                article = item.article
                 
                 row = [
-                    article.get('published', ''),
-                    article.get('source_name', ''),
-                    item.get('category', ''),
-                    article.get('title', ''),
-                    article.get('summary', ''),
-                    item.get('confidence', ''),
-                    item.get('reason', ''),
-                    article.get('url', '')
+                    article.published,
+                    article.source_name,
+                    item.category or '',
+                    article.title,
+                    article.summary,
+                    item.confidence,
+                    item.reason,
+                    article.url
                 ]
                 
                 rows.append(row)
@@ -172,7 +267,7 @@ class SheetsClient:
     
     def save_rejected_log(
         self,
-        articles: List[Dict],
+        articles: List[Classification],
         sheet_name: str = 'Rejected Log'
     ) -> bool:
         """
@@ -189,14 +284,14 @@ class SheetsClient:
             rows = []
             
             for item in articles:
-                article = item.get('article', {})
+                article = item.article
                 
                 row = [
-                    article.get('published', ''),
-                    article.get('source_name', ''),
-                    article.get('title', ''),
-                    item.get('reason', ''),
-                    article.get('url', '')
+                    article.published,
+                    article.source_name,
+                    article.title,
+                    item.reason,
+                    article.url
                 ]
                 
                 rows.append(row)
@@ -224,6 +319,29 @@ class SheetsClient:
             logger.error(f"Error saving rejected log: {e}")
             return False
     
+    def read_rows(self, sheet_name: str, columns: str = 'A:J') -> List[List[str]]:
+        """
+        Read all data rows of a tab (header row excluded)
+        
+        Args:
+            sheet_name: Name of the sheet tab
+            columns: Column span to read
+            
+        Returns:
+            Rows as lists of cell strings (empty on error)
+        """
+        first, last = columns.split(':')
+        try:
+            result = self.service.spreadsheets().values().get(
+                spreadsheetId=self.sheet_id,
+                range=f"{sheet_name}!{first}2:{last}"
+            ).execute()
+            return result.get('values', [])
+            
+        except Exception as e:
+            logger.error(f"Error reading {sheet_name}: {e}")
+            return []
+    
     def create_headers(self) -> bool:
         """
         Create header rows for all sheets if they don't exist
@@ -242,7 +360,10 @@ class SheetsClient:
                 'Source Count',
                 'Confidence',
                 'Processed At',
-                'Duplicate Count'
+                'Duplicate Count',
+                None,  # K/L are the newsletter's columns; keep their headers
+                None,
+                'Feed Title'
             ],
             'Review Queue': [
                 'Date',
@@ -3,13 +3,12 @@ Summarizer Module
 Uses Groq AI to generate comprehensive article summaries
 """
 
-import os
 import logging
 from typing import Dict, List, Optional
-from pathlib import Path
-from groq import Groq
 
-from utils import clean_text
+from config import AppConfig, load_config
+from models import FetchedArticle
+from utils import clean_text, create_groq_client
 
 logger = logging.getLogger(__name__)
 
@@ -20,33 +19,20 @@ class Summarizer:
     def __init__(
         self,
         groq_api_key: Optional[str] = None,
-        system_prompt_file: str = "../config/system_prompt.txt"
+        config: Optional[AppConfig] = None
     ):
         """
         Initialize summarizer
         
         Args:
             groq_api_key: Groq API key (or from environment)
-            system_prompt_file: Path to system prompt template
+            config: Shared application config (loaded once if omitted)
         """
         # Initialize Groq
-        api_key = groq_api_key or os.getenv('GROQ_API_KEY')
-        if not api_key:
-            raise ValueError("GROQ_API_KEY must be provided or set in environment")
+        self.groq = create_groq_client(groq_api_key)
         
-        self.groq = Groq(api_key=api_key)
-        
-        # Load system prompt
-        self.system_prompt = self._load_prompt(system_prompt_file)
-    
-    def _load_prompt(self, filepath: str) -> str:
-        """Load system prompt template"""
-        try:
-            with open(filepath, 'r') as f:
-                return f.read()
-        except Exception as e:
-            logger.error(f"Error loading system prompt: {e}")
-            return ""
+        # System prompt comes from the shared config
+        self.system_prompt = (config or load_config()).system_prompt
     
     SUMMARY_WORD_LIMIT = 200
     MAX_RETRIES = 2
@@ -57,7 +43,7 @@ class Summarizer:
 
     def summarize(
         self,
-        article: Dict,
+        article: FetchedArticle,
         related_sources: List[Dict]
     ) -> Dict:
         """
@@ -74,7 +60,7 @@ class Summarizer:
         try:
             # Build context from main article and sources
             context = self._build_context(article, related_sources)
-            title_short = article.get('title', 'Unknown')[:50]
+            title_short = (article.title or 'Unknown')[:50]
 
             logger.debug(f"Generating summary for: {title_short}...")
 
@@ -132,7 +118,7 @@ class Summarizer:
                 })
 
             # Add metadata
-            parsed['original_url'] = article.get('url', '')
+            parsed['original_url'] = article.url
             parsed['source_count'] = len(related_sources)
 
             return parsed
@@ -143,7 +129,7 @@ class Summarizer:
     
     def _build_context(
         self,
-        article: Dict,
+        article: FetchedArticle,
         related_sources: List[Dict]
     ) -> str:
         """
@@ -160,10 +146,10 @@ class Summarizer:
         
         # Main article
         context_parts.append("=== MAIN ARTICLE ===\n")
-        context_parts.append(f"Title: {article.get('title', 'Unknown')}\n")
-        context_parts.append(f"URL: {article.get('url', '')}\n")
-        context_parts.append(f"Date: {article.get('date', '')}\n")
-        context_parts.append(f"\nContent:\n{article.get('content', '')[:5000]}\n")
+        context_parts.append(f"Title: {article.title or 'Unknown'}\n")
+        context_parts.append(f"URL: {article.url}\n")
+        context_parts.append(f"Date: {article.date or ''}\n")
+        context_parts.append(f"\nContent:\n{article.content[:5000]}\n")
         
         # Related sources
         if related_sources:
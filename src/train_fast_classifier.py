@@ -0,0 +1,201 @@
+"""
+Fast-Path Classifier Training
+Exports past LLM decisions from the Google Sheet, trains the local fast-path
+model and writes an evaluation report next to it
+
+Usage:
+    python train_fast_classifier.py
+    python train_fast_classifier.py --export ../cache/sheet_export
+    python train_fast_classifier.py --from-export ../cache/sheet_export
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from config import load_config
+from fast_classifier import REJECTED, FastClassifier, LabeledExample, evaluate
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger(__name__)
+
+PROCESSED_TAB = 'Processed Articles'
+REVIEW_TAB = 'Review Queue'
+REJECTED_TAB = 'Rejected Log'
+TABS = (PROCESSED_TAB, REVIEW_TAB, REJECTED_TAB)
+
+# Processed Articles up to M (Feed Title), the title the classifier saw;
+# D holds the summarizer's possibly reworded title
+PROCESSED_COLUMNS = 'A:M'
+FEED_TITLE_COLUMN = 12
+
+# Rows not decided by the LLM itself (failures, local rejections, the
+# fast path's own output) would only teach the model to copy itself
+UNLABELED_REASONS = ('Classification error', 'Prefilter:', 'Fast path:')
+
+
+def export_tabs() -> Dict[str, List[List[str]]]:
+    """Read all decision tabs from the Google Sheet"""
+    from sheets_client import SheetsClient
+
+    sheets = SheetsClient()
+    return {tab: sheets.read_rows(tab, PROCESSED_COLUMNS if tab == PROCESSED_TAB else 'A:J')
+            for tab in TABS}
+
+
+def save_export(rows_by_tab: Dict[str, List[List[str]]], directory: Path):
+    """Write one CSV per tab"""
+    directory.mkdir(parents=True, exist_ok=True)
+    for tab, rows in rows_by_tab.items():
+        with open(directory / f"{tab}.csv", 'w', newline='') as f:
+            csv.writer(f).writerows(rows)
+    logger.info(f"💾 Exported {sum(map(len, rows_by_tab.values()))} rows to {directory}")
+
+
+def load_export(directory: Path) -> Dict[str, List[List[str]]]:
+    """Read CSVs written by save_export (missing tabs are empty)"""
+    rows_by_tab = {}
+    for tab in TABS:
+        path = directory / f"{tab}.csv"
+        if path.exists():
+            with open(path, 'r', newline='') as f:
+                rows_by_tab[tab] = list(csv.reader(f))
+        else:
+            rows_by_tab[tab] = []
+    return rows_by_tab
+
+
+def _cell(row: List[str], index: int) -> str:
+    """Cell value or empty string for short rows"""
+    return row[index].strip() if index < len(row) else ''
+
+
+def build_examples(rows_by_tab: Dict[str, List[List[str]]], categories) -> List[LabeledExample]:
+    """
+    Turn sheet rows into labeled examples
+
+    Processed Articles and Review Queue rows are labeled with their
+    category; Rejected Log rows with 'rejected'. Later rows win when the
+    same title appears more than once. Processed rows use the feed's own
+    title (column M); rows written before it existed fall back to the
+    summary title in column D.
+    """
+    examples: Dict[str, LabeledExample] = {}
+
+    def add(title: str, source: str, label: str):
+        if title:
+            examples[title.lower()] = LabeledExample(title, source, label)
+
+    # Processed Articles: Date, Source, Category, Title, ..., Feed Title (M)
+    rewritten = 0
+    for row in rows_by_tab.get(PROCESSED_TAB, []):
+        if _cell(row, 2) in categories:
+            title = _cell(row, FEED_TITLE_COLUMN)
+            if not title:
+                title = _cell(row, 3)
+                rewritten += 1
+            add(title, _cell(row, 1), _cell(row, 2))
+    if rewritten:
+        logger.info(f"ℹ️  {rewritten} processed rows have no feed title, using the summary title")
+
+    # Review Queue: Date, Source, Category, Title, Summary, Confidence, Reason, URL
+    for row in rows_by_tab.get(REVIEW_TAB, []):
+        if _cell(row, 2) in categories and not _cell(row, 6).startswith(UNLABELED_REASONS):
+            add(_cell(row, 3), _cell(row, 1), _cell(row, 2))
+
+    # Rejected Log: Date, Source, Title, Rejection Reason, URL
+    for row in rows_by_tab.get(REJECTED_TAB, []):
+        if not _cell(row, 3).startswith(UNLABELED_REASONS):
+            add(_cell(row, 2), _cell(row, 1), REJECTED)
+
+    return list(examples.values())
+
+
+def _in_test_split(example: LabeledExample, fraction: float) -> bool:
+    """Stable train/test assignment by title hash"""
+    digest = hashlib.sha1(example.title.lower().encode('utf-8')).digest()
+    return digest[0] / 256 < fraction
+
+
+def format_report(report: Dict, accept_threshold: float, reject_threshold: float) -> str:
+    """Human-readable evaluation report"""
+    lines = [
+        f"Held-out examples:      {report['examples']}",
+        f"Label accuracy:         {report['accuracy']:.1%}",
+        f"Relevance agreement:    {report['relevance_agreement']:.1%}",
+        f"Fast-path coverage:     {report['fast_path_coverage']:.1%} "
+        f"(accept >= {accept_threshold}, reject >= {reject_threshold})",
+        f"Fast-path agreement:    {report['fast_path_agreement']:.1%}",
+        "",
+        f"{'label':<22} {'precision':>9} {'recall':>7} {'support':>8}",
+    ]
+    for label, stats in report['labels'].items():
+        lines.append(
+            f"{label:<22} {stats['precision']:>9.1%} {stats['recall']:>7.1%} "
+            f"{stats['support']:>8}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    """CLI entry point"""
+    fast_path = load_config().classification.fast_path
+
+    parser = argparse.ArgumentParser(description="Train the local fast-path classifier")
+    parser.add_argument("--export", type=Path,
+                        help="Also save the sheet tabs as CSV files in this directory")
+    parser.add_argument("--from-export", type=Path,
+                        help="Train from a previous --export instead of the live sheet")
+    parser.add_argument("--output", type=Path, default=fast_path.model_path,
+                        help=f"Model file to write (default: {fast_path.model_path})")
+    parser.add_argument("--test-fraction", type=float, default=0.2,
+                        help="Share of examples held out for the report (default: 0.2)")
+    args = parser.parse_args()
+
+    if args.from_export:
+        rows_by_tab = load_export(args.from_export)
+    else:
+        rows_by_tab = export_tabs()
+        if args.export:
+            save_export(rows_by_tab, args.export)
+
+    examples = build_examples(rows_by_tab, load_config().categories)
+    if len({e.label for e in examples}) < 2:
+        logger.error("❌ Need both accepted and rejected examples to train")
+        return 1
+
+    train = [e for e in examples if not _in_test_split(e, args.test_fraction)]
+    test = [e for e in examples if _in_test_split(e, args.test_fraction)]
+    logger.info(f"📚 {len(examples)} labeled examples ({len(train)} train, {len(test)} held out)")
+
+    report = evaluate(
+        FastClassifier.train(train), test,
+        fast_path.accept_threshold, fast_path.reject_threshold
+    )
+    text = format_report(report, fast_path.accept_threshold, fast_path.reject_threshold)
+    logger.info(f"\n📊 Evaluation against LLM labels:\n{text}\n")
+
+    # The saved model uses every example; the report above is from the held-out run
+    model = FastClassifier.train(examples)
+    model.metadata['evaluation'] = report
+    model.save(args.output)
+
+    report_path = args.output.with_suffix('.report.json')
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    logger.info(f"✅ Wrote model to {args.output} and report to {report_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
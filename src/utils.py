@@ -2,11 +2,17 @@
 Utility functions for the AI News Aggregator
 """
 
+import os
 import re
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 import logging
 
+import replay
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -138,6 +144,15 @@ def format_money(amount: int) -> str:
         return f"${amount:,}"
 
 
+# $X billion, $X million, $XB, $XM (checked in this order)
+MONEY_PATTERNS = [
+    (re.compile(r'\$(\d+(?:\.\d+)?)\s*billion', re.IGNORECASE), 1_000_000_000),
+    (re.compile(r'\$(\d+(?:\.\d+)?)\s*million', re.IGNORECASE), 1_000_000),
+    (re.compile(r'\$(\d+(?:\.\d+)?)B', re.IGNORECASE), 1_000_000_000),
+    (re.compile(r'\$(\d+(?:\.\d+)?)M', re.IGNORECASE), 1_000_000),
+]
+
+
 def extract_money_amount(text: str) -> Optional[int]:
     """
     Extract dollar amounts from text
@@ -148,16 +163,8 @@ def extract_money_amount(text: str) -> Optional[int]:
     Returns:
         Amount in dollars or None
     """
-    # Pattern: $X million, $X billion, $XM, $XB
-    patterns = [
-        (r'\$(\d+(?:\.\d+)?)\s*billion', 1_000_000_000),
-        (r'\$(\d+(?:\.\d+)?)\s*million', 1_000_000),
-        (r'\$(\d+(?:\.\d+)?)B', 1_000_000_000),
-        (r'\$(\d+(?:\.\d+)?)M', 1_000_000),
-    ]
-    
-    for pattern, multiplier in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern, multiplier in MONEY_PATTERNS:
+        match = pattern.search(text)
         if match:
             amount = float(match.group(1)) * multiplier
             return int(amount)
@@ -179,6 +186,63 @@ def validate_url(url: str) -> bool:
     return bool(re.match(url_pattern, url))
 
 
+# Query parameters that only track the click, never select content
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    '_hsenc', '_hsmi', 'mkt_tok', 'ref_src', 'cmpid', 'ncid', 'sr_share',
+}
+TRACKING_PREFIXES = ('utm_',)
+
+DEFAULT_PORTS = {'http': '80', 'https': '443'}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL into a dedup key, so the same page always maps to the
+    same string
+    
+    Lowercases scheme and host, drops default ports, fragments (except
+    "#!" routes), trailing slashes and tracking parameters (utm_*,
+    fbclid, ...), and sorts the remaining query parameters. Only used to
+    compare URLs; articles keep their original link.
+    
+    Args:
+        url: URL to normalize
+        
+    Returns:
+        Canonical URL (the stripped input if it cannot be parsed)
+    """
+    if not url:
+        return ""
+    
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return url.strip()
+    scheme = parts.scheme.lower()
+    
+    host = (parts.hostname or '').lower()
+    if ':' in host:
+        host = f"[{host}]"  # IPv6 literal
+    if port and str(port) != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+    
+    path = parts.path.rstrip('/') or '/'
+    
+    query = urlencode(sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS
+        and not key.lower().startswith(TRACKING_PREFIXES)
+    ))
+    
+    # "#!" fragments select content in hash-bang routed sites
+    fragment = parts.fragment if parts.fragment.startswith('!') else ''
+    
+    return urlunsplit((scheme, host, path, query, fragment))
+
+
 class RateLimiter:
     """Simple rate limiter to avoid overwhelming APIs"""
     
@@ -211,6 +275,135 @@ class RateLimiter:
         self.calls.append(datetime.now())
 
 
+def create_groq_client(api_key: Optional[str] = None, **options):
+    """
+    Groq client shared by every Groq consumer (classifier, summarizer)
+    
+    GROQ_BASE_URL points all of them at another OpenAI-compatible endpoint,
+    such as the local stand-in server (llm_standin.py), which needs no real
+    API key. Under REPLAY_MODE the client records or replays its calls.
+    
+    Args:
+        api_key: Groq API key (or from environment)
+        **options: Extra client options (e.g. max_retries)
+        
+    Returns:
+        Groq client
+        
+    Raises:
+        ValueError: If no API key is set for the real Groq API
+    """
+    from groq import Groq
+    
+    api_key = api_key or os.getenv('GROQ_API_KEY')
+    base_url = os.getenv('GROQ_BASE_URL') or None
+    if not api_key:
+        if not (base_url or replay.replaying()):
+            raise ValueError("GROQ_API_KEY must be provided or set in environment")
+        api_key = 'local'
+    
+    return replay.wrap_groq(lambda: Groq(api_key=api_key, base_url=base_url, **options))
+
+
+class TokenBucketLimiter:
+    """
+    Thread-safe limiter for a requests/minute and a tokens/minute quota
+
+    Both budgets refill continuously. Callers reserve an estimated token
+    count up front and settle it against the real usage afterwards.
+    """
+    
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        """
+        Initialize limiter
+        
+        Args:
+            requests_per_minute: Request quota
+            tokens_per_minute: Token quota (prompt + completion)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.request_budget = float(requests_per_minute)
+        self.token_budget = float(tokens_per_minute)
+        self.paused_until = 0.0
+        self._updated = time.monotonic()
+        self._condition = threading.Condition()
+    
+    def _refill(self, now: float):
+        """Add the budget accrued since the last update (caller holds the condition)"""
+        elapsed_minutes = (now - self._updated) / 60
+        self._updated = now
+        self.request_budget = min(
+            self.request_budget + elapsed_minutes * self.requests_per_minute,
+            self.requests_per_minute
+        )
+        self.token_budget = min(
+            self.token_budget + elapsed_minutes * self.tokens_per_minute,
+            self.tokens_per_minute
+        )
+    
+    def acquire(self, tokens: int):
+        """
+        Block until one request of about `tokens` tokens fits both budgets
+        
+        Args:
+            tokens: Estimated tokens for the request
+        """
+        with self._condition:
+            while True:
+                wait = self._reserve(tokens)
+                if not wait:
+                    return
+                # Woken early when settle() hands back unused tokens
+                self._condition.wait(wait)
+    
+    def try_acquire(self, tokens: int) -> float:
+        """
+        Reserve one request without blocking
+        
+        Args:
+            tokens: Tokens for the request
+            
+        Returns:
+            0 if reserved, else seconds until it would fit
+        """
+        with self._condition:
+            return self._reserve(tokens)
+    
+    def _reserve(self, tokens: int) -> float:
+        """Take budget for one request, or return the wait (caller holds the condition)"""
+        # A request larger than the whole quota waits for a full bucket
+        tokens = min(tokens, self.tokens_per_minute)
+        now = time.monotonic()
+        self._refill(now)
+        
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.request_budget >= 1 and self.token_budget >= tokens:
+            self.request_budget -= 1
+            self.token_budget -= tokens
+            return 0.0
+        return max(
+            (1 - self.request_budget) / self.requests_per_minute * 60,
+            (tokens - self.token_budget) / self.tokens_per_minute * 60,
+            0.01
+        )
+    
+    def settle(self, estimated: int, actual: int):
+        """Correct the token budget once a request's real usage is known"""
+        with self._condition:
+            self.token_budget = min(
+                self.token_budget + estimated - actual,
+                self.tokens_per_minute
+            )
+            self._condition.notify_all()
+    
+    def pause(self, seconds: float):
+        """Hold all callers for a while (e.g. after a 429 with retry-after)"""
+        with self._condition:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
 def safe_get(dictionary: Dict, *keys, default=None) -> Any:
     """
     Safely get nested dictionary values
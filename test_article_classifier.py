@@ -0,0 +1,92 @@
+"""
+Tests for the batched classification prompt and the model cascade
+"""
+
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from article_classifier import BATCH_TASK, CLASSIFY_MODEL, FAST_MODEL, ArticleClassifier
+from config import load_config
+from models import Article
+
+
+def classifier(monkeypatch):
+    monkeypatch.setenv('GROQ_BASE_URL', 'http://127.0.0.1:9/openai/v1')
+    return ArticleClassifier(config=load_config())
+
+
+def batch_prompt(monkeypatch):
+    c = classifier(monkeypatch)
+    return c.batch_instructions + BATCH_TASK.format(count=2, articles='[id 1]\n...\n\n[id 2]\n...')
+
+
+def test_batch_prompt_has_exactly_one_response_schema(monkeypatch):
+    prompt = batch_prompt(monkeypatch)
+    assert prompt.count('Respond ONLY') == 1
+    assert prompt.count('"results"') == 1
+    assert '{\n  "relevant"' not in prompt
+    assert '-> {' not in prompt
+
+
+def test_batch_prompt_drops_single_article_sections(monkeypatch):
+    prompt = batch_prompt(monkeypatch)
+    assert 'TASK:\nClassify if this article' not in prompt
+    assert 'RESPONSE FORMAT:' not in prompt
+    assert '{title}' not in prompt and 'Article Title:' not in prompt
+    assert 'Now classify the article above.' not in prompt
+    # Shared guidance stays
+    assert 'CATEGORY DEFINITIONS:' in prompt
+    assert 'IMPORTANT GUIDELINES:' in prompt
+    assert '-> relevant, model_releases, tier 1, confidence 0.95' in prompt
+
+
+def cascade(monkeypatch, verdict):
+    """A cascading classifier whose models always answer with verdict"""
+    c = classifier(monkeypatch)
+    c.config = replace(c.config, classification=replace(c.config.classification, cascade=True))
+    c.cache = None
+    calls = []
+
+    def classify_many(articles, model, rules=True):
+        if articles:
+            calls.append(model)
+        return [c._build_result(dict(verdict), a, model, cache=False, rules=rules) for a in articles]
+
+    monkeypatch.setattr(c, 'classify_many', classify_many)
+    return c, calls
+
+
+def test_tier_thresholds_come_from_scoring(monkeypatch):
+    c = classifier(monkeypatch)
+    assert c.tier_thresholds == {
+        1: c.config.scoring['tier_1_threshold'],
+        2: c.config.scoring['tier_2_threshold'],
+    }
+
+
+def test_rule_demoted_verdict_is_not_escalated(monkeypatch):
+    c, calls = cascade(monkeypatch, {
+        'relevant': True, 'category': 'enterprise_strategy', 'tier': 1,
+        'confidence': 0.95, 'reason': 'funding round',
+    })
+    article = Article(title='Startup raises $20M in enterprise funding', url='https://example.com/a')
+    [result] = c._classify_llm([article])
+    assert calls == [FAST_MODEL]
+    assert result.model == FAST_MODEL
+    assert not result.relevant
+    assert 'below threshold' in result.reason
+
+
+def test_uncertain_verdict_escalates_and_rules_apply_to_strong_model(monkeypatch):
+    c, calls = cascade(monkeypatch, {
+        'relevant': True, 'category': 'enterprise_strategy', 'tier': 1,
+        'confidence': 0.72, 'reason': 'funding round',
+    })
+    article = Article(title='Startup raises $20M in enterprise funding', url='https://example.com/a')
+    [result] = c._classify_llm([article])
+    assert calls == [FAST_MODEL, CLASSIFY_MODEL]
+    assert result.model == CLASSIFY_MODEL
+    assert not result.relevant
@@ -0,0 +1,93 @@
+"""
+Tests for per-host limited parallel article fetching
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from article_fetcher import ArticleFetcher
+from config import load_config
+from models import FetchedArticle
+
+MAX_CONCURRENT = 4
+MAX_PER_HOST = 2
+
+
+class StubFetch:
+    """Records how many fetches run at once, per host and overall"""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = Counter()
+        self.peak = Counter()
+        self.total = self.peak_total = 0
+        self.calls = Counter()
+
+    def __call__(self, url):
+        host = url.split('/')[2]
+        with self.lock:
+            self.calls[url] += 1
+            self.active[host] += 1
+            self.total += 1
+            self.peak[host] = max(self.peak[host], self.active[host])
+            self.peak_total = max(self.peak_total, self.total)
+        try:
+            time.sleep(self.delay)
+            if 'bad' in url:
+                raise RuntimeError('boom')
+            return FetchedArticle(url=url, title='Title', raw_content='body')
+        finally:
+            with self.lock:
+                self.active[host] -= 1
+                self.total -= 1
+
+
+def fetcher(monkeypatch, stub):
+    config = load_config()
+    config = replace(config, http=replace(
+        config.http, max_concurrent_fetches=MAX_CONCURRENT, max_fetches_per_host=MAX_PER_HOST
+    ))
+    f = ArticleFetcher(config)
+    monkeypatch.setattr(f, 'fetch', stub)
+    return f
+
+
+def test_concurrency_stays_within_limits(monkeypatch):
+    stub = StubFetch()
+    urls = (
+        [f'https://a.com/{i}' for i in range(8)] +
+        [f'https://b.com/{i}' for i in range(8)] +
+        [f'https://c.com/{i}' for i in range(3)]
+    )
+    results = fetcher(monkeypatch, stub).fetch_batch(urls)
+
+    assert set(results) == set(urls)
+    assert max(stub.peak.values()) <= MAX_PER_HOST
+    assert stub.peak_total <= MAX_CONCURRENT
+    # Other hosts keep going while one host is at its limit
+    assert stub.peak_total > MAX_PER_HOST
+
+
+def test_duplicate_urls_are_fetched_once(monkeypatch):
+    stub = StubFetch(delay=0)
+    urls = ['https://a.com/1', 'https://b.com/1', 'https://a.com/1', 'https://b.com/1']
+    fetched = list(fetcher(monkeypatch, stub).fetch_as_completed(urls))
+
+    assert sorted(url for url, _ in fetched) == ['https://a.com/1', 'https://b.com/1']
+    assert set(stub.calls.values()) == {1}
+
+
+def test_raising_fetch_becomes_error_result(monkeypatch):
+    stub = StubFetch(delay=0)
+    results = fetcher(monkeypatch, stub).fetch_batch(['https://a.com/bad', 'https://a.com/ok'])
+
+    assert results['https://a.com/bad'].error == 'boom'
+    assert results['https://a.com/bad'].url == 'https://a.com/bad'
+    assert results['https://a.com/ok'].error is None
@@ -0,0 +1,85 @@
+"""
+Tests for MinHash/LSH duplicate candidates and duplicate clustering
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from dedup import MinHasher, UnionFind, shingles
+from models import Article, Classification
+
+
+def article(title, summary=''):
+    return Article(title=title, url='https://example.com/' + title.lower().replace(' ', '-'), summary=summary)
+
+
+def test_shingles_drop_stopwords_and_case():
+    tokens = shingles(article('OpenAI Launches GPT-5.2 for the Enterprise', '<p>Says $2B deal</p>'))
+    assert tokens == {'openai', 'launches', 'gpt-5.2', 'enterprise', '$2b', 'deal'}
+
+
+def test_signatures_are_deterministic():
+    tokens = {'openai', 'launches', 'gpt-6'}
+    assert MinHasher().signature(tokens) == MinHasher().signature(tokens)
+    assert MinHasher.similarity(MinHasher().signature(tokens), MinHasher().signature(tokens)) == 1.0
+
+
+def test_similarity_tracks_jaccard():
+    hasher = MinHasher(bands=64, rows=2)
+    a = {f'w{i}' for i in range(100)}
+    b = {f'w{i}' for i in range(50, 150)}  # Jaccard 1/3
+    estimate = MinHasher.similarity(hasher.signature(a), hasher.signature(b))
+    assert abs(estimate - 1 / 3) < 0.12
+
+
+def test_candidate_pairs_find_rewrites_not_unrelated_stories():
+    articles = [
+        article('Meta acquires Manus for $2B to expand AI agents'),
+        article('Nvidia unveils Blackwell Ultra GPUs for data centers'),
+        article('Meta to acquire AI agent startup Manus in $2B deal'),
+        article('Local council approves new bike lanes downtown'),
+        article(''),
+    ]
+    pairs = MinHasher().candidate_pairs(articles)
+    assert (0, 2) in pairs
+    assert all(3 not in pair and 4 not in pair for pair in pairs)
+    assert all(i < j for i, j in pairs)
+
+
+def test_union_find_merges_transitively():
+    sets = UnionFind(6)
+    assert sets.union(0, 1)
+    assert sets.union(3, 1)
+    assert not sets.union(0, 3)
+    sets.union(4, 5)
+    assert sets.connected(0, 3)
+    assert not sets.connected(0, 4)
+    assert sets.groups() == [[0, 1, 3], [2], [4, 5]]
+
+
+def test_detect_duplicates_clusters_confirmed_pairs(monkeypatch):
+    monkeypatch.setenv('GROQ_BASE_URL', 'http://127.0.0.1:9/openai/v1')
+    from article_classifier import ArticleClassifier
+
+    titles = [
+        'Meta acquires Manus for $2B to expand AI agents',
+        'Nvidia unveils Blackwell Ultra GPUs for data centers',
+        'Meta to acquire AI agent startup Manus in $2B deal',
+        'Manus agrees to $2B Meta acquisition of AI agents startup',
+    ]
+    items = [
+        Classification(article=article(title), relevant=True, category='enterprise_strategy')
+        for title in titles
+    ]
+
+    classifier = ArticleClassifier()
+    classifier._adjudicate_cluster = lambda titles, threshold=0.8: [
+        [i for i, title in enumerate(titles) if 'Manus' in title]
+    ]
+    classifier.is_duplicate = lambda a, b, threshold=0.8: 'Manus' in a and 'Manus' in b
+
+    groups = classifier.detect_duplicates(items, {})
+    clustered = sorted(sorted(item.article.title for item in group) for group in groups)
+    assert clustered == sorted([sorted([titles[0], titles[2], titles[3]]), [titles[1]]])
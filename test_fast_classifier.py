@@ -0,0 +1,143 @@
+"""
+Tests for the fast-path classifier and its training data export
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from fast_classifier import REJECTED, FastClassifier, LabeledExample, evaluate
+from models import Article
+from train_fast_classifier import PROCESSED_TAB, REJECTED_TAB, REVIEW_TAB, build_examples
+
+CATEGORIES = {'model_releases', 'robotics'}
+
+
+def processed(title, category='model_releases', feed_title=None):
+    """Processed Articles row (A:M), with column M only if feed_title is given"""
+    row = ['2026-01-12', 'OpenAI Blog', category, title, 'Summary', 'https://a', 1,
+           0.9, '2026-01-12T09:00:00', 1]
+    if feed_title is not None:
+        row += ['', '', feed_title]
+    return row
+
+
+def test_build_examples_labels_each_tab():
+    examples = build_examples({
+        PROCESSED_TAB: [processed('GPT-5 Ships With New Tools', feed_title='OpenAI releases GPT-5')],
+        REVIEW_TAB: [['2026-01-12', 'IEEE', 'robotics', 'Humanoid robot walks', 'S', '0.65',
+                      'robotics news', 'https://b']],
+        REJECTED_TAB: [['2026-01-12', 'Blog', 'Ten prompt tips', 'tutorial', 'https://c']],
+    }, CATEGORIES)
+    assert [(e.title, e.source, e.label) for e in examples] == [
+        ('OpenAI releases GPT-5', 'OpenAI Blog', 'model_releases'),
+        ('Humanoid robot walks', 'IEEE', 'robotics'),
+        ('Ten prompt tips', 'Blog', REJECTED),
+    ]
+
+
+def test_build_examples_falls_back_to_summary_title_without_column_m():
+    examples = build_examples({
+        PROCESSED_TAB: [
+            processed('Old row title'),
+            processed('Reworded title', feed_title=''),
+            processed('Unknown category', category='gossip', feed_title='Gossip'),
+        ],
+    }, CATEGORIES)
+    assert [e.title for e in examples] == ['Old row title', 'Reworded title']
+
+
+def test_build_examples_skips_rows_not_decided_by_the_llm():
+    examples = build_examples({
+        REVIEW_TAB: [
+            ['d', 's', 'robotics', 'Fast robot', 'S', '0.96', 'Fast path: robotics (p=0.96)', 'u'],
+            ['d', 's', 'robotics', 'Real robot', 'S', '0.65', 'lab demo', 'u'],
+        ],
+        REJECTED_TAB: [
+            ['d', 's', 'Prefiltered', 'Prefilter: no category keywords', 'u'],
+            ['d', 's', 'Fast rejected', 'Fast path: rejected (p=0.99)', 'u'],
+            ['d', 's', 'Errored', 'Classification error: timeout', 'u'],
+            ['d', 's', 'Plain rejection', 'not AI news', 'u'],
+        ],
+    }, CATEGORIES)
+    assert [(e.title, e.label) for e in examples] == [
+        ('Real robot', 'robotics'),
+        ('Plain rejection', REJECTED),
+    ]
+
+
+def test_build_examples_later_rows_win():
+    examples = build_examples({
+        PROCESSED_TAB: [processed('x', feed_title='Same Story')],
+        REJECTED_TAB: [['d', 's', 'same story', 'not AI news', 'u']],
+    }, CATEGORIES)
+    assert [(e.title, e.label) for e in examples] == [('same story', REJECTED)]
+
+
+TRAINING = [
+    LabeledExample('OpenAI releases new GPT model', 'OpenAI', 'model_releases'),
+    LabeledExample('Anthropic releases Claude model update', 'Anthropic', 'model_releases'),
+    LabeledExample('Google releases Gemini model', 'Google', 'model_releases'),
+    LabeledExample('Humanoid robot learns to walk', 'IEEE', 'robotics'),
+    LabeledExample('Warehouse robot arm picks boxes', 'IEEE', 'robotics'),
+    LabeledExample('Robot dog climbs stairs', 'IEEE', 'robotics'),
+    LabeledExample('Ten tips for better prompts', 'Blog', REJECTED),
+    LabeledExample('How to write prompts tutorial', 'Blog', REJECTED),
+    LabeledExample('Prompt tips for beginners', 'Blog', REJECTED),
+]
+
+
+def test_train_predict_save_load_round_trip(tmp_path):
+    model = FastClassifier.train(TRAINING, epochs=30)
+    assert model.labels == sorted({'model_releases', 'robotics', REJECTED})
+    assert model.metadata['examples'] == len(TRAINING)
+
+    article = Article(title='Meta releases Llama model', url='https://x', source_name='Meta')
+    label, probability = model.predict(article)
+    assert label == 'model_releases'
+    assert probability > 0.5
+
+    path = tmp_path / 'model' / 'fast.json'
+    model.save(path)
+    loaded = FastClassifier.load(path)
+    assert loaded.labels == model.labels
+    assert loaded.predict(article)[0] == label
+    assert loaded.predict(article)[1] == pytest.approx(probability, abs=1e-3)
+    assert loaded.metadata == model.metadata
+
+
+class FixedModel:
+    """Stands in for a trained model with canned probabilities per title"""
+
+    def __init__(self, answers):
+        self.answers = answers
+
+    def predict_proba(self, title, source=''):
+        return self.answers[title]
+
+
+def test_evaluate_counts():
+    model = FixedModel({
+        'a': {'model_releases': 0.97, 'robotics': 0.02, REJECTED: 0.01},
+        'b': {'model_releases': 0.60, 'robotics': 0.30, REJECTED: 0.10},
+        'c': {'model_releases': 0.01, 'robotics': 0.01, REJECTED: 0.98},
+        'd': {'model_releases': 0.10, 'robotics': 0.80, REJECTED: 0.10},
+    })
+    report = evaluate(model, [
+        LabeledExample('a', '', 'model_releases'),   # right, confident
+        LabeledExample('b', '', 'robotics'),         # wrong, not confident
+        LabeledExample('c', '', 'model_releases'),   # wrong, confident reject
+        LabeledExample('d', '', 'robotics'),         # right, not confident
+    ], accept_threshold=0.95, reject_threshold=0.97)
+
+    assert report['examples'] == 4
+    assert report['accuracy'] == 0.5
+    assert report['relevance_agreement'] == 0.75
+    assert report['fast_path_coverage'] == 0.5
+    assert report['fast_path_agreement'] == 0.5
+    assert report['labels']['model_releases'] == {'precision': 0.5, 'recall': 0.5, 'support': 2}
+    assert report['labels']['robotics'] == {'precision': 1.0, 'recall': 0.5, 'support': 2}
+    assert report['labels'][REJECTED] == {'precision': 0.0, 'recall': 0.0, 'support': 0}
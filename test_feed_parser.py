@@ -0,0 +1,159 @@
+"""
+Tests for the incremental RSS/Atom fast path and its feedparser fallback
+"""
+
+import dataclasses
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from config import SourceConfig, load_config
+from feed_discovery import FeedDiscoverer
+from feed_parser import FeedParseError, parse_recent_entries
+
+CUTOFF = datetime(2026, 1, 10)
+
+
+def rss(*items, tail=''):
+    body = ''.join(
+        f"<item><title>{title}</title><link>https://example.com/{i}</link>"
+        f"<pubDate>{date}</pubDate></item>"
+        for i, (title, date) in enumerate(items)
+    )
+    return f'<?xml version="1.0"?><rss><channel>{body}{tail}</channel></rss>'.encode()
+
+
+def test_stops_a_few_entries_past_cutoff():
+    # Everything after the old entries is malformed; reading it would raise
+    body = rss(
+        ('New', 'Mon, 12 Jan 2026 09:00:00 GMT'),
+        ('Newer than cutoff', 'Sun, 11 Jan 2026 09:00:00 +0000'),
+        ('Old', 'Fri, 02 Jan 2026 09:00:00 GMT'),
+        ('Older', 'Thu, 01 Jan 2026 09:00:00 GMT'),
+        ('Oldest', 'Wed, 31 Dec 2025 09:00:00 GMT'),
+        tail='<item><title>broken',
+    )
+    entries = parse_recent_entries(body, CUTOFF, max_entries=50)
+    assert [e['title'] for e in entries] == ['New', 'Newer than cutoff']
+    assert entries[0]['published'] == datetime(2026, 1, 12, 9, 0)
+
+
+def test_respects_max_entries_and_skips_undated():
+    body = rss(
+        ('Undated', ''),
+        ('A', 'Mon, 12 Jan 2026 09:00:00 GMT'),
+        ('B', 'Mon, 12 Jan 2026 08:00:00 GMT'),
+        ('C', 'Mon, 12 Jan 2026 07:00:00 GMT'),
+    )
+    assert [e['title'] for e in parse_recent_entries(body, CUTOFF, 3)] == ['A', 'B']
+
+
+def test_atom_entries():
+    body = b'''<?xml version="1.0"?>
+    <feed xmlns="http://www.w3.org/2005/Atom">
+      <entry><title>Atom post</title>
+        <link rel="alternate" href="https://example.com/atom"/>
+        <updated>2026-01-12T09:00:00+02:00</updated></entry>
+    </feed>'''
+    [entry] = parse_recent_entries(body, CUTOFF, 50)
+    assert entry['link'] == 'https://example.com/atom'
+    assert entry['published'] == datetime(2026, 1, 12, 7, 0)
+
+
+def test_newer_entry_after_a_stale_one_is_refused():
+    # One pinned old item must not hide the rest of the day's news
+    body = rss(
+        ('T0', 'Mon, 12 Jan 2026 09:00:00 GMT'),
+        ('Pinned', 'Fri, 02 Jan 2026 09:00:00 GMT'),
+        ('T2', 'Mon, 12 Jan 2026 08:00:00 GMT'),
+        ('T3', 'Mon, 12 Jan 2026 07:00:00 GMT'),
+    )
+    with pytest.raises(FeedParseError):
+        parse_recent_entries(body, CUTOFF, 50)
+
+
+def test_unsorted_or_empty_feeds_are_refused():
+    unsorted = rss(
+        ('Older', 'Sun, 11 Jan 2026 09:00:00 GMT'),
+        ('Newer', 'Mon, 12 Jan 2026 09:00:00 GMT'),
+    )
+    with pytest.raises(FeedParseError):
+        parse_recent_entries(unsorted, CUTOFF, 50)
+    with pytest.raises(FeedParseError):
+        parse_recent_entries(b'<html><body>not a feed</body></html>', CUTOFF, 50)
+    with pytest.raises(FeedParseError):
+        parse_recent_entries(b'<rss><channel><item>', CUTOFF, 50)
+
+
+class FakeHTTP:
+    def __init__(self, body):
+        self.body = body
+
+    def get(self, url, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = self.body
+        response.url = url
+        return response
+
+
+def fast_discoverer(body):
+    config = load_config()
+    config = dataclasses.replace(
+        config,
+        settings=dataclasses.replace(config.settings, fast_parse=True),
+        feed_cache=dataclasses.replace(config.feed_cache, enabled=False),
+    )
+    discoverer = FeedDiscoverer(config)
+    discoverer.http = FakeHTTP(body)
+    return discoverer
+
+
+SOURCE = SourceConfig(id='test', name='Test', url='https://example.com/feed')
+
+
+def test_unsorted_feed_falls_back_to_feedparser():
+    discoverer = fast_discoverer(rss(
+        ('T0', 'Mon, 12 Jan 2026 09:00:00 GMT'),
+        ('Pinned', 'Fri, 02 Jan 2026 09:00:00 GMT'),
+        ('T2', 'Mon, 12 Jan 2026 08:00:00 GMT'),
+        ('T3', 'Mon, 12 Jan 2026 07:00:00 GMT'),
+    ))
+    articles = discoverer._fetch_from_source(SOURCE, CUTOFF)
+    assert [a.title for a in articles] == ['T0', 'T2', 'T3']
+    assert articles[0].source == 'test'
+
+
+def test_bad_entry_does_not_fail_the_source(monkeypatch):
+    build = FeedDiscoverer._build_article
+
+    def build_article(self, entry, pub_date, source):
+        if entry['title'] == 'Bad':
+            raise ValueError('Port out of range 0-65535')
+        return build(self, entry, pub_date, source)
+
+    monkeypatch.setattr(FeedDiscoverer, '_build_article', build_article)
+    discoverer = fast_discoverer(rss(
+        ('Good', 'Mon, 12 Jan 2026 09:00:00 GMT'),
+        ('Bad', 'Mon, 12 Jan 2026 08:00:00 GMT'),
+        ('Also good', 'Mon, 12 Jan 2026 07:00:00 GMT'),
+    ))
+    articles = discoverer._fetch_from_source(SOURCE, CUTOFF)
+    assert [a.title for a in articles] == ['Good', 'Also good']
+
+
+def test_articles_keep_original_links_but_dedup_canonically():
+    discoverer = fast_discoverer(b'''<?xml version="1.0"?><rss><channel>
+      <item><title>A</title><link>https://Example.com/a/?utm_source=rss</link>
+        <pubDate>Mon, 12 Jan 2026 09:00:00 GMT</pubDate></item>
+      <item><title>A again</title><link>https://example.com/a</link>
+        <pubDate>Mon, 12 Jan 2026 08:00:00 GMT</pubDate></item>
+    </channel></rss>''')
+    articles = discoverer._fetch_from_source(SOURCE, CUTOFF)
+    assert articles[0].url == 'https://Example.com/a/?utm_source=rss'
+    assert [a.title for a in discoverer._unique(articles)] == ['A']
@@ -0,0 +1,50 @@
+"""
+Tests for the local keyword prefilter
+"""
+
+import sys
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from config import load_config
+from models import Article
+from prefilter import KeywordPrefilter
+
+
+def category_examples():
+    with open(Path(__file__).parent / 'config' / 'categories.yaml') as f:
+        categories = yaml.safe_load(f)['categories']
+    return [
+        (name, example)
+        for name, rule in categories.items()
+        for example in rule.get('examples', [])
+    ]
+
+
+def test_category_examples_reach_the_llm():
+    prefilter = KeywordPrefilter(load_config())
+    examples = category_examples()
+    assert examples
+    for name, example in examples:
+        rejected = prefilter.check(Article(title=example, url='https://example.com/a'))
+        assert rejected is None, f"{name} example {example!r}: {rejected.reason}"
+
+
+def test_amount_above_min_amount_counts_as_strong_match():
+    prefilter = KeywordPrefilter(load_config())
+    article = Article(title='Snowflake $200M Anthropic Deal', url='https://example.com/a')
+    assert prefilter.check(article) is None
+
+    small = Article(title='Snowflake $2M Anthropic Deal', url='https://example.com/b')
+    assert prefilter.check(small) is not None
+
+
+def test_unrelated_article_is_rejected():
+    prefilter = KeywordPrefilter(load_config())
+    rejected = prefilter.check(Article(title='Local bakery wins pie contest', url='https://example.com/c'))
+    assert rejected is not None
+    assert not rejected.relevant
+    assert rejected.reason.startswith('Prefilter:')
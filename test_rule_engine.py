@@ -0,0 +1,67 @@
+"""
+Tests for keyword matching and the category rule engine
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from config import load_config
+from models import Article, Classification
+from prefilter import KeywordMatcher
+from rule_engine import RULE_PENALTY, TOPIC_PENALTY, RuleEngine
+
+
+def verdict(title, category, confidence=0.9, tier=1):
+    return Classification(
+        article=Article(title=title, url='https://example.com/a'),
+        relevant=True,
+        category=category,
+        tier=tier,
+        confidence=confidence,
+        reason='model verdict',
+    )
+
+
+def test_short_keywords_are_not_inflected():
+    matcher = KeywordMatcher(['fun', 'ai', 'launch', 'release', 'foundation model'])
+    assert matcher.find('sovereign fund backs aid program') == set()
+    assert matcher.find('AI fun') == {'ai', 'fun'}
+    assert matcher.find('launches, launched and launching') == {'launch'}
+    assert matcher.find('released after releasing') == {'release'}
+    assert matcher.find('two foundation models') == {'foundation model'}
+
+
+def test_funding_round_not_mistaken_for_consumer_app():
+    engine = RuleEngine(load_config())
+    result = engine.apply(verdict(
+        'Mistral closes $600M round led by sovereign fund', 'enterprise_strategy'
+    ))
+    assert result.relevant
+    assert result.confidence == 0.9
+    assert 'consumer_apps' not in result.reason
+
+
+def test_excluded_topic_is_a_signal_not_a_rejection():
+    engine = RuleEngine(load_config())
+    result = engine.apply(verdict(
+        'OpenAI unveils GPT-6 model, will be available next week', 'model_releases'
+    ))
+    assert result.relevant
+    assert result.confidence == 0.9 - TOPIC_PENALTY
+    assert 'looks like speculation' in result.reason
+
+
+def test_hard_rules_still_reject():
+    engine = RuleEngine(load_config())
+    result = engine.apply(verdict(
+        'Startup raises $20M to build enterprise agents', 'enterprise_strategy'
+    ))
+    assert not result.relevant
+    assert result.confidence == 0.9 - RULE_PENALTY
+    assert 'below threshold' in result.reason
+
+    result = engine.apply(verdict('Model leak shows GPT-6 benchmarks', 'model_releases'))
+    assert not result.relevant
+    assert 'excluded keyword: leak' in result.reason
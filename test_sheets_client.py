@@ -0,0 +1,88 @@
+"""
+Tests for attaching sources to processed rows
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from sheets_client import SheetsClient
+
+
+class Request:
+    def __init__(self, result=None):
+        self.result = result
+
+    def execute(self):
+        return self.result
+
+
+class FakeSheet:
+    """Just enough of service.spreadsheets().values() for add_sources"""
+
+    def __init__(self, row):
+        self.row = row
+        self.reads = []
+        self.updates = []
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def get(self, spreadsheetId, range):
+        self.reads.append(range)
+        return Request({'values': [self.row]})
+
+    def update(self, spreadsheetId, range, valueInputOption, body):
+        self.updates.append((range, body['values'][0]))
+        return Request({})
+
+
+def client(row):
+    sheets = SheetsClient.__new__(SheetsClient)
+    sheets.sheet_id = 'test'
+    sheets.service = FakeSheet(row)
+    return sheets
+
+
+# D (Title) .. M (Feed Title)
+ROW = [
+    'OpenAI Ships GPT-5', 'Summary', 'https://Example.com/gpt5?utm_source=rss', 1,
+    0.9, '2026-01-12T09:00:00', 1, '', '', 'OpenAI releases GPT-5',
+]
+SOURCES = [{'url': 'https://other.com/gpt5'}]
+RANGE = "'Processed Articles'!A57:M57"
+
+
+def test_adds_sources_when_feed_title_matches():
+    sheets = client(list(ROW))
+    assert sheets.add_sources(RANGE, SOURCES, 'OpenAI releases GPT-5', 'https://other.com/x')
+    assert sheets.service.reads == ["'Processed Articles'!D57:M57"]
+    [(range_name, values)] = sheets.service.updates
+    assert range_name == "'Processed Articles'!F57:J57"
+    assert values[0].split('\n') == ['https://Example.com/gpt5?utm_source=rss', 'https://other.com/gpt5']
+    assert values[1] == 2
+    assert values[4] == 2
+
+
+def test_adds_sources_when_canonical_url_is_listed():
+    sheets = client(list(ROW))
+    assert sheets.add_sources(RANGE, SOURCES, 'GPT-5 is here', 'https://example.com/gpt5')
+    assert len(sheets.service.updates) == 1
+
+
+def test_moved_row_is_left_alone():
+    moved = ['Anthropic Raises $2B', '', 'https://example.com/anthropic', 1,
+             0.9, '', 1, '', '', 'Anthropic raises $2B']
+    sheets = client(moved)
+    assert not sheets.add_sources(RANGE, SOURCES, 'OpenAI releases GPT-5', 'https://example.com/gpt5')
+    assert sheets.service.updates == []
+
+
+def test_short_row_without_feed_title_still_checks_title():
+    sheets = client(ROW[:7])
+    assert sheets.add_sources(RANGE, SOURCES, 'openai ships gpt-5 ', None)
+    assert not client(ROW[:7]).add_sources(RANGE, SOURCES, 'Something else', None)
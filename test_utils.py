@@ -0,0 +1,99 @@
+"""
+Tests for URL canonicalization and the token-bucket rate limiter
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+import utils
+from utils import TokenBucketLimiter, canonicalize_url
+
+
+@pytest.mark.parametrize('url, expected', [
+    ('HTTPS://Example.COM/Path/', 'https://example.com/Path'),
+    ('https://example.com:443/a', 'https://example.com/a'),
+    ('http://example.com:80/a', 'http://example.com/a'),
+    ('https://example.com:8443/a', 'https://example.com:8443/a'),
+    ('https://example.com/a#comments', 'https://example.com/a'),
+    ('https://example.com', 'https://example.com/'),
+    ('https://example.com/a?utm_source=rss&utm_medium=feed', 'https://example.com/a'),
+    ('https://example.com/a?fbclid=x&id=7', 'https://example.com/a?id=7'),
+    ('https://github.com/o/r/blob/x.py?ref=main', 'https://github.com/o/r/blob/x.py?ref=main'),
+    ('https://example.com/#!/story/42', 'https://example.com/#!/story/42'),
+    ('http://[::1]:8080/a', 'http://[::1]:8080/a'),
+    ('http://[2001:DB8::1]/a', 'http://[2001:db8::1]/a'),
+    ('https://x.com:99999/a', 'https://x.com:99999/a'),
+    ('https://example.com/a?b=2&a=1', 'https://example.com/a?a=1&b=2'),
+    ('https://example.com/a?UTM_Campaign=x&q=', 'https://example.com/a?q='),
+    ('  https://example.com/a  ', 'https://example.com/a'),
+    ('', ''),
+])
+def test_canonicalize_url(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+def test_canonical_form_is_stable():
+    url = 'https://Example.com/story/?utm_source=x&page=2#top'
+    assert canonicalize_url(canonicalize_url(url)) == canonicalize_url(url)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(utils.time, 'monotonic', fake)
+    return fake
+
+
+def test_limiter_waits_for_request_budget(clock):
+    limiter = TokenBucketLimiter(requests_per_minute=2, tokens_per_minute=10000)
+    assert limiter.try_acquire(10) == 0
+    assert limiter.try_acquire(10) == 0
+    # One request refills every 30 seconds
+    assert limiter.try_acquire(10) == pytest.approx(30)
+    clock.now += 30
+    assert limiter.try_acquire(10) == 0
+
+
+def test_limiter_waits_for_token_budget(clock):
+    limiter = TokenBucketLimiter(requests_per_minute=100, tokens_per_minute=600)
+    assert limiter.try_acquire(500) == 0
+    # 400 more tokens needed at 10 tokens/second
+    assert limiter.try_acquire(500) == pytest.approx(40)
+    clock.now += 40
+    assert limiter.try_acquire(500) == 0
+
+
+def test_limiter_settle_returns_unused_tokens(clock):
+    limiter = TokenBucketLimiter(requests_per_minute=100, tokens_per_minute=600)
+    assert limiter.try_acquire(600) == 0
+    assert limiter.try_acquire(300) > 0
+    limiter.settle(estimated=600, actual=200)
+    assert limiter.try_acquire(300) == 0
+
+
+def test_limiter_oversized_request_waits_for_full_bucket(clock):
+    limiter = TokenBucketLimiter(requests_per_minute=100, tokens_per_minute=600)
+    assert limiter.try_acquire(100) == 0
+    assert limiter.try_acquire(5000) == pytest.approx(10)
+    clock.now += 10
+    assert limiter.try_acquire(5000) == 0
+
+
+def test_limiter_pause_holds_callers(clock):
+    limiter = TokenBucketLimiter(requests_per_minute=100, tokens_per_minute=600)
+    limiter.pause(5)
+    assert limiter.try_acquire(1) == pytest.approx(5)
+    clock.now += 5
+    assert limiter.try_acquire(1) == 0